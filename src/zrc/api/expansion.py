@@ -0,0 +1,275 @@
+"""
+Inline related resources of a ZAAK with the ``expand`` query parameter.
+
+Expanded resources are loaded with batched prefetches on the (authorization
+filtered) queryset, so the number of queries per page is independent of the
+page size. The ``betrokkeneIdentificatie`` of ROLlen and the
+``objectIdentificatie`` of ZAAKOBJECTen are loaded per type present on the
+page, see :func:`load_polymorphic`.
+"""
+from collections import defaultdict
+from typing import Iterable, List
+
+from django.core.cache import caches
+from django.db.models import Model, Prefetch, QuerySet, prefetch_related_objects
+
+from vng_api_common.constants import RolTypes, ZaakobjectTypes
+
+from zrc.datamodel.models import Rol, Status, Zaak, ZaakInformatieObject, ZaakObject
+
+EXPAND_QUERY_PARAM = "expand"
+
+EXPAND_STATUS = "status"
+EXPAND_RESULTAAT = "resultaat"
+EXPAND_ROLLEN = "rollen"
+EXPAND_ZAAKOBJECTEN = "zaakobjecten"
+EXPAND_ZAAKINFORMATIEOBJECTEN = "zaakinformatieobjecten"
+
+EXPAND_CHOICES = (
+    (EXPAND_STATUS, "status"),
+    (EXPAND_RESULTAAT, "resultaat"),
+    (EXPAND_ROLLEN, "rollen"),
+    (EXPAND_ZAAKOBJECTEN, "zaakobjecten"),
+    (EXPAND_ZAAKINFORMATIEOBJECTEN, "zaakinformatieobjecten"),
+)
+
+# per ``betrokkeneType``, the one-to-one relation of a ROL holding the
+# ``betrokkeneIdentificatie`` and the nested relations it uses
+ROL_BETROKKENE_RELATIONS = {
+    RolTypes.natuurlijk_persoon: (
+        "natuurlijkpersoon",
+        ("verblijfsadres", "sub_verblijf_buitenland"),
+    ),
+    RolTypes.niet_natuurlijk_persoon: (
+        "nietnatuurlijkpersoon",
+        ("sub_verblijf_buitenland",),
+    ),
+    RolTypes.vestiging: ("vestiging", ("verblijfsadres", "sub_verblijf_buitenland")),
+    RolTypes.organisatorische_eenheid: ("organisatorischeeenheid", ()),
+    RolTypes.medewerker: ("medewerker", ()),
+}
+
+# per ``objectType``, the one-to-one relation of a ZAAKOBJECT holding the
+# ``objectIdentificatie`` and the nested relations it uses
+ZAAKOBJECT_OBJECT_RELATIONS = {
+    ZaakobjectTypes.adres: ("adres", ()),
+    ZaakobjectTypes.buurt: ("buurt", ()),
+    ZaakobjectTypes.gemeente: ("gemeente", ()),
+    ZaakobjectTypes.gemeentelijke_openbare_ruimte: ("gemeentelijkeopenbareruimte", ()),
+    ZaakobjectTypes.huishouden: (
+        "huishouden",
+        ("is_gehuisvest_in__adres_aanduiding_grp",),
+    ),
+    ZaakobjectTypes.inrichtingselement: ("inrichtingselement", ()),
+    ZaakobjectTypes.kadastrale_onroerende_zaak: ("kadastraleonroerendezaak", ()),
+    ZaakobjectTypes.kunstwerkdeel: ("kunstwerkdeel", ()),
+    ZaakobjectTypes.maatschappelijke_activiteit: ("maatschappelijkeactiviteit", ()),
+    ZaakobjectTypes.medewerker: ("medewerker", ()),
+    ZaakobjectTypes.natuurlijk_persoon: (
+        "natuurlijkpersoon",
+        ("verblijfsadres", "sub_verblijf_buitenland"),
+    ),
+    ZaakobjectTypes.niet_natuurlijk_persoon: (
+        "nietnatuurlijkpersoon",
+        ("sub_verblijf_buitenland",),
+    ),
+    ZaakobjectTypes.openbare_ruimte: ("openbareruimte", ()),
+    ZaakobjectTypes.organisatorische_eenheid: ("organisatorischeeenheid", ()),
+    ZaakobjectTypes.pand: ("pand", ()),
+    ZaakobjectTypes.spoorbaandeel: ("spoorbaandeel", ()),
+    ZaakobjectTypes.terreindeel: ("terreindeel", ()),
+    ZaakobjectTypes.terrein_gebouwd_object: (
+        "terreingebouwdobject",
+        ("adres_aanduiding_grp",),
+    ),
+    ZaakobjectTypes.vestiging: (
+        "vestiging",
+        ("verblijfsadres", "sub_verblijf_buitenland"),
+    ),
+    ZaakobjectTypes.waterdeel: ("waterdeel", ()),
+    ZaakobjectTypes.wegdeel: ("wegdeel", ()),
+    ZaakobjectTypes.wijk: ("wijk", ()),
+    ZaakobjectTypes.woonplaats: ("woonplaats", ()),
+    ZaakobjectTypes.woz_deelobject: (
+        "wozdeelobject",
+        ("is_onderdeel_van__aanduiding_woz_object",),
+    ),
+    ZaakobjectTypes.woz_object: ("wozobject", ("aanduiding_woz_object",)),
+    ZaakobjectTypes.woz_waarde: ("wozwaarde", ("is_voor__aanduiding_woz_object",)),
+    ZaakobjectTypes.zakelijk_recht: (
+        "zakelijkrecht",
+        (
+            "heeft_betrekking_op",
+            "heeft_als_gerechtigde__natuurlijkpersoon__verblijfsadres",
+            "heeft_als_gerechtigde__natuurlijkpersoon__sub_verblijf_buitenland",
+            "heeft_als_gerechtigde__nietnatuurlijkpersoon__sub_verblijf_buitenland",
+        ),
+    ),
+    ZaakobjectTypes.overige: ("overige", ()),
+}
+
+
+def load_polymorphic(
+    instances: Iterable[Model], discriminator_field: str, relations: dict
+) -> None:
+    """
+    Load the type specific relations of the instances.
+
+    The instances are grouped by the value of the discriminator field, and
+    the relation of each type present is loaded with a single query, including
+    its nested relations.
+    """
+    by_type = defaultdict(list)
+    for instance in instances:
+        by_type[getattr(instance, discriminator_field)].append(instance)
+
+    for value, group in by_type.items():
+        if value not in relations:
+            continue
+
+        relation, nested = relations[value]
+        related_model = group[0]._meta.get_field(relation).related_model
+        prefetch_related_objects(
+            group,
+            Prefetch(relation, queryset=related_model.objects.select_related(*nested)),
+        )
+
+
+def load_rollen(rollen: Iterable[Rol]) -> None:
+    load_polymorphic(rollen, "betrokkene_type", ROL_BETROKKENE_RELATIONS)
+
+
+def load_zaakobjecten(zaakobjecten: Iterable[ZaakObject]) -> None:
+    # a compact ``objectIdentificatie`` is loaded with the ZAAKOBJECT itself
+    load_polymorphic(
+        [
+            zaakobject
+            for zaakobject in zaakobjecten
+            if zaakobject._object_identificatie is None
+        ],
+        "object_type",
+        ZAAKOBJECT_OBJECT_RELATIONS,
+    )
+
+
+def get_zaakinformatieobject_queryset() -> QuerySet:
+    qs = ZaakInformatieObject.objects.all()
+
+    # Do not display ZaakInformatieObjecten that are marked to be deleted
+    marked_zios = caches["drc_sync"].get("zios_marked_for_delete")
+    if marked_zios:
+        qs = qs.exclude(uuid__in=marked_zios)
+    return qs
+
+
+def get_expand_prefetches(expand: List[str]) -> list:
+    """
+    Build the prefetch lookups required to expand the requested resources.
+
+    The current status is always prefetched as part of the base ZAAK
+    queryset, and the resultaat is loaded with ``select_related``.
+    """
+    prefetches = []
+    if EXPAND_ROLLEN in expand:
+        prefetches.append(Prefetch("rol_set", queryset=Rol.objects.order_by("-pk")))
+    if EXPAND_ZAAKOBJECTEN in expand:
+        prefetches.append(
+            Prefetch("zaakobject_set", queryset=ZaakObject.objects.order_by("-pk"))
+        )
+    if EXPAND_ZAAKINFORMATIEOBJECTEN in expand:
+        prefetches.append(
+            Prefetch(
+                "zaakinformatieobject_set",
+                queryset=get_zaakinformatieobject_queryset(),
+            )
+        )
+    return prefetches
+
+
+def load_expanded(zaken: Iterable[Zaak], expand: List[str]) -> None:
+    """
+    Load the type specific relations of the expanded resources of all ZAAKen
+    at once, once the page of ZAAKen is fetched.
+    """
+    if EXPAND_ROLLEN in expand:
+        load_rollen([rol for zaak in zaken for rol in zaak.rol_set.all()])
+    if EXPAND_ZAAKOBJECTEN in expand:
+        load_zaakobjecten(
+            [zaakobject for zaak in zaken for zaakobject in zaak.zaakobject_set.all()]
+        )
+
+
+def with_zaak_related(queryset: QuerySet) -> QuerySet:
+    """
+    Load the relations needed to serialize a page of ZAAKen in bulk.
+    """
+    return queryset.select_related("hoofdzaak", "resultaat").prefetch_related(
+        Prefetch("status_set", queryset=Status.objects.order_by("-datum_status_gezet")),
+        "deelzaken",
+        "relevante_andere_zaken",
+        "zaakeigenschap_set",
+        "zaakkenmerk_set",
+    )
+
+
+class ExpandMixin:
+    """
+    Support the ``expand`` query parameter on the list and retrieve actions.
+
+    Must be placed before
+    :class:`zrc.api.data_filtering.ListFilterByAuthorizationsMixin` so that
+    the prefetches are applied to the authorization filtered queryset.
+    """
+
+    expand_actions = ("list", "retrieve")
+
+    def get_expand(self) -> List[str]:
+        # drf-yasg introspection does not provide a (real) request
+        if getattr(self, "request", None) is None:
+            return []
+
+        if self.action not in self.expand_actions:
+            return []
+
+        value = self.request.query_params.get(EXPAND_QUERY_PARAM)
+        if not value:
+            return []
+
+        # invalid values are rejected by the filterset
+        known = dict(EXPAND_CHOICES)
+        return [name for name in value.split(",") if name in known]
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action not in self.expand_actions + ("_zoek",):
+            return qs
+
+        qs = with_zaak_related(qs)
+        expand = self.get_expand()
+        if expand:
+            qs = qs.prefetch_related(*get_expand_prefetches(expand))
+        return qs
+
+    def get_serializer(self, *args, **kwargs):
+        expand = self.get_expand()
+        if args and expand:
+            load_expanded(args[0] if kwargs.get("many") else [args[0]], expand)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context[EXPAND_QUERY_PARAM] = self.get_expand()
+        return context
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        # the ETag only covers the ZAAK itself, not the expanded resources
+        if self.get_expand():
+            request._request.META.pop("HTTP_IF_NONE_MATCH", None)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.get_expand() and response.has_header("ETag"):
+            del response["ETag"]
+        return response
@@ -3,7 +3,9 @@ from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_field_attribute, get_help_text
 
+from zrc.datamodel.constants import BetrokkeneIdentificatie
 from zrc.datamodel.models import (
+    BetrokkeneIndex,
     KlantContact,
     Resultaat,
     Rol,
@@ -12,9 +14,12 @@ from zrc.datamodel.models import (
     ZaakContactMoment,
     ZaakInformatieObject,
     ZaakObject,
+    ZaakSummary,
     ZaakVerzoek,
 )
 
+from .expansion import EXPAND_CHOICES
+
 
 class MaximaleVertrouwelijkheidaanduidingFilter(filters.ChoiceFilter):
     def __init__(self, *args, **kwargs):
@@ -37,6 +42,45 @@ class MaximaleVertrouwelijkheidaanduidingFilter(filters.ChoiceFilter):
         return super().filter(qs, numeric_value)
 
 
+class ExpandFilter(filters.BaseCSVFilter, filters.ChoiceFilter):
+    """
+    Validate the requested expansions - the actual expansion is done in the
+    viewset, the queryset itself is not filtered.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("choices", EXPAND_CHOICES)
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        return qs
+
+
+class BetrokkeneIdentificatieFilter(filters.CharFilter):
+    """
+    Filter on the ``betrokkeneIdentificatie`` of ROLlen.
+
+    Filtering on the betrokkene tables joins them (and for ZAAKen the ROLlen),
+    returning a ZAAK once for every matching ROL. Instead, the objects are
+    selected with a subquery on the denormalised
+    :class:`zrc.datamodel.models.BetrokkeneIndex`, a single index scan.
+    """
+
+    def __init__(self, *args, identificatie_type: str, index_field: str, **kwargs):
+        self.identificatie_type = identificatie_type
+        self.index_field = index_field
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in filters.EMPTY_VALUES:
+            return qs
+
+        entries = BetrokkeneIndex.objects.filter(
+            identificatie_type=self.identificatie_type, identificatie=value
+        ).values(f"{self.index_field}_id")
+        return qs.filter(pk__in=entries)
+
+
 class ZaakFilter(FilterSet):
     maximale_vertrouwelijkheidaanduiding = MaximaleVertrouwelijkheidaanduidingFilter(
         field_name="vertrouwelijkheidaanduiding",
@@ -46,29 +90,47 @@ class ZaakFilter(FilterSet):
         ),
     )
 
-    rol__betrokkene_identificatie__natuurlijk_persoon__inp_bsn = filters.CharFilter(
-        field_name="rol__natuurlijkpersoon__inp_bsn",
-        help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_bsn"),
-        max_length=get_field_attribute(
-            "datamodel.NatuurlijkPersoon", "inp_bsn", "max_length"
-        ),
+    rol__betrokkene_identificatie__natuurlijk_persoon__inp_bsn = (
+        BetrokkeneIdentificatieFilter(
+            field_name="rol__natuurlijkpersoon__inp_bsn",
+            identificatie_type=BetrokkeneIdentificatie.inp_bsn,
+            index_field="zaak",
+            help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_bsn"),
+            max_length=get_field_attribute(
+                "datamodel.NatuurlijkPersoon", "inp_bsn", "max_length"
+            ),
+        )
     )
-    rol__betrokkene_identificatie__medewerker__identificatie = filters.CharFilter(
-        field_name="rol__medewerker__identificatie",
-        help_text=get_help_text("datamodel.Medewerker", "identificatie"),
-        max_length=get_field_attribute(
-            "datamodel.Medewerker", "identificatie", "max_length"
-        ),
+    rol__betrokkene_identificatie__medewerker__identificatie = (
+        BetrokkeneIdentificatieFilter(
+            field_name="rol__medewerker__identificatie",
+            identificatie_type=BetrokkeneIdentificatie.medewerker,
+            index_field="zaak",
+            help_text=get_help_text("datamodel.Medewerker", "identificatie"),
+            max_length=get_field_attribute(
+                "datamodel.Medewerker", "identificatie", "max_length"
+            ),
+        )
     )
     rol__betrokkene_identificatie__organisatorische_eenheid__identificatie = (
-        filters.CharFilter(
+        BetrokkeneIdentificatieFilter(
             field_name="rol__organisatorischeeenheid__identificatie",
+            identificatie_type=BetrokkeneIdentificatie.organisatorische_eenheid,
+            index_field="zaak",
             help_text=get_help_text(
                 "datamodel.OrganisatorischeEenheid", "identificatie"
             ),
         )
     )
 
+    expand = ExpandFilter(
+        help_text=(
+            "Haal details van gelinkte resources direct op. Meerdere waarden "
+            "kunnen met komma's gescheiden worden, bijvoorbeeld "
+            "`status,resultaat`."
+        ),
+    )
+
     class Meta:
         model = Zaak
         fields = {
@@ -87,46 +149,70 @@ class ZaakFilter(FilterSet):
 
 
 class RolFilter(FilterSet):
-    betrokkene_identificatie__natuurlijk_persoon__inp_bsn = filters.CharFilter(
-        field_name="natuurlijkpersoon__inp_bsn",
-        help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_bsn"),
+    betrokkene_identificatie__natuurlijk_persoon__inp_bsn = (
+        BetrokkeneIdentificatieFilter(
+            field_name="natuurlijkpersoon__inp_bsn",
+            identificatie_type=BetrokkeneIdentificatie.inp_bsn,
+            index_field="rol",
+            help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_bsn"),
+        )
     )
     betrokkene_identificatie__natuurlijk_persoon__anp_identificatie = (
-        filters.CharFilter(
+        BetrokkeneIdentificatieFilter(
             field_name="natuurlijkpersoon__anp_identificatie",
+            identificatie_type=BetrokkeneIdentificatie.anp_identificatie,
+            index_field="rol",
             help_text=get_help_text("datamodel.NatuurlijkPersoon", "anp_identificatie"),
         )
     )
-    betrokkene_identificatie__natuurlijk_persoon__inp_a_nummer = filters.CharFilter(
-        field_name="natuurlijkpersoon__inp_a_nummer",
-        help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_a_nummer"),
+    betrokkene_identificatie__natuurlijk_persoon__inp_a_nummer = (
+        BetrokkeneIdentificatieFilter(
+            field_name="natuurlijkpersoon__inp_a_nummer",
+            identificatie_type=BetrokkeneIdentificatie.inp_a_nummer,
+            index_field="rol",
+            help_text=get_help_text("datamodel.NatuurlijkPersoon", "inp_a_nummer"),
+        )
     )
-    betrokkene_identificatie__niet_natuurlijk_persoon__inn_nnp_id = filters.CharFilter(
-        field_name="nietnatuurlijkpersoon__inn_nnp_id",
-        help_text=get_help_text("datamodel.NietNatuurlijkPersoon", "inn_nnp_id"),
+    betrokkene_identificatie__niet_natuurlijk_persoon__inn_nnp_id = (
+        BetrokkeneIdentificatieFilter(
+            field_name="nietnatuurlijkpersoon__inn_nnp_id",
+            identificatie_type=BetrokkeneIdentificatie.inn_nnp_id,
+            index_field="rol",
+            help_text=get_help_text("datamodel.NietNatuurlijkPersoon", "inn_nnp_id"),
+        )
     )
     betrokkene_identificatie__niet_natuurlijk_persoon__ann_identificatie = (
-        filters.CharFilter(
+        BetrokkeneIdentificatieFilter(
             field_name="nietnatuurlijkpersoon__ann_identificatie",
+            identificatie_type=BetrokkeneIdentificatie.ann_identificatie,
+            index_field="rol",
             help_text=get_help_text(
                 "datamodel.NietNatuurlijkPersoon", "ann_identificatie"
             ),
         )
     )
-    betrokkene_identificatie__vestiging__vestigings_nummer = filters.CharFilter(
-        field_name="vestiging__vestigings_nummer",
-        help_text=get_help_text("datamodel.Vestiging", "vestigings_nummer"),
+    betrokkene_identificatie__vestiging__vestigings_nummer = (
+        BetrokkeneIdentificatieFilter(
+            field_name="vestiging__vestigings_nummer",
+            identificatie_type=BetrokkeneIdentificatie.vestigings_nummer,
+            index_field="rol",
+            help_text=get_help_text("datamodel.Vestiging", "vestigings_nummer"),
+        )
     )
     betrokkene_identificatie__organisatorische_eenheid__identificatie = (
-        filters.CharFilter(
+        BetrokkeneIdentificatieFilter(
             field_name="organisatorischeeenheid__identificatie",
+            identificatie_type=BetrokkeneIdentificatie.organisatorische_eenheid,
+            index_field="rol",
             help_text=get_help_text(
                 "datamodel.OrganisatorischeEenheid", "identificatie"
             ),
         )
     )
-    betrokkene_identificatie__medewerker__identificatie = filters.CharFilter(
+    betrokkene_identificatie__medewerker__identificatie = BetrokkeneIdentificatieFilter(
         field_name="medewerker__identificatie",
+        identificatie_type=BetrokkeneIdentificatie.medewerker,
+        index_field="rol",
         help_text=get_help_text("datamodel.Medewerker", "identificatie"),
     )
 
@@ -190,3 +276,24 @@ class ZaakVerzoekFilter(FilterSet):
     class Meta:
         model = ZaakVerzoek
         fields = ("zaak", "verzoek")
+
+
+class ZaakSummaryFilter(FilterSet):
+    zaaktype = filters.CharFilter(
+        field_name="zaak__zaaktype",
+        help_text=get_help_text("datamodel.Zaak", "zaaktype"),
+    )
+    bronorganisatie = filters.CharFilter(
+        field_name="zaak__bronorganisatie",
+        help_text=get_help_text("datamodel.Zaak", "bronorganisatie"),
+    )
+
+    class Meta:
+        model = ZaakSummary
+        fields = {
+            "statustype": ["exact"],
+            "resultaattype": ["exact"],
+            "initiator_bsn": ["exact"],
+            "behandelaar_identificatie": ["exact"],
+            "datum_status_gezet": ["gt", "gte", "lt", "lte"],
+        }
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from datetime import date
+
+from django.core import signing
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.serializers import ValidationError
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+CURSOR_SALT = "zrc.api.pagination.archiefactiedatum"
+
+
+class ArchiefactiedatumPagination(BasePagination):
+    """
+    Keyset pagination of ZAAKen ordered by archiefactiedatum.
+
+    The cursor holds the archiefactiedatum and pk of the last ZAAK of the page,
+    the next page starts right after it. Unlike page numbers, which skip all the
+    ZAAKen before the page, this walks the index from the cursor onwards.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        queryset = queryset.order_by("archiefactiedatum", "pk")
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            try:
+                archiefactiedatum, pk = self.decode_cursor(cursor)
+            except (signing.BadSignature, ValueError):
+                raise ValidationError(
+                    {self.cursor_query_param: _("Ongeldige cursor.")},
+                    code="invalid-cursor",
+                )
+            queryset = queryset.filter(
+                archiefactiedatum__gte=archiefactiedatum
+            ).exclude(archiefactiedatum=archiefactiedatum, pk__lte=pk)
+
+        page = list(queryset[: self.page_size + 1])
+        self.next_cursor = (
+            self.encode_cursor(page[self.page_size - 1])
+            if len(page) > self.page_size
+            else None
+        )
+        return page[: self.page_size]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    @staticmethod
+    def encode_cursor(zaak) -> str:
+        return signing.dumps(
+            [zaak.archiefactiedatum.isoformat(), zaak.pk], salt=CURSOR_SALT
+        )
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple:
+        """
+        :raises: :class:`django.core.signing.BadSignature` for invalid cursors
+        """
+        archiefactiedatum, pk = signing.loads(cursor, salt=CURSOR_SALT)
+        return date.fromisoformat(archiefactiedatum), int(pk)
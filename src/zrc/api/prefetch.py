@@ -0,0 +1,199 @@
+"""
+Concurrent remote validation.
+
+The URL fields of a resource are validated one after another by
+:class:`vng_api_common.validators.URLValidator` (and its subclasses), which
+each wait for a response of the ZTC, DRC, ... in turn. Serializers using
+:class:`ConcurrentValidationMixin` fetch all these URLs at once before the
+validation runs. The validators then receive the prefetched responses through
+:func:`fetch_link`, the configured ``LINK_FETCHER``.
+
+The validators which need the remote object itself use
+:func:`get_remote_object`, so that a ROLTYPE for example is only retrieved once
+per validation. Related resources retrieved during validation, such as the
+INFORMATIEOBJECTen of a ZAAK, are retrieved concurrently with
+:func:`retrieve_concurrently`.
+
+With ``CATALOGUS_MIRROR_ENABLED``, links to mirrored Catalogi API resources are
+answered from :class:`zrc.datamodel.models.CatalogusObject` instead.
+"""
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Mapping, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+import requests
+from rest_framework.fields import empty
+from vng_api_common.validators import URLValidator
+
+from zrc.datamodel.models import CatalogusObject
+from zrc.utils.client import get_client, get_session
+
+_local = threading.local()
+
+
+def _get(url: str, **kwargs) -> requests.Response:
+    split_url = urlsplit(url)
+    session = get_session(urlunsplit(split_url[:2] + ("", "", "")))
+    return session.get(url, **kwargs)
+
+
+def _mirrored_response(url: str, data: dict) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(data).encode("utf-8")
+    return response
+
+
+def _get_mirrored(urls: List[str]) -> Dict[str, tuple]:
+    if not settings.CATALOGUS_MIRROR_ENABLED or not urls:
+        return {}
+    return {
+        url: (_mirrored_response(url, data), None)
+        for url, data in CatalogusObject.objects.get_many(urls).items()
+    }
+
+
+def fetch_link(url: str, **kwargs) -> requests.Response:
+    """
+    Return the prefetched or mirrored response for the URL, or fetch it.
+    """
+    prefetched = getattr(_local, "responses", None) or {}
+    if url not in prefetched:
+        prefetched = _get_mirrored([url])
+    if url in prefetched:
+        response, exc = prefetched[url]
+        if exc is not None:
+            raise exc
+        return response
+    return _get(url, **kwargs)
+
+
+def _fetch_links(links: List[Tuple[str, dict]]) -> Dict[str, tuple]:
+    def fetch(link):
+        url, kwargs = link
+        try:
+            return _get(url, **kwargs), None
+        except Exception as exc:
+            return None, exc
+
+    if len(links) < 2:
+        return {url: fetch((url, kwargs)) for url, kwargs in links}
+
+    workers = min(len(links), settings.REMOTE_VALIDATION_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch, links)
+        return {url: result for (url, _), result in zip(links, results)}
+
+
+@contextmanager
+def prefetched_links(links: List[Tuple[str, dict]]):
+    """
+    Fetch the links concurrently, and keep the retrieved remote objects, for
+    the duration of the block.
+    """
+    responses = {}
+    # the validators only use the prefetched responses through fetch_link
+    if links and import_string(settings.LINK_FETCHER) is fetch_link:
+        # the mirror is read in this thread, the workers don't use the database
+        responses = _get_mirrored([url for url, _ in links])
+        responses.update(
+            _fetch_links([link for link in links if link[0] not in responses])
+        )
+
+    previous = (getattr(_local, "responses", None), getattr(_local, "objects", None))
+    _local.responses = {**(previous[0] or {}), **responses}
+    _local.objects = previous[1] if previous[1] is not None else {}
+    try:
+        yield
+    finally:
+        _local.responses, _local.objects = previous
+
+
+def get_remote_object(url: str, retrieve: Callable[[], dict]) -> dict:
+    """
+    Return the remote object, retrieving it at most once per validation.
+
+    A prefetched response for the URL is used if there is one.
+    """
+    objects = getattr(_local, "objects", None)
+    if objects is None:
+        return retrieve()
+
+    if url not in objects:
+        response, exc = (getattr(_local, "responses", None) or {}).get(
+            url, (None, None)
+        )
+        if response is not None and response.status_code == 200:
+            objects[url] = response.json()
+        else:
+            objects[url] = retrieve()
+    return objects[url]
+
+
+def get_validated_links(serializer, data) -> List[Tuple[str, dict]]:
+    """
+    Collect the URLs in the data which will be validated by a
+    :class:`vng_api_common.validators.URLValidator`, with the arguments of
+    the request the validator makes.
+    """
+    if not isinstance(data, Mapping):
+        return []
+
+    links: Dict[str, dict] = {}
+    for field in serializer._writable_fields:
+        value = field.get_value(data)
+        if value is empty or not isinstance(value, str) or not value:
+            continue
+
+        for validator in field.validators:
+            if not isinstance(validator, URLValidator):
+                continue
+
+            kwargs = validator.extra.copy()
+            if validator.get_auth:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    **validator.get_auth(value),
+                }
+            links.setdefault(value, kwargs)
+    return list(links.items())
+
+
+class ConcurrentValidationMixin:
+    def get_prefetch_links(self, data) -> List[Tuple[str, dict]]:
+        """
+        Return the links to fetch concurrently before validating ``data``.
+        """
+        return get_validated_links(self, data)
+
+    def run_validation(self, data=empty):
+        links = self.get_prefetch_links(data)
+        with prefetched_links(links):
+            return super().run_validation(data)
+
+
+def retrieve_concurrently(
+    urls: List[str], retrieve: Callable, scopes: List[str] = None
+) -> list:
+    """
+    Call ``retrieve(client, url)`` for the URLs concurrently.
+
+    :return: the results, in the order of the URLs
+    """
+    # the clients are set up in this thread, since the credentials come
+    # from the database
+    clients = [get_client(url, scopes=scopes) for url in urls]
+    if len(urls) < 2:
+        return [retrieve(client, url) for client, url in zip(clients, urls)]
+
+    workers = min(len(urls), settings.REMOTE_VALIDATION_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(retrieve, clients, urls))
@@ -1,4 +1,5 @@
 from .address import *  # noqa
 from .betrokkene import *  # noqa
 from .core import *  # noqa
+from .summary import *  # noqa
 from .zaakobjecten import *  # noqa
@@ -0,0 +1,73 @@
+"""
+Serializers building their field tree once per class.
+
+DRF builds the fields of every serializer instance from scratch: the model is
+introspected, the declared fields are deep copied and nested serializers run
+their ``__init__`` again. The polymorphic serializers are instantiated for
+every request, and for every ZAAK when its ROLlen or ZAAKOBJECTen are expanded.
+
+:class:`CachedFieldsMixin` builds the fields once and hands every serializer
+instance shallow copies, bound to the instance.
+"""
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from rest_framework.fields import Field
+from rest_framework.serializers import Serializer
+from rest_framework.utils.serializer_helpers import BindingDict
+
+
+def copy_field(field: Field) -> Field:
+    """
+    Copy the field, with copies of its nested fields bound to the copy.
+
+    The configuration of the field (validators, choices, querysets...) is
+    shared with the original, which must not be used itself.
+    """
+    # copy.copy without the pickle protocol, this is the hot path
+    clone = object.__new__(type(field))
+    clone.__dict__.update(field.__dict__)
+    if isinstance(field, Serializer):
+        fields = BindingDict(clone)
+        for name, nested in field.fields.items():
+            # already bound to the same name, only the parent differs
+            fields.fields[name] = _copy_nested(nested, clone)
+        clone.__dict__["fields"] = fields
+
+    # fields of ListSerializer, ListField and ManyRelatedField
+    for attr in ("child", "child_relation"):
+        nested = getattr(field, attr, None)
+        if isinstance(nested, Field):
+            setattr(clone, attr, _copy_nested(nested, clone))
+    return clone
+
+
+def _copy_nested(field: Field, parent: Field) -> Field:
+    clone = copy_field(field)
+    clone.parent = parent
+    return clone
+
+
+class CachedFieldsMixin:
+    """
+    Build the fields of the serializer once per serializer class.
+
+    Override :meth:`build_fields` instead of :meth:`get_fields` to change the
+    fields, the result is shared by all instances of the serializer.
+    """
+
+    _field_prototypes: Dict[type, Mapping[str, Field]] = {}
+
+    def build_fields(self) -> Dict[str, Field]:
+        return super().get_fields()
+
+    def get_fields(self) -> Dict[str, Field]:
+        prototypes = self._field_prototypes.get(type(self))
+        if prototypes is None:
+            prototypes = MappingProxyType(self.build_fields())
+            self._field_prototypes[type(self)] = prototypes
+
+        return OrderedDict(
+            (name, copy_field(field)) for name, field in prototypes.items()
+        )
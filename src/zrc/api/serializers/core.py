@@ -1,9 +1,10 @@
 import logging
+from collections.abc import Mapping
 
 from django.conf import settings
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Manager
 from django.utils.encoding import force_text
-from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 import requests
@@ -22,7 +23,6 @@ from vng_api_common.constants import (
     RolTypes,
     ZaakobjectTypes,
 )
-from vng_api_common.models import APICredential
 from vng_api_common.polymorphism import Discriminator, PolymorphicSerializer
 from vng_api_common.serializers import (
     GegevensGroepSerializer,
@@ -40,12 +40,15 @@ from vng_api_common.validators import (
 from zrc.datamodel.constants import (
     AardZaakRelatie,
     BetalingsIndicatie,
+    CatalogusResource,
     IndicatieMachtiging,
 )
 from zrc.datamodel.models import (
+    CatalogusObject,
     KlantContact,
     RelevanteZaakRelatie,
     Resultaat,
+    ResultaatTypeArchiefregel,
     Rol,
     Status,
     Zaak,
@@ -56,12 +59,24 @@ from zrc.datamodel.models import (
     ZaakKenmerk,
     ZaakObject,
 )
-from zrc.datamodel.models.core import ZaakVerzoek
+from zrc.datamodel.models.core import UNIQUE_ROL_CONSTRAINT, ZaakVerzoek
 from zrc.datamodel.utils import BrondatumCalculator
 from zrc.sync.signals import SyncError
+from zrc.utils.client import get_client
 from zrc.utils.exceptions import DetermineProcessEndDateException
 
 from ..auth import get_auth
+from ..expansion import (
+    EXPAND_QUERY_PARAM,
+    EXPAND_RESULTAAT,
+    EXPAND_ROLLEN,
+    EXPAND_STATUS,
+    EXPAND_ZAAKINFORMATIEOBJECTEN,
+    EXPAND_ZAAKOBJECTEN,
+    load_rollen,
+    load_zaakobjecten,
+)
+from ..prefetch import ConcurrentValidationMixin, retrieve_concurrently
 from ..validators import (
     CorrectZaaktypeValidator,
     DateNotInFutureValidator,
@@ -71,6 +86,7 @@ from ..validators import (
     RolOccurenceValidator,
     UniekeIdentificatieValidator,
     ZaaktypeInformatieobjecttypeRelationValidator,
+    fetch_object,
 )
 from .address import ObjectAdresSerializer
 from .betrokkene import (
@@ -80,6 +96,7 @@ from .betrokkene import (
     RolOrganisatorischeEenheidSerializer,
     RolVestigingSerializer,
 )
+from .cached import CachedFieldsMixin
 from .zaakobjecten import (
     ObjectBuurtSerializer,
     ObjectGemeentelijkeOpenbareRuimteSerializer,
@@ -157,6 +174,7 @@ class RelevanteZaakSerializer(serializers.ModelSerializer):
 
 
 class ZaakSerializer(
+    ConcurrentValidationMixin,
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
@@ -342,15 +360,58 @@ class ZaakSerializer(
         value_display_mapping = add_choice_values_help_text(Archiefnominatie)
         self.fields["archiefnominatie"].help_text += f"\n\n{value_display_mapping}"
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+
+        expand = self.context.get(EXPAND_QUERY_PARAM)
+        if expand:
+            data[EXPAND_QUERY_PARAM] = self._get_expanded(instance, expand)
+        return data
+
+    def _get_expanded(self, instance: Zaak, expand: list) -> dict:
+        """
+        Serialize the requested related resources inline.
+
+        The related objects are expected to be prefetched by the viewset.
+        """
+        expanded = {}
+        if EXPAND_STATUS in expand:
+            status = instance.current_status
+            expanded[EXPAND_STATUS] = (
+                StatusSerializer(status, context=self.context).data if status else None
+            )
+        if EXPAND_RESULTAAT in expand:
+            resultaat = getattr(instance, "resultaat", None)
+            expanded[EXPAND_RESULTAAT] = (
+                ResultaatSerializer(resultaat, context=self.context).data
+                if resultaat
+                else None
+            )
+        if EXPAND_ROLLEN in expand:
+            expanded[EXPAND_ROLLEN] = RolSerializer(
+                instance.rol_set.all(), many=True, context=self.context
+            ).data
+        if EXPAND_ZAAKOBJECTEN in expand:
+            expanded[EXPAND_ZAAKOBJECTEN] = ZaakObjectSerializer(
+                instance.zaakobject_set.all(), many=True, context=self.context
+            ).data
+        if EXPAND_ZAAKINFORMATIEOBJECTEN in expand:
+            expanded[EXPAND_ZAAKINFORMATIEOBJECTEN] = ZaakInformatieObjectSerializer(
+                instance.zaakinformatieobject_set.all(),
+                many=True,
+                context=self.context,
+            ).data
+        return expanded
+
     def _get_zaaktype(self, zaaktype_url: str) -> dict:
         if not hasattr(self, "_zaaktype"):
             # dynamic so that it can be mocked in tests easily
-            Client = import_string(settings.ZDS_CLIENT_CLASS)
-            client = Client.from_url(zaaktype_url)
-            client.auth = APICredential.get_auth(
-                zaaktype_url, scopes=["zds.scopes.zaaktypes.lezen"]
+            client = get_client(zaaktype_url, scopes=["zds.scopes.zaaktypes.lezen"])
+            self._zaaktype = CatalogusObject.objects.get_or_retrieve(
+                CatalogusResource.zaaktype,
+                zaaktype_url,
+                lambda: client.request(zaaktype_url, "zaaktype"),
             )
-            self._zaaktype = client.request(zaaktype_url, "zaaktype")
         return self._zaaktype
 
     def _get_information_objects(self) -> list:
@@ -358,19 +419,16 @@ class ZaakSerializer(
             self._information_objects = []
 
             if self.instance:
-                Client = import_string(settings.ZDS_CLIENT_CLASS)
-
-                zios = self.instance.zaakinformatieobject_set.all()
-                for zio in zios:
-                    io_url = zio.informatieobject
-                    client = Client.from_url(io_url)
-                    client.auth = APICredential.get_auth(
-                        io_url, scopes=["scopes.documenten.lezen"]
-                    )
-                    informatieobject = client.request(
-                        io_url, "enkelvoudiginformatieobject"
-                    )
-                    self._information_objects.append(informatieobject)
+                io_urls = self.instance.zaakinformatieobject_set.values_list(
+                    "informatieobject", flat=True
+                )
+                self._information_objects = retrieve_concurrently(
+                    list(io_urls),
+                    lambda client, url: client.request(
+                        url, "enkelvoudiginformatieobject"
+                    ),
+                    scopes=["scopes.documenten.lezen"],
+                )
 
         return self._information_objects
 
@@ -488,7 +546,9 @@ class ZaakZoekSerializer(serializers.Serializer):
         return validated_attrs
 
 
-class StatusSerializer(serializers.HyperlinkedModelSerializer):
+class StatusSerializer(
+    ConcurrentValidationMixin, serializers.HyperlinkedModelSerializer
+):
     class Meta:
         model = Status
         fields = (
@@ -524,14 +584,14 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         statustype_url = validated_attrs["statustype"]
 
         # dynamic so that it can be mocked in tests easily
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(statustype_url)
-        client.auth = APICredential.get_auth(
-            statustype_url, scopes=["zds.scopes.zaaktypes.lezen"]
-        )
+        client = get_client(statustype_url, scopes=["zds.scopes.zaaktypes.lezen"])
 
         try:
-            statustype = client.retrieve("statustype", url=statustype_url)
+            statustype = CatalogusObject.objects.get_or_retrieve(
+                CatalogusResource.statustype,
+                statustype_url,
+                lambda: client.retrieve("statustype", url=statustype_url),
+            )
             validated_attrs["__is_eindstatus"] = statustype["isEindstatus"]
         except requests.HTTPError as exc:
             raise serializers.ValidationError(
@@ -546,16 +606,17 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         # and are unlocked
         if validated_attrs["__is_eindstatus"]:
             zaak = validated_attrs["zaak"]
-            zios = zaak.zaakinformatieobject_set.all()
-            for zio in zios:
-                io_url = zio.informatieobject
-                client = Client.from_url(io_url)
-                client.auth = APICredential.get_auth(
-                    io_url, scopes=["zds.scopes.zaaktypes.lezen"]
-                )
-                informatieobject = client.retrieve(
-                    "enkelvoudiginformatieobject", url=io_url
-                )
+            io_urls = zaak.zaakinformatieobject_set.values_list(
+                "informatieobject", flat=True
+            )
+            informatieobjecten = retrieve_concurrently(
+                list(io_urls),
+                lambda client, url: client.retrieve(
+                    "enkelvoudiginformatieobject", url=url
+                ),
+                scopes=["zds.scopes.zaaktypes.lezen"],
+            )
+            for informatieobject in informatieobjecten:
                 if informatieobject["locked"]:
                     raise serializers.ValidationError(
                         "Er zijn gerelateerde informatieobjecten die nog gelocked zijn."
@@ -646,7 +707,16 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         return obj
 
 
-class ZaakObjectSerializer(PolymorphicSerializer):
+class ZaakObjectListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        zaakobjecten = list(data.all() if isinstance(data, Manager) else data)
+        load_zaakobjecten(zaakobjecten)
+        return super().to_representation(zaakobjecten)
+
+
+class ZaakObjectSerializer(
+    CachedFieldsMixin, ConcurrentValidationMixin, PolymorphicSerializer
+):
     discriminator = Discriminator(
         discriminator_field="object_type",
         mapping={
@@ -688,6 +758,7 @@ class ZaakObjectSerializer(PolymorphicSerializer):
 
     class Meta:
         model = ZaakObject
+        list_serializer_class = ZaakObjectListSerializer
         fields = (
             "url",
             "uuid",
@@ -707,11 +778,12 @@ class ZaakObjectSerializer(PolymorphicSerializer):
             },
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def build_fields(self):
+        fields = super().build_fields()
 
         value_display_mapping = add_choice_values_help_text(ZaakobjectTypes)
-        self.fields["object_type"].help_text += f"\n\n{value_display_mapping}"
+        fields["object_type"].help_text += f"\n\n{value_display_mapping}"
+        return fields
 
     def validate(self, attrs):
         validated_attrs = super().validate(attrs)
@@ -750,6 +822,12 @@ class ZaakObjectSerializer(PolymorphicSerializer):
     @transaction.atomic
     def create(self, validated_data):
         group_data = validated_data.pop("object_identificatie", None)
+        if group_data and ZaakObject.is_compact(validated_data["object_type"]):
+            validated_data["_object_identificatie"] = group_data
+            zaakobject = super().create(validated_data)
+            zaakobject.set_object_identificatie(group_data)
+            return zaakobject
+
         zaakobject = super().create(validated_data)
 
         if group_data:
@@ -761,7 +839,9 @@ class ZaakObjectSerializer(PolymorphicSerializer):
         return zaakobject
 
 
-class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakInformatieObjectSerializer(
+    ConcurrentValidationMixin, serializers.HyperlinkedModelSerializer
+):
     aard_relatie_weergave = serializers.ChoiceField(
         source="get_aard_relatie_display",
         read_only=True,
@@ -803,6 +883,19 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
             "zaak": {"lookup_field": "uuid", "validators": [IsImmutableValidator()]},
         }
 
+    def get_prefetch_links(self, data):
+        links = super().get_prefetch_links(data)
+        if self.instance is not None or not isinstance(data, Mapping):
+            return links
+
+        # the zaaktype is needed for ZaaktypeInformatieobjecttypeRelationValidator,
+        # fetch it together with the informatieobject
+        try:
+            zaak = self.fields["zaak"].to_internal_value(data.get("zaak"))
+        except serializers.ValidationError:
+            return links
+        return links + [(zaak.zaaktype, {"headers": get_auth(zaak.zaaktype)})]
+
     def save(self, **kwargs):
         # can't slap a transaction atomic on this, since DRC queries for the
         # relation!
@@ -844,12 +937,14 @@ class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
         if not hasattr(self, "_eigenschap"):
             self._eigenschap = None
             if eigenschap_url:
-                Client = import_string(settings.ZDS_CLIENT_CLASS)
-                client = Client.from_url(eigenschap_url)
-                client.auth = APICredential.get_auth(
+                client = get_client(
                     eigenschap_url, scopes=["zds.scopes.zaaktypes.lezen"]
                 )
-                self._eigenschap = client.request(eigenschap_url, "eigenschap")
+                self._eigenschap = CatalogusObject.objects.get_or_retrieve(
+                    CatalogusResource.eigenschap,
+                    eigenschap_url,
+                    lambda: client.request(eigenschap_url, "eigenschap"),
+                )
         return self._eigenschap
 
     def validate(self, attrs):
@@ -883,7 +978,16 @@ class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
         }
 
 
-class RolSerializer(PolymorphicSerializer):
+class RolListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        rollen = list(data.all() if isinstance(data, Manager) else data)
+        load_rollen(rollen)
+        return super().to_representation(rollen)
+
+
+class RolSerializer(
+    CachedFieldsMixin, ConcurrentValidationMixin, PolymorphicSerializer
+):
     discriminator = Discriminator(
         discriminator_field="betrokkene_type",
         mapping={
@@ -899,6 +1003,7 @@ class RolSerializer(PolymorphicSerializer):
 
     class Meta:
         model = Rol
+        list_serializer_class = RolListSerializer
         fields = (
             "url",
             "uuid",
@@ -932,17 +1037,18 @@ class RolSerializer(PolymorphicSerializer):
             },
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def build_fields(self):
+        fields = super().build_fields()
 
         value_display_mapping = add_choice_values_help_text(IndicatieMachtiging)
-        self.fields["indicatie_machtiging"].help_text += f"\n\n{value_display_mapping}"
+        fields["indicatie_machtiging"].help_text += f"\n\n{value_display_mapping}"
 
         value_display_mapping = add_choice_values_help_text(RolTypes)
-        self.fields["betrokkene_type"].help_text += f"\n\n{value_display_mapping}"
+        fields["betrokkene_type"].help_text += f"\n\n{value_display_mapping}"
 
         value_display_mapping = add_choice_values_help_text(RolOmschrijving)
-        self.fields["omschrijving_generiek"].help_text += f"\n\n{value_display_mapping}"
+        fields["omschrijving_generiek"].help_text += f"\n\n{value_display_mapping}"
+        return fields
 
     def validate(self, attrs):
         validated_attrs = super().validate(attrs)
@@ -955,12 +1061,31 @@ class RolSerializer(PolymorphicSerializer):
                 code="invalid-betrokkene",
             )
 
+        # the roltype was already retrieved by the validators, pass the derived
+        # attributes on so that Rol.save doesn't retrieve it again
+        if "roltype" in validated_attrs:
+            roltype = fetch_object("roltype", validated_attrs["roltype"])
+            validated_attrs["omschrijving"] = roltype["omschrijving"]
+            validated_attrs["omschrijving_generiek"] = roltype["omschrijvingGeneriek"]
+
         return validated_attrs
 
     @transaction.atomic
     def create(self, validated_data):
         group_data = validated_data.pop("betrokkene_identificatie", None)
-        rol = super().create(validated_data)
+        try:
+            with transaction.atomic():
+                rol = super().create(validated_data)
+        except IntegrityError as exc:
+            # a concurrent request created the same kind of rol
+            if UNIQUE_ROL_CONSTRAINT not in str(exc):
+                raise
+            message = RolOccurenceValidator.message.format(
+                num=1, value=validated_data["omschrijving_generiek"]
+            )
+            raise serializers.ValidationError(
+                {"roltype": message}, code="max-occurences"
+            ) from exc
 
         if group_data:
             group_serializer = self.discriminator.mapping[
@@ -992,6 +1117,17 @@ class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
             },
         }
 
+    def create(self, validated_data):
+        # store the archiving rules, so closing the zaak needs no ZTC call
+        try:
+            ResultaatTypeArchiefregel.objects.get_for_resultaattype(
+                validated_data["resultaattype"]
+            )
+        except Exception:
+            # they are retrieved again when the zaak is closed
+            logger.warning("Could not store the archiving rules", exc_info=True)
+        return super().create(validated_data)
+
 
 class ZaakBesluitSerializer(NestedHyperlinkedModelSerializer):
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
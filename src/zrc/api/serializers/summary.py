@@ -0,0 +1,37 @@
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+
+from zrc.datamodel.models import ZaakSummary
+
+
+class ZaakSummarySerializer(serializers.HyperlinkedModelSerializer):
+    zaak = serializers.HyperlinkedRelatedField(
+        read_only=True,
+        view_name="zaak-detail",
+        lookup_field="uuid",
+        help_text=_("URL-referentie naar de ZAAK."),
+    )
+    identificatie = serializers.CharField(
+        source="zaak.identificatie",
+        read_only=True,
+        help_text=_("De unieke identificatie van de ZAAK."),
+    )
+    zaaktype = serializers.URLField(
+        source="zaak.zaaktype",
+        read_only=True,
+        help_text=_("URL-referentie naar het ZAAKTYPE (in de Catalogi API)."),
+    )
+
+    class Meta:
+        model = ZaakSummary
+        fields = (
+            "zaak",
+            "identificatie",
+            "zaaktype",
+            "statustype",
+            "datum_status_gezet",
+            "resultaattype",
+            "initiator_bsn",
+            "behandelaar_identificatie",
+        )
@@ -0,0 +1,37 @@
+from django.test import SimpleTestCase
+
+from rest_framework.test import APIRequestFactory
+
+from zrc.api.serializers import RolSerializer, ZaakObjectSerializer
+from zrc.api.serializers.cached import CachedFieldsMixin
+
+
+class CachedFieldsTests(SimpleTestCase):
+    def test_fields_bound_per_instance(self):
+        request = APIRequestFactory().get("/")
+        first = RolSerializer(context={"request": request})
+        second = RolSerializer(context={"request": APIRequestFactory().get("/")})
+
+        for name, field in first.fields.items():
+            with self.subTest(field=name):
+                self.assertIsNot(field, second.fields[name])
+                self.assertIs(field.parent, first)
+                self.assertIs(second.fields[name].parent, second)
+
+        self.assertIs(first.fields["url"].context["request"], request)
+
+    def test_same_fields_as_drf(self):
+        for serializer_class in (RolSerializer, ZaakObjectSerializer):
+            with self.subTest(serializer=serializer_class.__name__):
+                serializer = serializer_class()
+                expected = super(CachedFieldsMixin, serializer).get_fields()
+
+                self.assertEqual(list(serializer.fields), list(expected))
+                for name, field in serializer.fields.items():
+                    self.assertIs(type(field), type(expected[name]))
+
+    def test_help_text_added_once(self):
+        help_text = RolSerializer().fields["betrokkene_type"].help_text
+
+        self.assertIn("`natuurlijk_persoon`", help_text)
+        self.assertEqual(RolSerializer().fields["betrokkene_type"].help_text, help_text)
@@ -0,0 +1,87 @@
+"""
+Remote validations that are only answered once all of them are in flight.
+"""
+import threading
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+import requests
+from rest_framework import serializers
+from vng_api_common.validators import URLValidator
+
+from ..prefetch import ConcurrentValidationMixin, retrieve_concurrently
+
+# seconds to wait for the other requests, sequential requests time out
+TIMEOUT = 5
+
+
+def get_response(url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 404 if "missing" in url else 200
+    return response
+
+
+class RemoteSerializer(ConcurrentValidationMixin, serializers.Serializer):
+    zaaktype = serializers.URLField(validators=[URLValidator()])
+    statustype = serializers.URLField(validators=[URLValidator()])
+    roltype = serializers.URLField(validators=[URLValidator()])
+    informatieobject = serializers.URLField(validators=[URLValidator()])
+
+
+@override_settings(
+    LINK_FETCHER="zrc.api.prefetch.fetch_link", REMOTE_VALIDATION_WORKERS=8
+)
+class ConcurrentValidationTests(SimpleTestCase):
+    data = {
+        "zaaktype": "https://ztc.nl/api/v1/zaaktypen/1",
+        "statustype": "https://ztc.nl/api/v1/statustypen/1",
+        "roltype": "https://ztc.nl/api/v1/roltypen/1",
+        "informatieobject": "https://drc.nl/api/v1/enkelvoudiginformatieobjecten/1",
+    }
+
+    def setUp(self):
+        super().setUp()
+
+        # every request waits until all 4 requests are made
+        self.barrier = threading.Barrier(4, timeout=TIMEOUT)
+
+        def concurrent_get(url, **kwargs):
+            self.barrier.wait()
+            return get_response(url)
+
+        patcher = patch("zrc.api.prefetch._get", side_effect=concurrent_get)
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_links_fetched_concurrently(self):
+        serializer = RemoteSerializer(data=self.data)
+
+        valid = serializer.is_valid()
+
+        self.assertTrue(valid, serializer.errors)
+        self.assertEqual(self.mock_get.call_count, 4)
+        self.assertFalse(self.barrier.broken)
+
+    def test_invalid_link(self):
+        data = {**self.data, "roltype": "https://ztc.nl/api/v1/roltypen/missing"}
+        serializer = RemoteSerializer(data=data)
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(list(serializer.errors), ["roltype"])
+        self.assertEqual(serializer.errors["roltype"][0].code, "bad-url")
+
+    def test_retrieve_concurrently(self):
+        urls = [
+            f"https://drc.nl/api/v1/enkelvoudiginformatieobjecten/{i}" for i in range(4)
+        ]
+
+        def retrieve(client, url):
+            self.barrier.wait()
+            return {"url": url}
+
+        with patch("zrc.api.prefetch.get_client"):
+            results = retrieve_concurrently(urls, retrieve)
+
+        self.assertEqual(results, [{"url": url} for url in urls])
+        self.assertFalse(self.barrier.broken)
@@ -360,6 +360,56 @@ class RolTestCase(JWTAuthMixin, TypeCheckMixin, APITestCase):
 
         self.assertEqual(validation_error["code"], "invalid-betrokkene")
 
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    def test_create_rol_retrieves_roltype_once(self, *mocks):
+        url = get_operation_url("rol_create")
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "betrokkene": BETROKKENE,
+            "betrokkene_type": RolTypes.natuurlijk_persoon,
+            "roltype": ROLTYPE,
+            "roltoelichting": "awerw",
+        }
+
+        with requests_mock.Mocker() as m:
+            m.get(ROLTYPE, json=ROLTYPE_RESPONSE)
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        roltype_requests = [req for req in m.request_history if req.url == ROLTYPE]
+        self.assertEqual(len(roltype_requests), 1)
+
+        rol = Rol.objects.get()
+        self.assertEqual(rol.omschrijving_generiek, RolOmschrijving.initiator)
+
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    def test_create_second_initiator(self, *mocks):
+        url = get_operation_url("rol_create")
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        RolFactory.create(zaak=zaak, omschrijving_generiek=RolOmschrijving.initiator)
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "betrokkene": BETROKKENE,
+            "betrokkene_type": RolTypes.natuurlijk_persoon,
+            "roltype": ROLTYPE,
+            "roltoelichting": "awerw",
+        }
+
+        with requests_mock.Mocker() as m:
+            m.get(ROLTYPE, json=ROLTYPE_RESPONSE)
+            with mock_client({ROLTYPE: ROLTYPE_RESPONSE}):
+                response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        validation_error = get_validation_errors(response, "roltype")
+        self.assertEqual(validation_error["code"], "max-occurences")
+        self.assertEqual(Rol.objects.count(), 1)
+
     @freeze_time("2018-01-01")
     def test_filter_rol_np_bsn(self):
         zaak = ZaakFactory.create()
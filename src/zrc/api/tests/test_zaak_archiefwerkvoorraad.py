@@ -0,0 +1,100 @@
+from datetime import date
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import (
+    Archiefnominatie,
+    Archiefstatus,
+    VertrouwelijkheidsAanduiding,
+)
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from zrc.datamodel.tests.factories import ZaakFactory
+
+from ..pagination import ArchiefactiedatumPagination
+from ..scopes import SCOPE_ZAKEN_ALLES_LEZEN
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+
+
+class ZaakArchiefwerkvoorraadTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    zaaktype = ZAAKTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    url = reverse("zaak--archiefwerkvoorraad")
+
+    def create_zaak(self, archiefactiedatum, **kwargs):
+        return ZaakFactory.create(
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            archiefnominatie=Archiefnominatie.vernietigen,
+            archiefactiedatum=archiefactiedatum,
+            **kwargs,
+        )
+
+    def get_uuids(self, response) -> list:
+        return [zaak["uuid"] for zaak in response.json()["results"]]
+
+    def test_ordered_by_archiefactiedatum(self):
+        zaak1 = self.create_zaak(date(2021, 1, 1))
+        zaak2 = self.create_zaak(date(2020, 1, 1))
+        self.create_zaak(date(2019, 1, 1), archiefstatus=Archiefstatus.gearchiveerd)
+        self.create_zaak(None)
+        # not allowed by the authorizations
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+            archiefnominatie=Archiefnominatie.vernietigen,
+            archiefactiedatum=date(2020, 1, 1),
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_uuids(response), [str(zaak2.uuid), str(zaak1.uuid)])
+        self.assertIsNone(response.json()["next"])
+
+    def test_filter(self):
+        zaak = self.create_zaak(date(2020, 1, 1))
+        self.create_zaak(date(2021, 1, 1))
+        self.create_zaak(
+            date(2020, 1, 1), archiefnominatie=Archiefnominatie.blijvend_bewaren
+        )
+
+        response = self.client.get(
+            self.url,
+            {
+                "archiefnominatie": Archiefnominatie.vernietigen,
+                "archiefactiedatum__lt": "2020-06-01",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_uuids(response), [str(zaak.uuid)])
+
+    @patch.object(ArchiefactiedatumPagination, "page_size", 2)
+    def test_keyset_pagination(self):
+        zaken = [
+            self.create_zaak(date(2020, 1, 1)),
+            self.create_zaak(date(2020, 1, 1)),
+            self.create_zaak(date(2020, 1, 1)),
+            self.create_zaak(date(2021, 1, 1)),
+            self.create_zaak(date(2022, 1, 1)),
+        ]
+
+        uuids = []
+        url = self.url
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            uuids += self.get_uuids(response)
+            url = response.json()["next"]
+
+        self.assertEqual(uuids, [str(zaak.uuid) for zaak in zaken])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "invalid-cursor")
@@ -0,0 +1,190 @@
+"""
+Test the inclusion of related resources with the ``expand`` query parameter.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
+
+from zrc.datamodel.tests.factories import (
+    ResultaatFactory,
+    RolFactory,
+    StatusFactory,
+    ZaakFactory,
+    ZaakInformatieObjectFactory,
+    ZaakObjectFactory,
+)
+from zrc.tests.utils import ZAAK_READ_KWARGS
+
+from ..scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .mixins import ZaakInformatieObjectSyncMixin
+
+ZAAKTYPE = (
+    "https://example.com/ztc/api/v1/zaaktypen/b0cb8c8f-42ba-4d3a-ab28-10b6a8fc07ba"
+)
+
+ALL_EXPANSIONS = "status,resultaat,rollen,zaakobjecten,zaakinformatieobjecten"
+
+
+class ZaakExpandTests(ZaakInformatieObjectSyncMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_zaak(self, **kwargs):
+        zaak = ZaakFactory.create(**kwargs)
+        StatusFactory.create(zaak=zaak)
+        ResultaatFactory.create(zaak=zaak)
+        RolFactory.create_batch(2, zaak=zaak)
+        ZaakObjectFactory.create_batch(2, zaak=zaak)
+        ZaakInformatieObjectFactory.create_batch(2, zaak=zaak)
+        return zaak
+
+    def test_retrieve_without_expand(self):
+        zaak = self._create_zaak()
+
+        response = self.client.get(reverse(zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("expand", response.json())
+
+    def test_retrieve_expand(self):
+        zaak = self._create_zaak()
+        url = reverse(zaak)
+
+        response = self.client.get(url, {"expand": ALL_EXPANSIONS}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        expanded = data["expand"]
+        self.assertEqual(
+            set(expanded),
+            {"status", "resultaat", "rollen", "zaakobjecten", "zaakinformatieobjecten"},
+        )
+        self.assertEqual(expanded["status"]["url"], data["status"])
+        self.assertEqual(expanded["resultaat"]["url"], data["resultaat"])
+        self.assertEqual(len(expanded["rollen"]), 2)
+        self.assertEqual(len(expanded["zaakobjecten"]), 2)
+        self.assertEqual(len(expanded["zaakinformatieobjecten"]), 2)
+        for key in ("rollen", "zaakobjecten", "zaakinformatieobjecten"):
+            with self.subTest(key=key):
+                for item in expanded[key]:
+                    self.assertEqual(item["zaak"], f"http://testserver{url}")
+
+    def test_retrieve_expand_subset(self):
+        zaak = ZaakFactory.create()
+
+        response = self.client.get(
+            reverse(zaak), {"expand": "status,resultaat"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["expand"], {"status": None, "resultaat": None})
+
+    def test_expand_current_status(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create(zaak=zaak, datum_status_gezet="2020-01-01T12:00:00Z")
+        current = StatusFactory.create(
+            zaak=zaak, datum_status_gezet="2020-02-01T12:00:00Z"
+        )
+
+        response = self.client.get(
+            reverse(zaak), {"expand": "status"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["status"], f"http://testserver{reverse(current)}")
+        self.assertEqual(data["expand"]["status"]["url"], data["status"])
+
+    def test_expand_invalid_value(self):
+        zaak = ZaakFactory.create()
+
+        for url in (reverse(zaak), reverse("zaak-list")):
+            with self.subTest(url=url):
+                response = self.client.get(
+                    url, {"expand": "status,eigenschappen"}, **ZAAK_READ_KWARGS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                error = get_validation_errors(response, "expand")
+                self.assertEqual(error["code"], "invalid_choice")
+
+    def test_expand_skips_etag(self):
+        zaak = ZaakFactory.create(with_etag=True)
+
+        response = self.client.get(
+            reverse(zaak),
+            {"expand": "status"},
+            HTTP_IF_NONE_MATCH=f'"{zaak._etag}"',
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_list_expand(self):
+        zaak = self._create_zaak()
+
+        response = self.client.get(
+            reverse("zaak-list"), {"expand": ALL_EXPANSIONS}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(len(results[0]["expand"]["rollen"]), 2)
+
+    def test_list_expand_fixed_number_of_queries(self):
+        url = reverse("zaak-list")
+        self._create_zaak()
+
+        with CaptureQueriesContext(connection) as single:
+            response = self.client.get(
+                url, {"expand": ALL_EXPANSIONS}, **ZAAK_READ_KWARGS
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for _ in range(4):
+            self._create_zaak()
+
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(
+                url, {"expand": ALL_EXPANSIONS}, **ZAAK_READ_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 5)
+
+
+class ZaakExpandAuthorizationTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    zaaktype = ZAAKTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    def test_list_expand_filtered_by_authorizations(self):
+        zaak = ZaakFactory.create(
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        RolFactory.create(zaak=zaak)
+        # not allowed: other zaaktype and a too high vertrouwelijkheidaanduiding
+        RolFactory.create(
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        RolFactory.create(
+            zaak__zaaktype=ZAAKTYPE,
+            zaak__vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+        response = self.client.get(
+            reverse("zaak-list"), {"expand": "rollen"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(len(results[0]["expand"]["rollen"]), 1)
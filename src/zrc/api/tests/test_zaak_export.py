@@ -0,0 +1,87 @@
+import json
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from zrc.datamodel.tests.factories import StatusFactory, ZaakFactory
+
+from ..scopes import SCOPE_ZAKEN_ALLES_LEZEN
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+STATUSTYPE = "https://example.com/ztc/api/v1/statustypen/1"
+
+
+class ZaakExportTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    zaaktype = ZAAKTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    url = reverse("zaak--export")
+
+    def _get_records(self, response) -> list:
+        content = b"".join(response.streaming_content).decode("utf-8")
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(
+            2,
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        StatusFactory.create(zaak=zaak1, statustype=STATUSTYPE)
+        # not allowed by the authorizations
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = self._get_records(response)
+        self.assertEqual(
+            [record["uuid"] for record in records], [str(zaak1.uuid), str(zaak2.uuid)]
+        )
+        self.assertEqual(records[0]["statussen"][0]["statustype"], STATUSTYPE)
+        self.assertEqual(records[1]["statussen"], [])
+        self.assertIsNone(records[0]["resultaat"])
+
+    def test_export_filter(self):
+        zaak = ZaakFactory.create(
+            zaaktype=ZAAKTYPE,
+            bronorganisatie="517439943",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=ZAAKTYPE,
+            bronorganisatie="000000000",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(self.url, {"bronorganisatie": "517439943"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        records = self._get_records(response)
+        self.assertEqual([record["uuid"] for record in records], [str(zaak.uuid)])
+
+    def test_resume(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(
+            2,
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        response = self.client.get(self.url)
+        first = self._get_records(response)[0]
+
+        response = self.client.get(self.url, {"resumeToken": first["resume_token"]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        records = self._get_records(response)
+        self.assertEqual([record["uuid"] for record in records], [str(zaak2.uuid)])
+
+    def test_invalid_resume_token(self):
+        response = self.client.get(self.url, {"resumeToken": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,67 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import RolOmschrijving, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from zrc.datamodel.models import NatuurlijkPersoon
+from zrc.datamodel.tests.factories import RolFactory, StatusFactory, ZaakFactory
+
+from ..scopes import SCOPE_ZAKEN_ALLES_LEZEN
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+STATUSTYPE = "https://example.com/ztc/api/v1/statustypen/1"
+
+
+class ZaakSummaryTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    zaaktype = ZAAKTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    def test_list(self):
+        zaak = ZaakFactory.create(
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        StatusFactory.create(zaak=zaak, statustype=STATUSTYPE)
+        rol = RolFactory.create(
+            zaak=zaak, omschrijving_generiek=RolOmschrijving.initiator
+        )
+        NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+        # not allowed by the authorizations
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.get(reverse("zaaksummary-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        result = data["results"][0]
+        self.assertEqual(result["zaak"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(result["identificatie"], zaak.identificatie)
+        self.assertEqual(result["zaaktype"], ZAAKTYPE)
+        self.assertEqual(result["statustype"], STATUSTYPE)
+        self.assertEqual(result["initiatorBsn"], "123456782")
+
+    def test_filter(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(
+            2,
+            zaaktype=ZAAKTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        rol = RolFactory.create(
+            zaak=zaak1, omschrijving_generiek=RolOmschrijving.initiator
+        )
+        NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+
+        response = self.client.get(
+            reverse("zaaksummary-list"), {"initiatorBsn": "123456782"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(
+            data["results"][0]["zaak"], f"http://testserver{reverse(zaak1)}"
+        )
@@ -4,7 +4,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 from django.db import close_old_connections
-from django.test import override_settings
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from freezegun import freeze_time
@@ -15,9 +15,10 @@ from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
 from vng_api_common.validators import IsImmutableValidator
 from zds_client.tests.mocks import mock_client
 
+from zrc.api.utils import get_absolute_url
 from zrc.datamodel.models import Zaak, ZaakInformatieObject
 from zrc.datamodel.tests.factories import ZaakFactory, ZaakInformatieObjectFactory
-from zrc.sync.signals import SyncError
+from zrc.sync.signals import SyncError, _run_deferred_sync_create_zio, sync_create_zio
 
 from .mixins import ZaakInformatieObjectSyncMixin
 
@@ -256,6 +257,50 @@ class ZaakInformatieObjectAPITests(
         # transaction must be rolled back
         self.assertFalse(ZaakInformatieObject.objects.exists())
 
+    @override_settings(
+        ZDS_CLIENT_CLASS="vng_api_common.mocks.MockClient", DRC_SYNC_DEFERRED=True
+    )
+    @patch("zrc.sync.signals.connection")
+    @patch("zrc.sync.signals._get_executor")
+    @patch("zrc.sync.signals.transaction.on_commit")
+    @patch("zrc.sync.signals.get_client")
+    def test_sync_create_deferred(
+        self, mock_get_client, mock_on_commit, mock_get_executor, *mocks
+    ):
+        remote_url = "http://example.com/drc/api/v1/objectinformatieobjecten/1"
+        mock_get_client.return_value.create.return_value = {"url": remote_url}
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        zaak_url = reverse("zaak-detail", kwargs={"version": "1", "uuid": zaak.uuid})
+
+        content = {
+            "informatieobject": INFORMATIEOBJECT,
+            "zaak": f"http://testserver{zaak_url}",
+        }
+
+        with mock_client(RESPONSES):
+            response = self.client.post(self.list_url, content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_on_commit.assert_called_once()
+        self.mocked_sync_create.assert_not_called()
+
+        # run the committed callback and the submitted task synchronously
+        mock_get_executor.return_value.submit.side_effect = lambda fn, *args: fn(*args)
+        self.mocked_sync_create.side_effect = sync_create_zio
+        mock_on_commit.call_args[0][0]()
+
+        self.mocked_sync_create.assert_called_once()
+        mock_get_client.return_value.create.assert_called_once_with(
+            "objectinformatieobject",
+            {
+                "object": get_absolute_url("zaak-detail", zaak.uuid),
+                "informatieobject": INFORMATIEOBJECT,
+                "objectType": "zaak",
+            },
+        )
+        zio = ZaakInformatieObject.objects.get()
+        self.assertEqual(zio._objectinformatieobject, remote_url)
+
     @freeze_time("2018-09-19T12:25:19+0200")
     def test_delete(self):
         zio = ZaakInformatieObjectFactory.create(informatieobject=INFORMATIEOBJECT)
@@ -277,6 +322,43 @@ class ZaakInformatieObjectAPITests(
         self.assertTrue(Zaak.objects.exists())
 
 
+@patch("zrc.sync.signals.connection")
+class DeferredSyncCreateTests(ZaakInformatieObjectSyncMixin, TestCase):
+    def test_deleted(self, mock_connection):
+        zio = ZaakInformatieObjectFactory.create()
+        pk = zio.pk
+        zio.delete()
+        self.mocked_sync_create.reset_mock()
+
+        _run_deferred_sync_create_zio(pk)
+
+        self.mocked_sync_create.assert_not_called()
+        mock_connection.close.assert_called_once_with()
+
+    def test_already_synced(self, mock_connection):
+        zio = ZaakInformatieObjectFactory.create(
+            _objectinformatieobject="http://example.com/drc/api/v1/objectinformatieobjecten/1"
+        )
+        self.mocked_sync_create.reset_mock()
+
+        _run_deferred_sync_create_zio(zio.pk)
+
+        self.mocked_sync_create.assert_not_called()
+
+    def test_sync_error(self, mock_connection):
+        zio = ZaakInformatieObjectFactory.create()
+        self.mocked_sync_create.reset_mock()
+        self.mocked_sync_create.side_effect = SyncError("Could not create")
+
+        # left for sync_zaakinformatieobjecten
+        _run_deferred_sync_create_zio(zio.pk)
+
+        self.mocked_sync_create.assert_called_once()
+        zio.refresh_from_db()
+        self.assertEqual(zio._objectinformatieobject, "")
+        mock_connection.close.assert_called_once_with()
+
+
 @override_settings(
     LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
     ZDS_CLIENT_CLASS="vng_api_common.mocks.MockClient",
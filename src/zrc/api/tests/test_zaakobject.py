@@ -1,4 +1,9 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -1059,3 +1064,111 @@ class ZaakObjectOverigeTestCase(JWTAuthMixin, APITestCase):
         )
         error = get_validation_errors(response, "nonFieldErrors")
         self.assertEqual(error["code"], "invalid-object-type-overige-usage")
+
+
+class ZaakObjectListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_zaakobjecten(self):
+        zaak = ZaakFactory.create()
+        huishouden = Huishouden.objects.create(
+            zaakobject=ZaakObjectFactory.create(
+                zaak=zaak, object="", object_type=ZaakobjectTypes.huishouden
+            ),
+            nummer="123456",
+        )
+        Adres.objects.create(
+            terreingebouwdobject=TerreinGebouwdObject.objects.create(
+                huishouden=huishouden, identificatie="1"
+            ),
+            identificatie="a",
+            huisnummer="11",
+        )
+        wozobject = WozObject.objects.create(
+            zaakobject=ZaakObjectFactory.create(
+                zaak=zaak, object="", object_type=ZaakobjectTypes.woz_object
+            ),
+            woz_object_nummer="12345",
+        )
+        Adres.objects.create(wozobject=wozobject, identificatie="b", huisnummer="12")
+        Medewerker.objects.create(
+            zaakobject=ZaakObjectFactory.create(
+                zaak=zaak, object="", object_type=ZaakobjectTypes.medewerker
+            ),
+            identificatie="123456",
+        )
+
+    def test_list_fixed_number_of_queries(self):
+        url = get_operation_url("zaakobject_list")
+        self._create_zaakobjecten()
+
+        with CaptureQueriesContext(connection) as single:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for _ in range(4):
+            self._create_zaakobjecten()
+
+        with self.assertNumQueries(len(single)):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 15)
+
+
+class ZaakObjectCompactStorageTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _create_adres(self):
+        zaak = ZaakFactory.create()
+        zaak_url = get_operation_url("zaak_read", uuid=zaak.uuid)
+        data = {
+            "zaak": f"http://testserver{zaak_url}",
+            "objectType": ZaakobjectTypes.adres,
+            "relatieomschrijving": "test",
+            "objectIdentificatie": {
+                "identificatie": "123456",
+                "wplWoonplaatsNaam": "test city",
+                "gorOpenbareRuimteNaam": "test space",
+                "huisnummer": 1,
+                "huisletter": "",
+                "huisnummertoevoeging": "",
+                "postcode": "",
+            },
+        }
+        response = self.client.post(get_operation_url("zaakobject_create"), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()
+
+    @override_settings(ZAAKOBJECT_COMPACT_STORAGE=True)
+    def test_create_compact(self):
+        created = self._create_adres()
+
+        self.assertFalse(Adres.objects.exists())
+        zaakobject = ZaakObject.objects.get()
+        self.assertEqual(zaakobject._object_identificatie["identificatie"], "123456")
+
+        response = self.client.get(created["url"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), created)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(zaakobject.adres.wpl_woonplaats_naam, "test city")
+
+    def test_compact_command(self):
+        created = self._create_adres()
+        self.assertEqual(Adres.objects.count(), 1)
+
+        call_command("compact_zaakobjecten", stdout=StringIO())
+
+        self.assertFalse(Adres.objects.exists())
+        list_response = self.client.get(get_operation_url("zaakobject_list"))
+        self.assertEqual(list_response.json()["results"], [created])
+
+        call_command("compact_zaakobjecten", expand=True, stdout=StringIO())
+
+        self.assertEqual(Adres.objects.count(), 1)
+        self.assertIsNone(ZaakObject.objects.get()._object_identificatie)
+        response = self.client.get(created["url"])
+        self.assertEqual(response.json(), created)
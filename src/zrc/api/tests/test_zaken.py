@@ -26,10 +26,17 @@ from zds_client.tests.mocks import mock_client
 
 from zrc.datamodel.constants import BetalingsIndicatie
 from zrc.datamodel.models import (
+    Adres,
+    BetrokkeneIndex,
     Medewerker,
     NatuurlijkPersoon,
     OrganisatorischeEenheid,
+    Pand,
+    Rol,
     Zaak,
+    ZaakInformatieObject,
+    ZaakObject,
+    ZaakSummary,
 )
 from zrc.datamodel.tests.factories import (
     RolFactory,
@@ -37,7 +44,10 @@ from zrc.datamodel.tests.factories import (
     ZaakBesluitFactory,
     ZaakEigenschapFactory,
     ZaakFactory,
+    ZaakInformatieObjectFactory,
+    ZaakObjectFactory,
 )
+from zrc.sync.signals import SyncError
 from zrc.tests.constants import POLYGON_AMSTERDAM_CENTRUM
 from zrc.tests.utils import (
     ZAAK_READ_KWARGS,
@@ -91,9 +101,19 @@ class ApiStrategyTests(JWTAuthMixin, APITestCase):
     def test_api_10_lazy_eager_loading(self):
         raise NotImplementedError
 
-    @unittest.expectedFailure
     def test_api_11_expand_nested_resources(self):
-        raise NotImplementedError
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        status_ = StatusFactory.create(zaak=zaak)
+
+        response = self.client.get(
+            reverse(zaak), {"expand": "status"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["expand"]["status"]["url"],
+            f"http://testserver{reverse(status_)}",
+        )
 
     @unittest.expectedFailure
     def test_api_12_subset_fields(self):
@@ -761,6 +781,53 @@ class ZakenDeleteTests(JWTAuthMixin, APITestCase):
         error = get_validation_errors(response, "nonFieldErrors")
         self.assertEqual(error["code"], "related-besluiten")
 
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    @patch("zrc.sync.signals.sync_delete_zio")
+    @patch("zrc.sync.signals.sync_create_zio")
+    def test_delete_zaak_with_related_objects(self, mock_create, mock_delete, *mocks):
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        deelzaak = ZaakFactory.create(zaaktype=ZAAKTYPE, hoofdzaak=zaak)
+        rol = RolFactory.create(zaak=zaak, betrokkene_type=RolTypes.natuurlijk_persoon)
+        persoon = NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+        Adres.objects.create(natuurlijkpersoon=persoon, huisnummer=1)
+        zaakobject = ZaakObjectFactory.create(zaak=zaak, object_type="pand")
+        Pand.objects.create(zaakobject=zaakobject, identificatie="1")
+        zio = ZaakInformatieObjectFactory.create(zaak=deelzaak)
+        zaak_url = reverse("zaak-detail", kwargs={"uuid": zaak.uuid})
+
+        response = self.client.delete(zaak_url, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        for model in (
+            Zaak,
+            Rol,
+            NatuurlijkPersoon,
+            Adres,
+            BetrokkeneIndex,
+            ZaakObject,
+            Pand,
+            ZaakInformatieObject,
+            ZaakSummary,
+        ):
+            with self.subTest(model=model):
+                self.assertFalse(model.objects.exists())
+        mock_delete.assert_called_once_with(zio)
+
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    @patch("zrc.sync.signals.sync_delete_zio", side_effect=SyncError("failed"))
+    @patch("zrc.sync.signals.sync_create_zio")
+    def test_delete_zaak_remote_relation_fails(self, *mocks):
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        ZaakInformatieObjectFactory.create(zaak=zaak)
+        zaak_url = reverse("zaak-detail", kwargs={"uuid": zaak.uuid})
+
+        response = self.client.delete(zaak_url, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(ZaakInformatieObject.objects.exists())
+
 
 class ZaakArchivingTests(JWTAuthMixin, APITestCase):
 
@@ -995,6 +1062,28 @@ class ZakenWerkVoorraadTests(JWTAuthMixin, APITestCase):
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(response.data["count"], 1)
 
+    def test_rol_np_bsn_in_several_rollen(self):
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE)
+        for omschrijving in [RolOmschrijving.initiator, RolOmschrijving.belanghebbende]:
+            rol = RolFactory.create(
+                zaak=zaak,
+                betrokkene_type=RolTypes.natuurlijk_persoon,
+                omschrijving_generiek=omschrijving,
+            )
+            NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="129117729")
+
+        response = self.client.get(
+            reverse(Zaak),
+            {"rol__betrokkeneIdentificatie__natuurlijkPersoon__inpBsn": "129117729"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(
+            response.data["results"][0]["url"], f"http://testserver{reverse(zaak)}"
+        )
+
     def test_rol_organisatorische_eenheid_identificatie(self):
         url = reverse(Zaak)
         rol = RolFactory.create(
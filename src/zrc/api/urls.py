@@ -16,6 +16,7 @@ from .viewsets import (
     ZaakEigenschapViewSet,
     ZaakInformatieObjectViewSet,
     ZaakObjectViewSet,
+    ZaakSummaryViewSet,
     ZaakVerzoekViewSet,
     ZaakViewSet,
 )
@@ -38,6 +39,7 @@ router.register("resultaten", ResultaatViewSet)
 router.register("zaakinformatieobjecten", ZaakInformatieObjectViewSet)
 router.register("zaakcontactmomenten", ZaakContactMomentViewSet)
 router.register("zaakverzoeken", ZaakVerzoekViewSet)
+router.register("zaaksamenvattingen", ZaakSummaryViewSet)
 
 
 # TODO: the EndpointEnumerator seems to choke on path and re_path
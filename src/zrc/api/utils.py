@@ -4,11 +4,11 @@ from django.contrib.sites.models import Site
 from rest_framework.reverse import reverse
 
 
-def get_absolute_url(url_name: str, uuid: str) -> str:
-    path = reverse(
-        url_name,
-        kwargs={"version": settings.REST_FRAMEWORK["DEFAULT_VERSION"], "uuid": uuid},
-    )
+def get_absolute_url(url_name: str, uuid: str = None) -> str:
+    kwargs = {"version": settings.REST_FRAMEWORK["DEFAULT_VERSION"]}
+    if uuid is not None:
+        kwargs["uuid"] = uuid
+    path = reverse(url_name, kwargs=kwargs)
     domain = Site.objects.get_current().domain
     protocol = "https" if settings.IS_HTTPS else "http"
     return f"{protocol}://{domain}{path}"
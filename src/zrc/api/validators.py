@@ -1,26 +1,33 @@
 from datetime import date
 
-from django.conf import settings
 from django.db import models
 from django.utils import timezone
-from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
-from vng_api_common.models import APICredential
 from vng_api_common.validators import (
     UniekeIdentificatieValidator as _UniekeIdentificatieValidator,
 )
 
+from zrc.utils.client import get_client
+
+from ..datamodel.constants import CatalogusResource
+from ..datamodel.models import CatalogusObject
 from ..datamodel.models.core import Zaak
+from .prefetch import get_remote_object
 
 
 def fetch_object(resource: str, url: str) -> dict:
-    Client = import_string(settings.ZDS_CLIENT_CLASS)
-    client = Client.from_url(url)
-    client.auth = APICredential.get_auth(url)
-    obj = client.retrieve(resource, url=url)
-    return obj
+    def retrieve():
+        client = get_client(url)
+        return client.retrieve(resource, url=url)
+
+    if resource in CatalogusResource.values:
+        return get_remote_object(
+            url,
+            lambda: CatalogusObject.objects.get_or_retrieve(resource, url, retrieve),
+        )
+    return get_remote_object(url, retrieve)
 
 
 class RolOccurenceValidator:
@@ -45,10 +52,10 @@ class RolOccurenceValidator:
         self.instance = getattr(serializer, "instance", None)
 
     def __call__(self, attrs):
-        roltype = fetch_object("roltype", attrs["roltype"])
-
-        attrs["omschrijving"] = roltype["omschrijving"]
-        attrs["omschrijving_generiek"] = roltype["omschrijvingGeneriek"]
+        if "omschrijving_generiek" not in attrs:
+            roltype = fetch_object("roltype", attrs["roltype"])
+            attrs["omschrijving"] = roltype["omschrijving"]
+            attrs["omschrijving_generiek"] = roltype["omschrijvingGeneriek"]
 
         if attrs["omschrijving_generiek"] != self.omschrijving_generiek:
             return
@@ -60,9 +67,11 @@ class RolOccurenceValidator:
         if is_noop_update:
             return
 
+        # no need to count beyond the maximum
         existing = (
             attrs["zaak"]
             .rol_set.filter(omschrijving_generiek=self.omschrijving_generiek)
+            .values("pk")[: self.max_amount]
             .count()
         )
 
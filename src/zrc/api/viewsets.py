@@ -1,8 +1,13 @@
+import json
 import logging
 
+from django.core import signing
 from django.core.cache import caches
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.translation import ugettext_lazy as _
 
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, serializers, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
@@ -30,6 +35,8 @@ from vng_api_common.search import SearchMixin
 from vng_api_common.utils import lookup_kwargs_to_filters
 from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
 
+from zrc.datamodel.deletion import delete_zaken, get_zaak_ids_with_deelzaken
+from zrc.datamodel.export import ExportJSONEncoder, ZaakExporter, parse_resume_token
 from zrc.datamodel.models import (
     KlantContact,
     Resultaat,
@@ -41,11 +48,14 @@ from zrc.datamodel.models import (
     ZaakEigenschap,
     ZaakInformatieObject,
     ZaakObject,
+    ZaakSummary,
 )
-from zrc.sync.signals import SyncError
+from zrc.datamodel.models.core import ARCHIEFWERKVOORRAAD
+from zrc.sync.signals import SyncError, unlink_remote_relations
 
 from .audits import AUDIT_ZRC
 from .data_filtering import ListFilterByAuthorizationsMixin
+from .expansion import ExpandMixin
 from .filters import (
     KlantContactFilter,
     ResultaatFilter,
@@ -55,10 +65,12 @@ from .filters import (
     ZaakFilter,
     ZaakInformatieObjectFilter,
     ZaakObjectFilter,
+    ZaakSummaryFilter,
     ZaakVerzoekFilter,
 )
 from .kanalen import KANAAL_ZAKEN
 from .mixins import ClosedZaakMixin
+from .pagination import ArchiefactiedatumPagination
 from .permissions import (
     ZaakAuthScopesRequired,
     ZaakBaseAuthRequired,
@@ -84,6 +96,7 @@ from .serializers import (
     ZaakInformatieObjectSerializer,
     ZaakObjectSerializer,
     ZaakSerializer,
+    ZaakSummarySerializer,
     ZaakVerzoek,
     ZaakVerzoekSerializer,
     ZaakZoekSerializer,
@@ -93,6 +106,14 @@ from .validators import ZaakBesluitValidator
 logger = logging.getLogger(__name__)
 
 
+def _stream_ndjson(exporter: ZaakExporter):
+    # yield per chunk, so that the response is streamed with bounded memory
+    for _last_pk, records in exporter.iter_chunks():
+        yield "".join(
+            json.dumps(record, cls=ExportJSONEncoder) + "\n" for record in records
+        )
+
+
 @conditional_retrieve()
 class ZaakViewSet(
     NotificationViewSetMixin,
@@ -100,6 +121,7 @@ class ZaakViewSet(
     GeoMixin,
     SearchMixin,
     CheckQueryParamsMixin,
+    ExpandMixin,
     ListFilterByAuthorizationsMixin,
     viewsets.ModelViewSet,
 ):
@@ -139,12 +161,19 @@ class ZaakViewSet(
     **Opmerking**
     - er worden enkel zaken getoond van de zaaktypes waar u toe geautoriseerd
       bent.
+    - met de `expand` parameter kunnen de status, het resultaat, de rollen,
+      zaakobjecten en zaakinformatieobjecten direct meegeleverd worden.
 
     retrieve:
     Een specifieke ZAAK opvragen.
 
     Een specifieke ZAAK opvragen.
 
+    **Opmerkingen**
+    - met de `expand` parameter kunnen de status, het resultaat, de rollen,
+      zaakobjecten en zaakinformatieobjecten direct meegeleverd worden. Er
+      wordt dan geen `ETag` meegestuurd.
+
     update:
     Werk een ZAAK in zijn geheel bij.
 
@@ -222,6 +251,8 @@ class ZaakViewSet(
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "_zoek": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_export": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_archiefwerkvoorraad": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_CREATE,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -229,6 +260,7 @@ class ZaakViewSet(
     }
     notifications_kanaal = KANAAL_ZAKEN
     audit = AUDIT_ZRC
+    authorization_filtered_actions = ("list", "_export", "_archiefwerkvoorraad")
 
     @action(methods=("post",), detail=False)
     def _zoek(self, request, *args, **kwargs):
@@ -251,6 +283,55 @@ class ZaakViewSet(
 
     _zoek.is_search_action = True
 
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=("get",), detail=False)
+    def _export(self, request, *args, **kwargs):
+        """
+        Export ZAAKen with their related resources as NDJSON.
+
+        The ZAAKen are streamed in chunks, ordered by creation. Every line
+        contains a `resume_token`, which can be passed as the `resumeToken`
+        query parameter to continue an interrupted export after that ZAAK.
+        The regular ZAAK filters can be used to limit the export.
+        """
+        start_after = 0
+        resume_token = request.query_params.get("resumeToken")
+        if resume_token:
+            try:
+                start_after = parse_resume_token(resume_token)
+            except signing.BadSignature:
+                raise ValidationError(
+                    {"resume_token": _("Ongeldige resumeToken.")},
+                    code="invalid-resume-token",
+                )
+
+        filtered = self.filter_queryset(self.get_queryset())
+        exporter = ZaakExporter(
+            queryset=Zaak.objects.filter(pk__in=filtered.values("pk")),
+            start_after=start_after,
+        )
+        return StreamingHttpResponse(
+            _stream_ndjson(exporter), content_type="application/x-ndjson"
+        )
+
+    @swagger_auto_schema(auto_schema=None)
+    @action(methods=("get",), detail=False)
+    def _archiefwerkvoorraad(self, request, *args, **kwargs):
+        """
+        List the ZAAKen that still have to be archived or destroyed.
+
+        The ZAAKen with archiefstatus "nog_te_archiveren" and an
+        archiefactiedatum are listed by archiefactiedatum, with keyset
+        pagination: the `next` link continues after the last ZAAK of the page
+        through the `cursor` query parameter. The regular ZAAK filters, such as
+        `archiefnominatie` and `archiefactiedatum__lt`, can be used.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).filter(ARCHIEFWERKVOORRAAD)
+        paginator = ArchiefactiedatumPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     def perform_update(self, serializer):
         """
         Perform the update of the Case.
@@ -285,7 +366,16 @@ class ZaakViewSet(
                 {api_settings.NON_FIELD_ERRORS_KEY: exc}, code=exc.detail[0].code
             )
         else:
-            super().perform_destroy(instance)
+            # the related objects are deleted without loading them, see
+            # zrc.datamodel.deletion
+            zaak_ids = get_zaak_ids_with_deelzaken([instance.pk])
+            try:
+                unlink_remote_relations(zaak_ids)
+            except SyncError as sync_error:
+                raise ValidationError(
+                    {api_settings.NON_FIELD_ERRORS_KEY: sync_error.args[0]}
+                ) from sync_error
+            delete_zaken(zaak_ids)
 
 
 @conditional_retrieve()
@@ -407,7 +497,7 @@ class ZaakObjectViewSet(
     Een specifiek ZAAKOBJECT opvragen.
     """
 
-    queryset = ZaakObject.objects.order_by("-pk")
+    queryset = ZaakObject.objects.select_related("zaak").order_by("-pk")
     serializer_class = ZaakObjectSerializer
     filterset_class = ZaakObjectFilter
     lookup_field = "uuid"
@@ -517,6 +607,8 @@ class ZaakInformatieObjectViewSet(
         | SCOPE_ZAKEN_ALLES_VERWIJDEREN,
     }
     audit = AUDIT_ZRC
+    # the DRC reads the relation back while it is created, see zrc.db_router
+    read_primary = True
 
     @property
     def notifications_wrap_in_atomic_block(self):
@@ -702,7 +794,7 @@ class RolViewSet(
 
     """
 
-    queryset = Rol.objects.order_by("-pk")
+    queryset = Rol.objects.select_related("zaak").order_by("-pk")
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
@@ -953,6 +1045,8 @@ class ZaakContactMomentViewSet(
     }
     notifications_kanaal = KANAAL_ZAKEN
     audit = AUDIT_ZRC
+    # the KCC reads the relation back while it is created, see zrc.db_router
+    read_primary = True
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -1020,6 +1114,8 @@ class ZaakVerzoekViewSet(
     }
     notifications_kanaal = KANAAL_ZAKEN
     audit = AUDIT_ZRC
+    # the KCC reads the relation back while it is created, see zrc.db_router
+    read_primary = True
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -1038,3 +1134,37 @@ class ZaakVerzoekViewSet(
             raise ValidationError(
                 {api_settings.NON_FIELD_ERRORS_KEY: sync_error.args[0]}
             ) from sync_error
+
+
+class ZaakSummaryViewSet(
+    CheckQueryParamsMixin,
+    ListFilterByAuthorizationsMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Opvragen van samenvattingen van ZAAKen.
+
+    Een samenvatting bevat het huidige STATUSTYPE, het RESULTAATTYPE, het BSN
+    van de initiator en de identificatie van de behandelaar van een ZAAK, en
+    is bedoeld voor overzichtslijsten.
+
+    list:
+    Alle samenvattingen van ZAAKen opvragen.
+
+    Deze lijst kan gefilterd wordt met query-string parameters.
+
+    **Opmerking**
+    - er worden enkel samenvattingen getoond van de zaaktypes waar u toe
+      geautoriseerd bent.
+    """
+
+    queryset = ZaakSummary.objects.select_related("zaak").order_by("-zaak")
+    serializer_class = ZaakSummarySerializer
+    filter_backends = (Backend, OrderingFilter)
+    filterset_class = ZaakSummaryFilter
+    ordering_fields = ("datum_status_gezet",)
+    pagination_class = PageNumberPagination
+
+    permission_classes = (ZaakRelatedAuthScopesRequired,)
+    required_scopes = {"list": SCOPE_ZAKEN_ALLES_LEZEN}
@@ -25,6 +25,13 @@ CACHES = {
     },
 }
 
+# a second database to test the routing to read replicas, which are only
+# enabled in those tests
+DATABASES["replica"] = {
+    **DATABASES["default"],
+    "TEST": {"NAME": f"test_{DATABASES['default']['NAME']}_replica"},
+}
+
 LOGGING = None  # Quiet is nice
 logging.disable(logging.CRITICAL)
 
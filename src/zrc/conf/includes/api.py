@@ -9,6 +9,10 @@ REST_FRAMEWORK["PAGE_SIZE"] = 100
 
 SECURITY_DEFINITION_NAME = "JWT-Claims"
 
+# reuse HTTP connections to the other APIs
+ZDS_CLIENT_CLASS = "zrc.utils.client.PooledClient"
+LINK_FETCHER = "zrc.api.prefetch.fetch_link"
+
 SWAGGER_SETTINGS = BASE_SWAGGER_SETTINGS.copy()
 SWAGGER_SETTINGS.update(
     {
@@ -80,3 +84,4 @@ VRC_API_SPEC = f"https://raw.githubusercontent.com/{vrc_repo}/{vrc_commit}/src/o
 SPEC_CACHE_TIMEOUT = 60 * 60 * 24  # 24 hours
 
 NOTIFICATIONS_KANAAL = "zaken"
+DEFAULT_NOTIFICATIONS_HANDLER = "zrc.datamodel.handlers.default"
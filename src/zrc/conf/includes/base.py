@@ -50,15 +50,46 @@ USE_THOUSAND_SEPARATOR = True
 #
 DATABASES = {
     "default": {
-        "ENGINE": "django.contrib.gis.db.backends.postgis",
+        # PostGIS with health checks of persistent connections
+        "ENGINE": "zrc.db.backends.postgis",
         "NAME": config("DB_NAME", "zrc"),
         "USER": config("DB_USER", "zrc"),
         "PASSWORD": config("DB_PASSWORD", "zrc"),
         "HOST": config("DB_HOST", "localhost"),
         "PORT": config("DB_PORT", 5432),
+        # seconds a connection is kept open for the next requests, 0 opens a new
+        # connection for every request
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=60),
+        # check a kept-open connection before its first use in a request
+        "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True),
+        # required when connecting through a connection pooler in transaction
+        # pooling mode, such as PgBouncer
+        "DISABLE_SERVER_SIDE_CURSORS": config(
+            "DB_DISABLE_SERVER_SIDE_CURSORS", default=False
+        ),
     }
 }
 
+# read replicas of the default database, the API requests that don't change
+# anything read from them, see zrc.db_router
+DATABASE_REPLICAS = []
+for index, host in enumerate(config("DB_REPLICA_HOSTS", split=True, default=""), 1):
+    DATABASES[f"replica_{index}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{index}")
+
+DATABASE_ROUTERS = ["zrc.db_router.ReplicaRouter"]
+
+# seconds the reads of a client go to the default database after a write of the
+# client, so the client reads its own writes
+DB_REPLICA_STICKY_SECONDS = config("DB_REPLICA_STICKY_SECONDS", default=5)
+
+# seconds a replica that can't be connected to is skipped
+DB_REPLICA_RETRY_SECONDS = config("DB_REPLICA_RETRY_SECONDS", default=30)
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
@@ -130,6 +161,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "vng_api_common.middleware.AuthMiddleware",
+    "zrc.middleware.ReadReplicaMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -139,6 +171,8 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "zrc.urls"
 
+TEST_RUNNER = "zrc.tests.runner.TestRunner"
+
 # List of callables that know how to import templates from various sources.
 TEMPLATE_LOADERS = (
     "django.template.loaders.filesystem.Loader",
@@ -320,6 +354,38 @@ SITE_TITLE = "Zaak Registratie Component (ZRC)"
 ENVIRONMENT = None
 SHOW_ALERT = True
 
+# maximum number of remote ZAAKOBJECTen retrieved in parallel
+ZAAKOBJECT_FETCH_WORKERS = config("ZAAKOBJECT_FETCH_WORKERS", default=8)
+
+# maximum number of remote resources fetched in parallel during validation
+REMOTE_VALIDATION_WORKERS = config("REMOTE_VALIDATION_WORKERS", default=8)
+
+# maximum number of remote relations deleted in parallel when deleting a zaak
+REMOTE_UNLINK_WORKERS = config("REMOTE_UNLINK_WORKERS", default=8)
+
+# number of kept-alive connections per API root and process, should be at least
+# the number of (uwsgi) threads and ZAAKOBJECT_FETCH_WORKERS
+ZDS_CLIENT_POOL_SIZE = config("ZDS_CLIENT_POOL_SIZE", default=10)
+
+# seconds a signed JWT for another API is reused
+ZDS_CLIENT_TOKEN_LIFETIME = config("ZDS_CLIENT_TOKEN_LIFETIME", default=300)
+
+# seconds before other processes pick up changed APICredentials
+API_CREDENTIAL_CACHE_TIMEOUT = config("API_CREDENTIAL_CACHE_TIMEOUT", default=60)
+
+# read the Catalogi API resources from the local mirror, kept up to date through
+# the notifications of the zaaktypen and informatieobjecttypen kanalen
+CATALOGUS_MIRROR_ENABLED = config("CATALOGUS_MIRROR_ENABLED", default=False)
+
+# create the relations of new ZAAKINFORMATIEOBJECTen in the Documenten API after
+# the response, missed relations are created by ``sync_zaakinformatieobjecten``
+DRC_SYNC_DEFERRED = config("DRC_SYNC_DEFERRED", default=False)
+DRC_SYNC_WORKERS = config("DRC_SYNC_WORKERS", default=2)
+
+# store the ``objectIdentificatie`` of new ZAAKOBJECTen of the flat object types
+# on the ZAAKOBJECT, existing ones are moved with ``compact_zaakobjecten``
+ZAAKOBJECT_COMPACT_STORAGE = config("ZAAKOBJECT_COMPACT_STORAGE", default=False)
+
 #
 # Library settings
 #
@@ -353,6 +419,7 @@ CORS_ALLOW_HEADERS = (
     "accept-encoding",
     "accept-crs",
     "content-crs",
+    "x-read-primary",
 )
 
 if "GIT_SHA" in os.environ:
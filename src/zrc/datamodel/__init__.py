@@ -0,0 +1 @@
+default_app_config = "zrc.datamodel.apps.DatamodelConfig"
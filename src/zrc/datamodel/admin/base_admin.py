@@ -1,9 +1,13 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+
+from zrc.sync.signals import SyncError
 
 from ..models import (
+    CatalogusObject,
     KlantContact,
     RelevanteZaakRelatie,
     Resultaat,
+    ResultaatTypeArchiefregel,
     Rol,
     Status,
     Zaak,
@@ -12,6 +16,7 @@ from ..models import (
     ZaakInformatieObject,
     ZaakObject,
 )
+from ..vernietiging import get_chunks, get_vernietigbare_zaken, vernietig_zaken
 
 
 class StatusInline(admin.TabularInline):
@@ -65,6 +70,24 @@ class ZaakAdmin(admin.ModelAdmin):
         RelevanteZaakRelatieInline,
         ZaakContactMomentInline,
     ]
+    actions = ["vernietig"]
+
+    def vernietig(self, request, queryset):
+        zaken = get_vernietigbare_zaken().filter(pk__in=queryset.values("pk"))
+        destroyed = 0
+        try:
+            for chunk in get_chunks(zaken, 1000):
+                destroyed += vernietig_zaken(
+                    chunk,
+                    gebruikers_id=request.user.get_username(),
+                    gebruikers_weergave=request.user.get_full_name(),
+                )
+        except SyncError as exc:
+            self.message_user(request, str(exc), level=messages.ERROR)
+
+        self.message_user(request, f"{destroyed} zaken vernietigd.")
+
+    vernietig.short_description = "Vernietig de geselecteerde zaken"
 
 
 @admin.register(Status)
@@ -115,3 +138,26 @@ class ZaakContactMomentAdmin(admin.ModelAdmin):
     list_display = ["zaak", "contactmoment"]
     list_select_related = ["zaak"]
     raw_id_fields = ["zaak"]
+
+
+@admin.register(ResultaatTypeArchiefregel)
+class ResultaatTypeArchiefregelAdmin(admin.ModelAdmin):
+    list_display = [
+        "resultaattype",
+        "archiefnominatie",
+        "archiefactietermijn",
+        "afleidingswijze",
+        "versie",
+        "gesynchroniseerd",
+    ]
+    list_filter = ["archiefnominatie", "afleidingswijze"]
+    search_fields = ["resultaattype", "zaaktype"]
+    readonly_fields = ["versie", "gesynchroniseerd"]
+
+
+@admin.register(CatalogusObject)
+class CatalogusObjectAdmin(admin.ModelAdmin):
+    list_display = ["url", "resource", "gesynchroniseerd"]
+    list_filter = ["resource"]
+    search_fields = ["url", "zaaktype"]
+    readonly_fields = ["gesynchroniseerd"]
@@ -0,0 +1,138 @@
+"""
+Recalculate the archiving parameters of closed ZAAKen in bulk.
+
+The archiving rules come from :class:`zrc.datamodel.models.ResultaatTypeArchiefregel`.
+For the afleidingswijzen that only depend on the ZAAK itself (``afgehandeld``,
+``termijn`` and ``hoofdzaak``) the ``archiefactiedatum`` is computed in the
+database with a single ``UPDATE``, using PostgreSQL's support for ISO 8601
+intervals. The other afleidingswijzen go through
+:class:`zrc.datamodel.utils.BrondatumCalculator` for every ZAAK.
+"""
+import logging
+from datetime import date, datetime, time
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import (
+    DateField,
+    DateTimeField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Cast
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from vng_api_common.constants import (
+    Archiefstatus,
+    BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
+)
+
+from zrc.utils.exceptions import DetermineProcessEndDateException
+
+from .models import ResultaatTypeArchiefregel, Zaak
+from .utils import BrondatumCalculator
+
+logger = logging.getLogger(__name__)
+
+# afleidingswijzen where the brondatum can be derived in the database
+SET_WISE = (
+    Afleidingswijze.afgehandeld,
+    Afleidingswijze.termijn,
+    Afleidingswijze.hoofdzaak,
+)
+
+
+def get_recalculable_zaken(resultaattype: str = None):
+    """
+    Closed ZAAKen with a RESULTAAT which are not archived yet.
+    """
+    zaken = Zaak.objects.filter(
+        einddatum__isnull=False,
+        resultaat__isnull=False,
+        archiefstatus=Archiefstatus.nog_te_archiveren,
+    )
+    if resultaattype:
+        zaken = zaken.filter(resultaat__resultaattype=resultaattype)
+    return zaken
+
+
+def _add_interval(expression, duration: str):
+    interval = Cast(Value(duration), output_field=DurationField())
+    return ExpressionWrapper(expression + interval, output_field=DateTimeField())
+
+
+def get_brondatum_expression(regel: ResultaatTypeArchiefregel):
+    if regel.afleidingswijze == Afleidingswijze.afgehandeld:
+        return F("einddatum")
+
+    if regel.afleidingswijze == Afleidingswijze.termijn:
+        if not regel.procestermijn:
+            raise DetermineProcessEndDateException(
+                _("Geen procestermijn aanwezig voor het bepalen van de brondatum.")
+            )
+        return _add_interval(F("einddatum"), regel.procestermijn)
+
+    if regel.afleidingswijze == Afleidingswijze.hoofdzaak:
+        hoofdzaken = Zaak.objects.filter(pk=OuterRef("hoofdzaak_id"))
+        return Subquery(hoofdzaken.values("einddatum")[:1])
+
+    raise ValueError(f"{regel.afleidingswijze} can not be derived set-wise")
+
+
+def recalculate(regel: ResultaatTypeArchiefregel, zaak_ids: List[int]) -> int:
+    """
+    Recalculate the archiefnominatie and archiefactiedatum of the ZAAKen.
+
+    :return: the number of updated ZAAKen
+    """
+    zaken = Zaak.objects.filter(pk__in=zaak_ids)
+    values = {"archiefnominatie": regel.archiefnominatie or None, "_etag": ""}
+
+    if not regel.archiefactietermijn:
+        return zaken.update(archiefactiedatum=None, **values)
+
+    if regel.afleidingswijze in SET_WISE:
+        brondatum = get_brondatum_expression(regel)
+        archiefactiedatum = Cast(
+            _add_interval(brondatum, regel.archiefactietermijn),
+            output_field=DateField(),
+        )
+        if regel.afleidingswijze == Afleidingswijze.hoofdzaak:
+            # keep the archiefactiedatum until the hoofdzaak is closed
+            zaken = zaken.filter(hoofdzaak__einddatum__isnull=False)
+        return zaken.update(archiefactiedatum=archiefactiedatum, **values)
+
+    updated = []
+    for zaak in zaken.select_related("hoofdzaak"):
+        try:
+            archiefactiedatum = _calculate(zaak, regel)
+        except DetermineProcessEndDateException as exc:
+            logger.warning("Could not recalculate zaak %s: %s", zaak.pk, exc)
+            continue
+        # e.g. an ander_datumkenmerk, the archiefactiedatum is set by hand
+        if archiefactiedatum is None:
+            continue
+        zaak.archiefnominatie = values["archiefnominatie"]
+        zaak.archiefactiedatum = archiefactiedatum
+        zaak._etag = ""
+        updated.append(zaak)
+
+    with transaction.atomic():
+        Zaak.objects.bulk_update(
+            updated, ["archiefnominatie", "archiefactiedatum", "_etag"]
+        )
+    return len(updated)
+
+
+def _calculate(zaak: Zaak, regel: ResultaatTypeArchiefregel) -> Optional[date]:
+    # the calculator keeps an existing archiefactiedatum
+    zaak.archiefactiedatum = None
+    datum_status_gezet = timezone.make_aware(datetime.combine(zaak.einddatum, time()))
+    calculator = BrondatumCalculator(zaak, datum_status_gezet)
+    calculator._archiefregel = regel
+    return calculator.calculate()
@@ -156,3 +156,29 @@ class IndicatieMachtiging(DjangoChoices):
             "bij dezelfde zaak gemachtigd om namens hem of haar te handelen"
         ),
     )
+
+
+class CatalogusResource(DjangoChoices):
+    zaaktype = ChoiceItem("zaaktype", _("Zaaktype"))
+    statustype = ChoiceItem("statustype", _("Statustype"))
+    roltype = ChoiceItem("roltype", _("Roltype"))
+    resultaattype = ChoiceItem("resultaattype", _("Resultaattype"))
+    eigenschap = ChoiceItem("eigenschap", _("Eigenschap"))
+    informatieobjecttype = ChoiceItem("informatieobjecttype", _("Informatieobjecttype"))
+
+
+class BetrokkeneIdentificatie(DjangoChoices):
+    inp_bsn = ChoiceItem("inp_bsn", _("BSN natuurlijk persoon"))
+    anp_identificatie = ChoiceItem(
+        "anp_identificatie", _("Identificatie ander natuurlijk persoon")
+    )
+    inp_a_nummer = ChoiceItem("inp_a_nummer", _("A-nummer natuurlijk persoon"))
+    inn_nnp_id = ChoiceItem("inn_nnp_id", _("RSIN niet-natuurlijk persoon"))
+    ann_identificatie = ChoiceItem(
+        "ann_identificatie", _("Identificatie ander niet-natuurlijk persoon")
+    )
+    vestigings_nummer = ChoiceItem("vestigings_nummer", _("Vestigingsnummer"))
+    organisatorische_eenheid = ChoiceItem(
+        "organisatorische_eenheid", _("Identificatie organisatorische eenheid")
+    )
+    medewerker = ChoiceItem("medewerker", _("Identificatie medewerker"))
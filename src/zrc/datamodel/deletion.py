@@ -0,0 +1,73 @@
+"""
+Set-based deletion of ZAAKen with all their related objects.
+
+Django's collector loads every related object of a ZAAK - statussen, rollen
+with their betrokkenen, zaakobjecten with all their object types etc. - and
+sends the delete signals for each of them. Since the ETag receivers listen to
+all models, the collector never takes its fast path.
+
+Instead, the related objects are deleted with a single ``DELETE`` per relation,
+selecting the rows with a subquery on their parent rows, the most deeply
+nested first. No delete signals are sent. The receivers of the related models
+only maintain the ETags and denormalised tables of the ZAAK being deleted,
+except for the relations in the other APIs, which have to be removed
+beforehand, see :func:`zrc.sync.signals.unlink_remote_relations`.
+"""
+from collections import Counter
+from typing import Iterable, List
+
+from django.db import models, transaction
+
+from .models import Zaak
+
+
+def get_zaak_ids_with_deelzaken(zaak_ids: Iterable[int]) -> List[int]:
+    """
+    Return the ZAAKen, with the deelzaken deleted together with them.
+    """
+    zaak_ids = list(zaak_ids)
+    pending = zaak_ids
+    while pending:
+        pending = list(
+            Zaak.objects.filter(hoofdzaak_id__in=pending)
+            .exclude(pk__in=zaak_ids)
+            .values_list("pk", flat=True)
+        )
+        zaak_ids += pending
+    return zaak_ids
+
+
+def _delete_cascade(queryset: models.QuerySet, deleted: Counter) -> None:
+    for relation in queryset.model._meta.related_objects:
+        related_model = relation.related_model
+        # deelzaken are part of the deleted zaken already
+        if related_model is Zaak:
+            continue
+
+        if relation.on_delete is not models.CASCADE:
+            raise ValueError(
+                f"Relation {relation} can't be deleted with a set-based delete"
+            )
+
+        _delete_cascade(
+            related_model._base_manager.filter(
+                **{f"{relation.field.name}__in": queryset.values("pk")}
+            ),
+            deleted,
+        )
+
+    deleted[queryset.model._meta.label] += queryset._raw_delete(queryset.db)
+
+
+def delete_zaken(zaak_ids: Iterable[int]) -> Counter:
+    """
+    Delete the ZAAKen, their deelzaken and all related objects without loading
+    them.
+
+    :return: the number of deleted objects per model
+    """
+    deleted = Counter()
+    with transaction.atomic():
+        zaken = Zaak._base_manager.filter(pk__in=get_zaak_ids_with_deelzaken(zaak_ids))
+        _delete_cascade(zaken, deleted)
+    return +deleted
@@ -0,0 +1,283 @@
+"""
+Bulk export of ZAAKen with their related resources.
+
+ZAAKen are read in primary key order with a server-side cursor and grouped in
+chunks. The related resources are fetched with one query per resource per
+chunk. The ``betrokkeneIdentificatie`` of ROLlen and the
+``objectIdentificatie`` of ZAAKOBJECTen are exported as in the API, and loaded
+with one query per type present in the chunk. Every exported ZAAK carries a
+resume token, which can be used to continue an interrupted export after that
+ZAAK.
+"""
+import csv
+import json
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.contrib.gis.geos import GEOSGeometry
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import F
+
+from zrc.api.expansion import load_rollen, load_zaakobjecten
+from zrc.api.serializers import RolSerializer, ZaakObjectSerializer
+
+from .models import Resultaat, Rol, Status, Zaak, ZaakEigenschap, ZaakObject
+
+RESUME_TOKEN_SALT = "zrc.datamodel.export"
+
+# name in the export -> (model, many)
+RELATED_RESOURCES = {
+    "statussen": (Status, True),
+    "resultaat": (Resultaat, False),
+    "rollen": (Rol, True),
+    "zaakobjecten": (ZaakObject, True),
+    "eigenschappen": (ZaakEigenschap, True),
+}
+
+# name in the export -> (function loading the type specific relations,
+# discriminator serializing the nested identificatie)
+IDENTIFICATIE_RESOURCES = {
+    "rollen": (load_rollen, RolSerializer.discriminator),
+    "zaakobjecten": (load_zaakobjecten, ZaakObjectSerializer.discriminator),
+}
+
+
+class ExportJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        if isinstance(o, GEOSGeometry):
+            return json.loads(o.json)
+        return super().default(o)
+
+
+def get_export_fields(model: models.Model) -> List[str]:
+    """
+    Return the names of the plain (non-relational) columns to export.
+
+    A compact ``objectIdentificatie`` stored on the ZAAKOBJECT itself is
+    exported like the other ones, see ``IDENTIFICATIE_RESOURCES``.
+    """
+    return [
+        field.attname
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+        and not field.is_relation
+        and field.name not in ("_etag", "_object_identificatie")
+    ]
+
+
+def make_resume_token(pk: int) -> str:
+    return signing.dumps(pk, salt=RESUME_TOKEN_SALT)
+
+
+def parse_resume_token(token: str) -> int:
+    """
+    :raises: :class:`django.core.signing.BadSignature` for invalid tokens
+    """
+    return int(signing.loads(token, salt=RESUME_TOKEN_SALT))
+
+
+class ZaakExporter:
+    def __init__(
+        self,
+        queryset: Optional[models.QuerySet] = None,
+        chunk_size: int = 500,
+        start_after: int = 0,
+        end: Optional[int] = None,
+    ):
+        """
+        :param queryset: the ZAAKen to export, defaults to all ZAAKen
+        :param chunk_size: number of ZAAKen to load the related resources for
+          at once
+        :param start_after: only export ZAAKen with a higher primary key
+        :param end: only export ZAAKen up to (and including) this primary key
+        """
+        self.queryset = queryset if queryset is not None else Zaak.objects.all()
+        self.chunk_size = chunk_size
+        self.start_after = start_after
+        self.end = end
+
+    def iter_chunks(self) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        Yield the last primary key and the records of every chunk.
+        """
+        queryset = self.queryset.filter(pk__gt=self.start_after)
+        if self.end is not None:
+            queryset = queryset.filter(pk__lte=self.end)
+
+        rows = (
+            queryset.order_by("pk")
+            .values("pk", *get_export_fields(Zaak), hoofdzaak_uuid=F("hoofdzaak__uuid"))
+            .iterator(chunk_size=self.chunk_size)
+        )
+
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == self.chunk_size:
+                yield self._build_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield self._build_chunk(chunk)
+
+    def iter_records(self) -> Iterator[dict]:
+        for _, records in self.iter_chunks():
+            yield from records
+
+    def _build_chunk(self, rows: List[dict]) -> Tuple[int, List[dict]]:
+        last_pk = rows[-1]["pk"]
+        related = self._get_related([row["pk"] for row in rows])
+
+        records = []
+        for row in rows:
+            pk = row.pop("pk")
+            row["hoofdzaak"] = row.pop("hoofdzaak_uuid")
+            for name, (model, many) in RELATED_RESOURCES.items():
+                items = related[name].get(pk, [])
+                row[name] = items if many else (items[0] if items else None)
+            row["resume_token"] = make_resume_token(pk)
+            records.append(row)
+
+        return last_pk, records
+
+    def _get_related(self, zaak_ids: List[int]) -> Dict[str, Dict[int, List[dict]]]:
+        related = {}
+        for name, (model, many) in RELATED_RESOURCES.items():
+            grouped = {}
+            queryset = model.objects.filter(zaak_id__in=zaak_ids).order_by("pk")
+            if name in IDENTIFICATIE_RESOURCES:
+                rows = self._get_with_identificatie(name, queryset)
+            else:
+                rows = queryset.values("zaak_id", *get_export_fields(model))
+            for row in rows:
+                grouped.setdefault(row.pop("zaak_id"), []).append(row)
+            related[name] = grouped
+        return related
+
+    @staticmethod
+    def _get_with_identificatie(name: str, queryset: models.QuerySet) -> List[dict]:
+        load, discriminator = IDENTIFICATIE_RESOURCES[name]
+        instances = list(queryset)
+        load(instances)
+
+        fields = get_export_fields(queryset.model)
+        rows = []
+        for instance in instances:
+            row = {field: getattr(instance, field) for field in fields}
+            row["zaak_id"] = instance.zaak_id
+            # ``None`` for types without an identificatie
+            representation = discriminator.to_representation(instance) or {}
+            row[discriminator.group_field] = representation.get(
+                discriminator.group_field
+            )
+            rows.append(row)
+        return rows
+
+
+def write_ndjson(records: Iterator[dict], stream) -> int:
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, cls=ExportJSONEncoder) + "\n")
+        count += 1
+    return count
+
+
+def _open_at(path: str, offset: Optional[int]):
+    """
+    Open the file for writing, continuing at ``offset`` if given.
+
+    Anything after the offset was written after the last recorded chunk and is
+    discarded.
+    """
+    if offset is None:
+        return open(path, "w", newline="")
+    file = open(path, "r+", newline="")
+    file.seek(offset)
+    file.truncate()
+    return file
+
+
+class NDJSONWriter:
+    """
+    Write the records as one JSON document per line.
+    """
+
+    def __init__(self, path: str, offset: Optional[int] = None):
+        self.file = _open_at(path, offset)
+
+    def write(self, records: Iterator[dict]) -> int:
+        return write_ndjson(records, self.file)
+
+    def flush(self):
+        self.file.flush()
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class ColumnarWriter:
+    """
+    Write the records as one CSV file per resource, linked by the ZAAK uuid.
+    """
+
+    def __init__(self, directory: str, offsets: Optional[Dict[str, int]] = None):
+        os.makedirs(directory, exist_ok=True)
+        self.files = {}
+        self.writers = {}
+
+        tables = {"zaken": ["resume_token", "hoofdzaak"] + get_export_fields(Zaak)}
+        for name, (model, many) in RELATED_RESOURCES.items():
+            tables[name] = ["zaak"] + get_export_fields(model)
+            if name in IDENTIFICATIE_RESOURCES:
+                tables[name].append(IDENTIFICATIE_RESOURCES[name][1].group_field)
+
+        for name, columns in tables.items():
+            path = os.path.join(directory, f"{name}.csv")
+            offset = offsets[name] if offsets else None
+            self.files[name] = _open_at(path, offset)
+            self.writers[name] = csv.DictWriter(self.files[name], fieldnames=columns)
+            if offset is None:
+                self.writers[name].writeheader()
+
+    def write(self, records: Iterator[dict]) -> int:
+        count = 0
+        for record in records:
+            zaak_uuid = record["uuid"]
+            for name, (model, many) in RELATED_RESOURCES.items():
+                items = record.pop(name)
+                if not many:
+                    items = [items] if items else []
+                for item in items:
+                    self.writers[name].writerow(
+                        self._flatten({"zaak": zaak_uuid, **item})
+                    )
+            self.writers["zaken"].writerow(self._flatten(record))
+            count += 1
+        return count
+
+    def flush(self):
+        for file in self.files.values():
+            file.flush()
+
+    def tell(self) -> Dict[str, int]:
+        return {name: file.tell() for name, file in self.files.items()}
+
+    def close(self):
+        for file in self.files.values():
+            file.close()
+
+    @staticmethod
+    def _flatten(row: dict) -> dict:
+        return {key: _to_cell(value) for key, value in row.items()}
+
+
+def _to_cell(value):
+    if value is None or isinstance(value, str):
+        return value
+    encoded = json.dumps(value, cls=ExportJSONEncoder)
+    # dates, uuids etc. are encoded as strings, nested data is kept as JSON
+    return json.loads(encoded) if encoded.startswith('"') else encoded
@@ -0,0 +1,91 @@
+"""
+Handle the notifications the ZRC is subscribed to.
+
+Configured through ``settings.DEFAULT_NOTIFICATIONS_HANDLER``.
+"""
+import logging
+
+from django.conf import settings
+
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.notifications.constants import KANAAL_AUTORISATIES
+from vng_api_common.notifications.handlers import RoutingHandler, auth, log
+
+from .constants import CatalogusResource
+from .models import CatalogusObject, ResultaatTypeArchiefregel
+
+logger = logging.getLogger(__name__)
+
+KANAAL_ZAAKTYPEN = "zaaktypen"
+KANAAL_INFORMATIEOBJECTTYPEN = "informatieobjecttypen"
+
+
+class ZaaktypeHandler:
+    """
+    Refresh the mirrored ZAAKTYPE and the archiving rules of the RESULTAATTYPEn
+    of a changed ZAAKTYPE.
+    """
+
+    def handle(self, message: dict) -> None:
+        # only the mirror is removed, the rules are kept for destroyed (concept)
+        # zaaktypen as existing resultaten may still refer to them
+        if message["actie"] == CommonResourceAction.destroy:
+            CatalogusObject.objects.filter(zaaktype=message["hoofd_object"]).delete()
+            return
+
+        if settings.CATALOGUS_MIRROR_ENABLED:
+            try:
+                CatalogusObject.objects.sync_zaaktype(message["hoofd_object"])
+            except Exception:
+                logger.warning(
+                    "Could not refresh the mirror of %s",
+                    message["hoofd_object"],
+                    exc_info=True,
+                )
+
+        archiefregels = ResultaatTypeArchiefregel.objects.filter(
+            zaaktype=message["hoofd_object"]
+        )
+        for resultaattype in archiefregels.values_list("resultaattype", flat=True):
+            try:
+                ResultaatTypeArchiefregel.objects.sync(resultaattype)
+            except Exception:
+                logger.warning(
+                    "Could not refresh the archiving rules of %s",
+                    resultaattype,
+                    exc_info=True,
+                )
+
+
+class InformatieObjectTypeHandler:
+    """
+    Refresh a mirrored INFORMATIEOBJECTTYPE.
+    """
+
+    def handle(self, message: dict) -> None:
+        url = message["hoofd_object"]
+        mirrored = CatalogusObject.objects.filter(url=url)
+        if message["actie"] == CommonResourceAction.destroy:
+            mirrored.delete()
+            return
+
+        if not settings.CATALOGUS_MIRROR_ENABLED or not mirrored.exists():
+            return
+
+        try:
+            CatalogusObject.objects.sync(CatalogusResource.informatieobjecttype, url)
+        except Exception:
+            logger.warning("Could not refresh the mirror of %s", url, exc_info=True)
+
+
+zaaktype = ZaaktypeHandler()
+informatieobjecttype = InformatieObjectTypeHandler()
+
+default = RoutingHandler(
+    {
+        KANAAL_AUTORISATIES: auth,
+        KANAAL_ZAAKTYPEN: zaaktype,
+        KANAAL_INFORMATIEOBJECTTYPEN: informatieobjecttype,
+    },
+    default=log,
+)
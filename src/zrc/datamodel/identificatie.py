@@ -0,0 +1,104 @@
+"""
+Sequence backed identificaties, in the format of
+:func:`vng_api_common.utils.generate_unique_identification`.
+
+:func:`vng_api_common.utils.generate_unique_identification` looks up the
+highest issued identificatie for every new object, and concurrent creates can
+end up with the same number. Instead, the numbers are handed out by a
+PostgreSQL sequence per bronorganisatie and year. ``nextval`` doesn't lock and
+never hands out a number twice, also not when the transaction is rolled back.
+
+The sequence is created on first use and continues after the highest
+identificatie issued so far. Numbers already taken by an identificatie given
+by a client are skipped.
+"""
+import re
+from typing import List
+
+from django.db import DatabaseError, connection, models, transaction
+
+SEQUENCE_PREFIX = "identificatie"
+
+
+def get_prefix(model) -> str:
+    return getattr(model, "IDENTIFICATIE_PREFIX", model._meta.model_name.upper())
+
+
+def get_sequence_name(model, bronorganisatie: str, year: int) -> str:
+    bronorganisatie = re.sub(r"[^0-9a-zA-Z]", "", bronorganisatie).lower()
+    return f"{SEQUENCE_PREFIX}_{model._meta.model_name}_{bronorganisatie}_{year}"
+
+
+def _get_last_number(model, bronorganisatie: str, year: int) -> int:
+    pattern = rf"^{get_prefix(model)}-{year}-\d{{10}}$"
+    max_id = model._default_manager.filter(
+        bronorganisatie=bronorganisatie, identificatie__regex=pattern
+    ).aggregate(models.Max("identificatie"))["identificatie__max"]
+    return int(max_id.split("-")[-1]) if max_id else 0
+
+
+def _next_numbers(sequence: str, amount: int) -> List[int]:
+    # returns no numbers if the sequence doesn't exist (yet)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(c.oid::regclass) FROM pg_class c, generate_series(1, %s) "
+            "WHERE c.oid = to_regclass(%s)",
+            [amount, sequence],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _create_sequence(model, sequence: str, bronorganisatie: str, year: int) -> None:
+    start = _get_last_number(model, bronorganisatie, year) + 1
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE SEQUENCE IF NOT EXISTS {connection.ops.quote_name(sequence)} "
+                "START WITH %s",
+                [start],
+            )
+    except DatabaseError:
+        # created by a concurrent transaction
+        pass
+
+
+def reserve_numbers(
+    model, bronorganisatie: str, year: int, amount: int = 1
+) -> List[int]:
+    sequence = get_sequence_name(model, bronorganisatie, year)
+    numbers = _next_numbers(sequence, amount)
+    if not numbers:
+        _create_sequence(model, sequence, bronorganisatie, year)
+        numbers = _next_numbers(sequence, amount)
+        if not numbers:
+            raise RuntimeError(f"The sequence {sequence} could not be created")
+    return numbers
+
+
+def reserve_identificaties(
+    model, bronorganisatie: str, year: int, amount: int = 1
+) -> List[str]:
+    """
+    Hand out ``amount`` identificaties for the bronorganisatie and year.
+    """
+    prefix = get_prefix(model)
+    identificaties = []
+    while len(identificaties) < amount:
+        numbers = reserve_numbers(
+            model, bronorganisatie, year, amount - len(identificaties)
+        )
+        candidates = [f"{prefix}-{year}-{str(number).zfill(10)}" for number in numbers]
+        taken = set(
+            model._default_manager.filter(
+                bronorganisatie=bronorganisatie, identificatie__in=candidates
+            ).values_list("identificatie", flat=True)
+        )
+        identificaties += [
+            identificatie for identificatie in candidates if identificatie not in taken
+        ]
+    return identificaties
+
+
+def generate_identificatie(instance: models.Model, date_field_name: str) -> str:
+    year = getattr(instance, date_field_name).year
+    return reserve_identificaties(type(instance), instance.bronorganisatie, year)[0]
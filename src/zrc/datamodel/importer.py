@@ -0,0 +1,301 @@
+"""
+Bulk import of (legacy) ZAAKen with their related resources.
+
+The import bypasses the API: ZAAKTYPEn are validated against a cache that is
+filled once per distinct URL, identificaties are reserved in blocks per
+bronorganisatie and year (see :mod:`zrc.datamodel.identificatie`) and the
+rows are inserted per chunk with ``bulk_create``. Model signals do not fire
+for bulk inserts, so no notifications are sent and nothing is synchronised
+with the DRC - the derived :class:`zrc.datamodel.models.ZaakSummary` rows are
+computed per chunk.
+
+The input records use the format of :mod:`zrc.datamodel.export`.
+"""
+import csv
+import json
+import logging
+import uuid
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from django.contrib.gis.db.models import GeometryField
+from django.contrib.gis.geos import GEOSGeometry
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from vng_api_common.constants import BetalingsIndicatie
+
+from zrc.utils.client import get_client
+
+from .export import RELATED_RESOURCES, get_export_fields
+from .identificatie import reserve_identificaties
+from .models import Zaak, ZaakSummary
+
+logger = logging.getLogger(__name__)
+
+# related resources without nested objects, which can be inserted as-is
+IMPORTED_RESOURCES = {
+    name: RELATED_RESOURCES[name]
+    for name in ("statussen", "resultaat", "eigenschappen")
+}
+
+
+class ZaaktypeCache:
+    """
+    Retrieve every ZAAKTYPE once from the Catalogi API.
+    """
+
+    def __init__(self):
+        self._zaaktypen = {}
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        :return: the ZAAKTYPE, or ``None`` if it could not be retrieved
+        """
+        if url not in self._zaaktypen:
+            self._zaaktypen[url] = self._retrieve(url)
+        return self._zaaktypen[url]
+
+    def preload(self, urls: Iterable[str]) -> None:
+        for url in set(urls):
+            self.get(url)
+
+    @staticmethod
+    def _retrieve(url: str) -> Optional[dict]:
+        client = get_client(url, scopes=["zds.scopes.zaaktypes.lezen"])
+        if client is None:
+            return None
+        try:
+            return client.request(url, "zaaktype")
+        except Exception:
+            logger.warning("Could not retrieve zaaktype %s", url, exc_info=True)
+            return None
+
+
+class ImportResult:
+    def __init__(self):
+        self.imported = 0
+        # (line number, errors)
+        self.errors = []
+
+
+class ZaakImporter:
+    def __init__(self, chunk_size: int = 1000, zaaktype_cache=None):
+        self.chunk_size = chunk_size
+        self.zaaktype_cache = zaaktype_cache or ZaaktypeCache()
+        self.zaak_fields = [
+            field for field in get_export_fields(Zaak) if field != "uuid"
+        ]
+
+    def run(self, records: Iterable[dict]) -> Iterator[ImportResult]:
+        """
+        Import the records, yielding the result of every chunk.
+        """
+        chunk = []
+        for line, record in enumerate(records, start=1):
+            chunk.append((line, record))
+            if len(chunk) == self.chunk_size:
+                yield self.import_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield self.import_chunk(chunk)
+
+    def import_chunk(self, chunk: List[Tuple[int, dict]]) -> ImportResult:
+        result = ImportResult()
+        self.zaaktype_cache.preload(
+            record["zaaktype"] for _, record in chunk if record.get("zaaktype")
+        )
+
+        valid = []
+        for line, record in chunk:
+            try:
+                zaak = self.build_zaak(record)
+            except ValidationError as exc:
+                result.errors.append((line, exc.message_dict))
+            else:
+                valid.append((line, zaak, record))
+
+        valid = self._reject_duplicates(valid, result)
+        valid = self._resolve_hoofdzaken(valid, result)
+        if not valid:
+            return result
+
+        with transaction.atomic():
+            zaken = [zaak for _, zaak, _ in valid]
+            self._assign_identificaties(zaken)
+            Zaak.objects.bulk_create(zaken)
+
+            # deelzaken can refer to hoofdzaken earlier in the same chunk
+            pks = {zaak.uuid: zaak.pk for zaak in zaken}
+            deelzaken = [zaak for zaak in zaken if zaak._hoofdzaak_uuid]
+            for zaak in deelzaken:
+                zaak.hoofdzaak_id = pks[zaak._hoofdzaak_uuid]
+            Zaak.objects.bulk_update(deelzaken, ["hoofdzaak"])
+
+            for name, (model, many) in IMPORTED_RESOURCES.items():
+                model.objects.bulk_create(self._build_related(name, model, valid))
+
+            zaak_ids = list(pks.values())
+            ZaakSummary.objects.ensure_exists(zaak_ids)
+            ZaakSummary.objects.filter(zaak_id__in=zaak_ids).refresh()
+
+        result.imported = len(zaken)
+        return result
+
+    def build_zaak(self, record: dict) -> Zaak:
+        """
+        :raises: :class:`django.core.exceptions.ValidationError`
+        """
+        values = {field: record[field] for field in self.zaak_fields if field in record}
+        if values.get("zaakgeometrie"):
+            values["zaakgeometrie"] = GEOSGeometry(json.dumps(values["zaakgeometrie"]))
+        if record.get("uuid"):
+            values["uuid"] = record["uuid"]
+        zaak = Zaak(**values)
+
+        zaaktype = self.zaaktype_cache.get(zaak.zaaktype) if zaak.zaaktype else None
+        if zaak.zaaktype and zaaktype is None:
+            raise ValidationError(
+                {"zaaktype": ["Het ZAAKTYPE kon niet opgehaald worden."]}
+            )
+
+        if not zaak.vertrouwelijkheidaanduiding and zaaktype:
+            zaak.vertrouwelijkheidaanduiding = zaaktype["vertrouwelijkheidaanduiding"]
+        if (
+            zaak.betalingsindicatie == BetalingsIndicatie.nvt
+            and zaak.laatste_betaaldatum
+        ):
+            zaak.laatste_betaaldatum = None
+
+        # the identificatie is assigned on insert, uniqueness is checked per
+        # chunk
+        zaak.full_clean(exclude=["identificatie"], validate_unique=False)
+
+        zaak._hoofdzaak_uuid = None
+        if record.get("hoofdzaak"):
+            try:
+                zaak._hoofdzaak_uuid = uuid.UUID(str(record["hoofdzaak"]))
+            except ValueError:
+                raise ValidationError({"hoofdzaak": ["Ongeldige UUID."]})
+        return zaak
+
+    def _reject_duplicates(self, valid: list, result: ImportResult) -> list:
+        """
+        Drop the ZAAKen of which the UUID or the identificatie within the
+        bronorganisatie already exists, or occurs earlier in the chunk.
+        """
+        identificaties = {zaak.identificatie for _, zaak, _ in valid} - {""}
+        seen_uuids = set(
+            Zaak.objects.filter(
+                uuid__in=[zaak.uuid for _, zaak, _ in valid]
+            ).values_list("uuid", flat=True)
+        )
+        seen_identificaties = set(
+            Zaak.objects.filter(identificatie__in=identificaties).values_list(
+                "bronorganisatie", "identificatie"
+            )
+        )
+
+        unique = []
+        for line, zaak, record in valid:
+            errors = {}
+            if zaak.uuid in seen_uuids:
+                errors["uuid"] = ["Deze UUID bestaat al."]
+            identificatie = (zaak.bronorganisatie, zaak.identificatie)
+            if zaak.identificatie and identificatie in seen_identificaties:
+                errors["identificatie"] = [
+                    "Deze identificatie bestaat al voor deze bronorganisatie."
+                ]
+            if errors:
+                result.errors.append((line, errors))
+                continue
+
+            seen_uuids.add(zaak.uuid)
+            seen_identificaties.add(identificatie)
+            unique.append((line, zaak, record))
+        return unique
+
+    def _resolve_hoofdzaken(self, valid: list, result: ImportResult) -> list:
+        """
+        Look up the existing hoofdzaken, dropping deelzaken with an unknown
+        hoofdzaak.
+
+        Existing hoofdzaken are set directly, hoofdzaken in the same chunk are
+        resolved after the insert.
+        """
+        referenced = {zaak._hoofdzaak_uuid for _, zaak, _ in valid} - {None}
+        if not referenced:
+            return valid
+
+        existing = dict(
+            Zaak.objects.filter(uuid__in=referenced).values_list("uuid", "pk")
+        )
+        in_chunk = set()
+        resolved = []
+        for line, zaak, record in valid:
+            if zaak._hoofdzaak_uuid in existing:
+                zaak.hoofdzaak_id = existing[zaak._hoofdzaak_uuid]
+                zaak._hoofdzaak_uuid = None
+            elif zaak._hoofdzaak_uuid and zaak._hoofdzaak_uuid not in in_chunk:
+                result.errors.append(
+                    (line, {"hoofdzaak": ["De hoofdzaak bestaat niet."]})
+                )
+                continue
+            in_chunk.add(zaak.uuid)
+            resolved.append((line, zaak, record))
+        return resolved
+
+    def _assign_identificaties(self, zaken: List[Zaak]) -> None:
+        missing = {}
+        for zaak in zaken:
+            if not zaak.identificatie:
+                key = (zaak.bronorganisatie, zaak.registratiedatum.year)
+                missing.setdefault(key, []).append(zaak)
+
+        # one block of identificaties per bronorganisatie and year
+        for (bronorganisatie, year), zaken_for_year in missing.items():
+            identificaties = reserve_identificaties(
+                Zaak, bronorganisatie, year, len(zaken_for_year)
+            )
+            for zaak, identificatie in zip(zaken_for_year, identificaties):
+                zaak.identificatie = identificatie
+
+    @staticmethod
+    def _build_related(
+        name: str, model: models.Model, valid: List[Tuple[int, Zaak, dict]]
+    ) -> List[models.Model]:
+        fields = get_export_fields(model)
+        objects = []
+        for _, zaak, record in valid:
+            items = record.get(name) or []
+            if isinstance(items, dict):
+                items = [items]
+            for item in items:
+                values = {field: item[field] for field in fields if field in item}
+                objects.append(model(zaak=zaak, **values))
+        return objects
+
+
+def read_ndjson(stream) -> Iterator[dict]:
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_csv(stream) -> Iterator[dict]:
+    """
+    Read ZAAKen from CSV, empty cells are treated as missing values.
+
+    Geometries and arrays are expected as JSON, as written by
+    :class:`zrc.datamodel.export.ColumnarWriter`.
+    """
+    json_fields = {
+        field.attname
+        for field in Zaak._meta.concrete_fields
+        if isinstance(field, (ArrayField, GeometryField))
+    }
+    for row in csv.DictReader(stream):
+        record = {key: value for key, value in row.items() if value != ""}
+        for field in json_fields & record.keys():
+            record[field] = json.loads(record[field])
+        yield record
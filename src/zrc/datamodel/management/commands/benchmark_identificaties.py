@@ -0,0 +1,91 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from zrc.datamodel.identificatie import get_sequence_name, reserve_numbers
+from zrc.datamodel.models import Zaak
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the number of zaken that can be created per second concurrently, "
+        "each with a generated identificatie. The zaken are not kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=8, help="Number of concurrent clients"
+        )
+        parser.add_argument(
+            "--count", type=int, default=200, help="Number of zaken per client"
+        )
+        parser.add_argument(
+            "--bronorganisatie",
+            default="000000000",
+            help="Bronorganisatie without existing zaken to use for the benchmark",
+        )
+
+    def handle(self, **options):
+        self.bronorganisatie = options["bronorganisatie"]
+        threads, count = options["threads"], options["count"]
+
+        # the creates are rolled back, set up the sequence beforehand
+        reserve_numbers(Zaak, self.bronorganisatie, timezone.now().date().year)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(self._create, count) for _ in range(threads)]
+            durations = [future.result() for future in futures]
+        duration = time.monotonic() - start
+
+        self._drop_sequence()
+
+        total = threads * count
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {total} zaken in {duration:.1f}s with {threads} clients: "
+                f"{total / duration:.0f} zaken/s, "
+                f"{1000 * sum(durations) / total:.1f} ms per zaak"
+            )
+        )
+
+    def _create(self, count: int) -> float:
+        duration = 0
+        try:
+            for _ in range(count):
+                start = time.monotonic()
+                try:
+                    with transaction.atomic():
+                        Zaak.objects.create(
+                            zaaktype="https://example.com/zaaktypen/benchmark",
+                            bronorganisatie=self.bronorganisatie,
+                            verantwoordelijke_organisatie=self.bronorganisatie,
+                            startdatum=timezone.now().date(),
+                            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                        )
+                        raise Rollback
+                except Rollback:
+                    pass
+                duration += time.monotonic() - start
+        finally:
+            # every thread has its own database connection
+            connection.close()
+        return duration
+
+    def _drop_sequence(self):
+        sequence = get_sequence_name(
+            Zaak, self.bronorganisatie, timezone.now().date().year
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DROP SEQUENCE IF EXISTS {connection.ops.quote_name(sequence)}"
+            )
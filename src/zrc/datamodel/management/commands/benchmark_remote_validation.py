@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from zrc.api.auth import get_auth
+from zrc.api.prefetch import _fetch_links, _get
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the number of remote validations per second, with the links "
+        "fetched one after another and concurrently"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "urls",
+            nargs="+",
+            help="URLs validated together, e.g. a zaaktype, statustype and roltype",
+        )
+        parser.add_argument(
+            "--rounds", type=int, default=20, help="Number of validations per mode"
+        )
+
+    def handle(self, **options):
+        links = [(url, {"headers": get_auth(url)}) for url in options["urls"]]
+
+        def sequential():
+            for url, kwargs in links:
+                _get(url, **kwargs)
+
+        def concurrent():
+            _fetch_links(links)
+
+        modes = [
+            ("sequential", sequential),
+            (f"concurrent ({settings.REMOTE_VALIDATION_WORKERS} workers)", concurrent),
+        ]
+
+        rates = []
+        for label, fetch in modes:
+            # set up the connections outside of the measurement
+            fetch()
+
+            start = time.monotonic()
+            for _ in range(options["rounds"]):
+                fetch()
+            duration = time.monotonic() - start
+
+            rates.append(options["rounds"] / duration)
+            self.stdout.write(
+                f"  {label}: {rates[-1]:.1f} validations/s, "
+                f"{1000 * duration / options['rounds']:.0f} ms per validation"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Concurrent validation: {rates[1] / rates[0]:.1f}x the validations/s"
+            )
+        )
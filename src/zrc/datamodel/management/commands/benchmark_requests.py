@@ -0,0 +1,83 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import close_old_connections, connections
+from django.test import Client
+
+from vng_api_common.tests import generate_jwt_auth
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the number of API requests per second with a new database "
+        "connection for every request and with persistent connections, with and "
+        "without health checks"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("client_id", help="Client ID of an existing JWT secret")
+        parser.add_argument("secret", help="Secret of the client ID")
+        parser.add_argument(
+            "--path",
+            default="/api/v1/zaken?pageSize=1",
+            help="Path of the (GET) request to measure",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Number of requests per mode"
+        )
+
+    def handle(self, **options):
+        host = next(
+            (host for host in settings.ALLOWED_HOSTS if "*" not in host), "localhost"
+        )
+        client = Client(
+            HTTP_HOST=host,
+            HTTP_AUTHORIZATION=generate_jwt_auth(
+                options["client_id"], options["secret"]
+            ),
+            HTTP_ACCEPT_CRS="EPSG:4326",
+        )
+
+        max_age = settings.DATABASES["default"]["CONN_MAX_AGE"] or 60
+        modes = [
+            ("new connection per request", 0, False),
+            (f"persistent (CONN_MAX_AGE={max_age})", max_age, False),
+            ("persistent with health checks", max_age, True),
+        ]
+
+        rates = []
+        for label, conn_max_age, health_checks in modes:
+            connections.close_all()
+            for connection in connections.all():
+                connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+                connection.settings_dict["CONN_HEALTH_CHECKS"] = health_checks
+
+            # warm up the caches outside of the measurement
+            response = client.get(options["path"])
+            if response.status_code != 200:
+                self.stderr.write(f"{options['path']}: {response.status_code}")
+                return
+
+            start = time.monotonic()
+            for _ in range(options["requests"]):
+                # the test client doesn't close the connections like the request
+                # handler does
+                close_old_connections()
+                client.get(options["path"])
+                close_old_connections()
+            duration = time.monotonic() - start
+
+            rates.append(options["requests"] / duration)
+            self.stdout.write(
+                f"  {label}: {rates[-1]:.0f} requests/s, "
+                f"{1000 * duration / options['requests']:.1f} ms per request"
+            )
+
+        connections.close_all()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Persistent connections: {rates[1] / rates[0]:.1f}x the requests/s, "
+                f"{rates[2] / rates[0]:.1f}x with health checks"
+            )
+        )
@@ -0,0 +1,131 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from vng_api_common.constants import (
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+)
+
+from zrc.api.filters import RolFilter, ZaakFilter
+from zrc.datamodel.models import BetrokkeneIndex, NatuurlijkPersoon, Rol, Zaak
+
+BRONORGANISATIE = "000000000"
+ROLTYPE = "https://example.com/ztc/api/v1/roltypen/benchmark"
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the betrokkene identificatie filters of /zaken and /rollen on a "
+        "large number of rollen. The generated zaken and rollen are not kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--zaken", type=int, default=400_000, help="Number of zaken to generate"
+        )
+        parser.add_argument(
+            "--rollen", type=int, default=5, help="Number of rollen per zaak"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10_000, help="Number of zaken per insert"
+        )
+
+    def handle(self, **options):
+        try:
+            with transaction.atomic():
+                self._generate(
+                    options["zaken"], options["rollen"], options["batch_size"]
+                )
+                self._benchmark()
+                raise Rollback
+        except Rollback:
+            pass
+
+    def _generate(self, zaken: int, rollen: int, batch_size: int):
+        start = time.monotonic()
+        today = timezone.now().date()
+        for offset in range(0, zaken, batch_size):
+            batch = Zaak.objects.bulk_create(
+                Zaak(
+                    identificatie=f"BENCHMARK-{number}",
+                    bronorganisatie=BRONORGANISATIE,
+                    verantwoordelijke_organisatie=BRONORGANISATIE,
+                    zaaktype="https://example.com/ztc/api/v1/zaaktypen/benchmark",
+                    startdatum=today,
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                )
+                for number in range(offset, min(offset + batch_size, zaken))
+            )
+            batch_rollen = Rol.objects.bulk_create(
+                Rol(
+                    zaak=zaak,
+                    betrokkene_type=RolTypes.natuurlijk_persoon,
+                    roltype=ROLTYPE,
+                    omschrijving="Belanghebbende",
+                    omschrijving_generiek=RolOmschrijving.belanghebbende,
+                    roltoelichting="benchmark",
+                )
+                for zaak in batch
+                for _ in range(rollen)
+            )
+            NatuurlijkPersoon.objects.bulk_create(
+                NatuurlijkPersoon(rol=rol, inp_bsn=self._get_bsn(rol.zaak.pk, index))
+                for index, rol in enumerate(batch_rollen)
+            )
+            # bulk_create doesn't send the signals maintaining the index
+            BetrokkeneIndex.objects.rebuild([rol.pk for rol in batch_rollen])
+
+        with connection.cursor() as cursor:
+            for model in (Zaak, Rol, NatuurlijkPersoon, BetrokkeneIndex):
+                cursor.execute(
+                    f"ANALYZE {connection.ops.quote_name(model._meta.db_table)}"
+                )
+
+        self.stdout.write(
+            f"Generated {zaken} zaken with {zaken * rollen} rollen in "
+            f"{time.monotonic() - start:.1f}s"
+        )
+
+    @staticmethod
+    def _get_bsn(zaak_pk: int, index: int) -> str:
+        # a citizen has rollen in 10 zaken, and several rollen within a zaak
+        return str(100_000_000 + (zaak_pk // 10) * 2 + index % 2)
+
+    def _benchmark(self):
+        bsn = NatuurlijkPersoon.objects.values_list("inp_bsn", flat=True).first()
+
+        for label, filterset in (
+            (
+                "/zaken",
+                ZaakFilter(
+                    {"rol__betrokkene_identificatie__natuurlijk_persoon__inp_bsn": bsn},
+                    queryset=Zaak.objects.order_by("-pk"),
+                ),
+            ),
+            (
+                "/rollen",
+                RolFilter(
+                    {"betrokkene_identificatie__natuurlijk_persoon__inp_bsn": bsn},
+                    queryset=Rol.objects.order_by("-pk"),
+                ),
+            ),
+        ):
+            queryset = filterset.qs
+            start = time.monotonic()
+            count = len(queryset[:100])
+            duration = time.monotonic() - start
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{label}: {count} results for BSN {bsn} in {1000 * duration:.1f} ms"
+                )
+            )
+            self.stdout.write(queryset.explain(analyze=True))
@@ -0,0 +1,61 @@
+import time
+import tracemalloc
+
+from django.core.management import BaseCommand
+
+from rest_framework.test import APIRequestFactory
+
+from zrc.api.serializers import RolSerializer, ZaakObjectSerializer
+from zrc.api.serializers.cached import CachedFieldsMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the time and memory needed to construct the polymorphic "
+        "serializers and their fields, with and without cached field trees"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=1000, help="Number of serializers per run"
+        )
+
+    def handle(self, **options):
+        count = options["count"]
+        request = APIRequestFactory().get("/")
+
+        for serializer_class in (ZaakObjectSerializer, RolSerializer):
+            self.stdout.write(serializer_class.__name__)
+
+            def cached():
+                serializer = serializer_class(context={"request": request})
+                return serializer.fields
+
+            def uncached():
+                serializer = serializer_class(context={"request": request})
+                # the field construction of DRF, without the cache
+                return super(CachedFieldsMixin, serializer).get_fields()
+
+            for label, construct in (("uncached", uncached), ("cached", cached)):
+                duration, allocated = self._measure(construct, count)
+                self.stdout.write(
+                    f"  {label:>8}: {1e6 * duration / count:.0f} µs, "
+                    f"{allocated / 1024:.1f} KiB per serializer"
+                )
+
+    def _measure(self, construct, count: int):
+        construct()  # build the cached field tree
+
+        start = time.perf_counter()
+        for _ in range(count):
+            construct()
+        duration = time.perf_counter() - start
+
+        # memory allocated while constructing a single serializer
+        tracemalloc.start()
+        fields = construct()
+        allocated = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del fields
+
+        return duration, allocated
@@ -0,0 +1,166 @@
+import time
+from unittest.mock import patch
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from vng_api_common.constants import (
+    RolOmschrijving,
+    RolTypes,
+    VertrouwelijkheidsAanduiding,
+    ZaakobjectTypes,
+)
+
+from zrc.datamodel.deletion import delete_zaken
+from zrc.datamodel.models import (
+    NatuurlijkPersoon,
+    Pand,
+    Rol,
+    Status,
+    Zaak,
+    ZaakEigenschap,
+    ZaakInformatieObject,
+    ZaakObject,
+)
+from zrc.sync.signals import unlink_remote_relations
+
+BRONORGANISATIE = "000000000"
+CATALOGUS = "https://example.com/ztc/api/v1"
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare deleting a zaak with many related objects with Django's collector "
+        "and with the set-based delete. The remote relations are simulated with "
+        "a fixed latency. Nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--children",
+            type=int,
+            default=1000,
+            help="Number of statussen, rollen, zaakobjecten and eigenschappen",
+        )
+        parser.add_argument(
+            "--informatieobjecten",
+            type=int,
+            default=20,
+            help="Number of zaakinformatieobjecten, each with a remote relation",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=50,
+            help="Simulated duration of deleting a remote relation, in ms",
+        )
+
+    def handle(self, **options):
+        latency = options["latency"] / 1000
+
+        def sync_delete(relation):
+            time.sleep(latency)
+
+        with patch("zrc.sync.signals.sync_delete_zio", side_effect=sync_delete):
+            for label, delete in (
+                ("collector", self._delete_collector),
+                ("set-based", self._delete_set_based),
+            ):
+                try:
+                    with transaction.atomic():
+                        zaak = self._generate(
+                            options["children"], options["informatieobjecten"]
+                        )
+                        start = time.perf_counter()
+                        with CaptureQueriesContext(connection) as queries:
+                            delete(zaak)
+                        duration = time.perf_counter() - start
+                        raise Rollback
+                except Rollback:
+                    pass
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{label:>10}: {1000 * duration:.0f} ms, "
+                        f"{len(queries)} queries"
+                    )
+                )
+
+    @staticmethod
+    def _delete_collector(zaak: Zaak):
+        zaak.delete()
+
+    @staticmethod
+    def _delete_set_based(zaak: Zaak):
+        unlink_remote_relations([zaak.pk])
+        delete_zaken([zaak.pk])
+
+    def _generate(self, children: int, informatieobjecten: int) -> Zaak:
+        per_type = max(children // 4, 1)
+        zaak = Zaak.objects.bulk_create(
+            [
+                Zaak(
+                    identificatie="BENCHMARK-DELETE",
+                    bronorganisatie=BRONORGANISATIE,
+                    verantwoordelijke_organisatie=BRONORGANISATIE,
+                    zaaktype=f"{CATALOGUS}/zaaktypen/benchmark",
+                    startdatum=timezone.now().date(),
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+                )
+            ]
+        )[0]
+
+        Status.objects.bulk_create(
+            Status(
+                zaak=zaak,
+                statustype=f"{CATALOGUS}/statustypen/benchmark",
+                datum_status_gezet=timezone.now(),
+            )
+            for _ in range(per_type)
+        )
+        rollen = Rol.objects.bulk_create(
+            Rol(
+                zaak=zaak,
+                betrokkene_type=RolTypes.natuurlijk_persoon,
+                roltype=f"{CATALOGUS}/roltypen/benchmark",
+                omschrijving="Belanghebbende",
+                omschrijving_generiek=RolOmschrijving.belanghebbende,
+                roltoelichting="benchmark",
+            )
+            for _ in range(per_type)
+        )
+        NatuurlijkPersoon.objects.bulk_create(
+            NatuurlijkPersoon(rol=rol, inp_bsn="111222333") for rol in rollen
+        )
+        zaakobjecten = ZaakObject.objects.bulk_create(
+            ZaakObject(zaak=zaak, object_type=ZaakobjectTypes.pand)
+            for _ in range(per_type)
+        )
+        Pand.objects.bulk_create(
+            Pand(zaakobject=zaakobject, identificatie="0363100012345678")
+            for zaakobject in zaakobjecten
+        )
+        ZaakEigenschap.objects.bulk_create(
+            ZaakEigenschap(
+                zaak=zaak,
+                eigenschap=f"{CATALOGUS}/eigenschappen/benchmark",
+                _naam="benchmark",
+                waarde="benchmark",
+            )
+            for _ in range(per_type)
+        )
+        ZaakInformatieObject.objects.bulk_create(
+            ZaakInformatieObject(
+                zaak=zaak,
+                informatieobject=f"https://example.com/drc/api/v1/{index}",
+                _objectinformatieobject=f"https://example.com/drc/api/v1/oio/{index}",
+            )
+            for index in range(informatieobjecten)
+        )
+        return zaak
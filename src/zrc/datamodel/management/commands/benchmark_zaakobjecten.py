@@ -0,0 +1,145 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding, ZaakobjectTypes
+
+from zrc.api.expansion import load_zaakobjecten
+from zrc.api.serializers import ZaakObjectSerializer
+from zrc.datamodel.models import Zaak, ZaakObject
+
+BRONORGANISATIE = "000000000"
+
+# objectIdentificatie per object type used in the benchmark
+OBJECT_IDENTIFICATIES = {
+    ZaakobjectTypes.adres: {
+        "identificatie": "0363200000123456",
+        "wpl_woonplaats_naam": "Amsterdam",
+        "gor_openbare_ruimte_naam": "Dam",
+        "huisnummer": 1,
+        "huisletter": "",
+        "huisnummertoevoeging": "",
+        "postcode": "1012JS",
+    },
+    ZaakobjectTypes.buurt: {
+        "buurt_code": "AB",
+        "buurt_naam": "Burgwallen-Oude Zijde",
+        "gem_gemeente_code": "0363",
+        "wyk_wijk_code": "A0",
+    },
+    ZaakobjectTypes.pand: {"identificatie": "0363100012345678"},
+    ZaakobjectTypes.wegdeel: {
+        "type": "rijbaan",
+        "identificatie": "G0363.1234",
+        "naam": "Damrak",
+    },
+    ZaakobjectTypes.woonplaats: {
+        "identificatie": "3594",
+        "woonplaats_naam": "Amsterdam",
+    },
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare writing and reading zaakobjecten with the objectIdentificatie in "
+        "the table of the object type and stored on the zaakobject itself "
+        "(ZAAKOBJECT_COMPACT_STORAGE). The zaakobjecten are not kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=2000, help="Number of zaakobjecten per run"
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=100, help="Number of zaakobjecten per read"
+        )
+
+    def handle(self, **options):
+        try:
+            with transaction.atomic():
+                zaak = Zaak.objects.bulk_create([self._build_zaak()])[0]
+
+                results = {}
+                for label, compact in (("tables", False), ("compact", True)):
+                    with override_settings(ZAAKOBJECT_COMPACT_STORAGE=compact):
+                        results[label] = self._benchmark(
+                            label, zaak, options["count"], options["page_size"]
+                        )
+                raise Rollback
+        except Rollback:
+            pass
+
+        if results["tables"] != results["compact"]:
+            self.stderr.write("The objectIdentificatie differs between the layouts")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS("The objectIdentificatie is identical for both")
+            )
+
+    def _build_zaak(self) -> Zaak:
+        today = timezone.now().date()
+        return Zaak(
+            identificatie="BENCHMARK-ZAAKOBJECTEN",
+            bronorganisatie=BRONORGANISATIE,
+            verantwoordelijke_organisatie=BRONORGANISATIE,
+            zaaktype="https://example.com/ztc/api/v1/zaaktypen/benchmark",
+            startdatum=today,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def _benchmark(self, label: str, zaak: Zaak, count: int, page_size: int) -> list:
+        serializer = ZaakObjectSerializer()
+        object_types = list(OBJECT_IDENTIFICATIES)
+
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as write_queries:
+            created = [
+                serializer.create(
+                    {
+                        "zaak": zaak,
+                        "object_type": object_types[index % len(object_types)],
+                        "relatieomschrijving": "benchmark",
+                        "object_identificatie": dict(
+                            OBJECT_IDENTIFICATIES[
+                                object_types[index % len(object_types)]
+                            ]
+                        ),
+                    }
+                )
+                for index in range(count)
+            ]
+        write_duration = time.perf_counter() - start
+
+        pks = [zaakobject.pk for zaakobject in created]
+        representations = []
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as read_queries:
+            for offset in range(0, count, page_size):
+                page = list(
+                    ZaakObject.objects.filter(pk__in=pks[offset : offset + page_size])
+                    .select_related("zaak")
+                    .order_by("pk")
+                )
+                load_zaakobjecten(page)
+                representations += [
+                    serializer.discriminator.to_representation(zaakobject)
+                    for zaakobject in page
+                ]
+        read_duration = time.perf_counter() - start
+
+        pages = -(-count // page_size)
+        self.stdout.write(
+            f"{label:>8}: write {1000 * write_duration / count:.2f} ms and "
+            f"{len(write_queries) / count:.1f} queries per zaakobject, "
+            f"read {1000 * read_duration / pages:.1f} ms and "
+            f"{len(read_queries) / pages:.1f} queries per page of {page_size}"
+        )
+        return representations
@@ -0,0 +1,100 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from zrc.datamodel.models import ZaakObject
+from zrc.datamodel.models.core import COMPACT_OBJECT_TYPES
+
+
+def get_identificatie_fields(model) -> list:
+    return [
+        field
+        for field in model._meta.concrete_fields
+        if not field.primary_key and not field.is_relation
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the objectIdentificatie of existing zaakobjecten of the flat object "
+        "types from the table of the type to the zaakobject itself, or back with "
+        "--expand"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--expand",
+            action="store_true",
+            help="Move the objectIdentificatie back to the tables of the types",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of zaakobjecten to process per transaction",
+        )
+
+    def handle(self, **options):
+        chunk_size = options["chunk_size"]
+        move = self._expand if options["expand"] else self._compact
+
+        total = 0
+        for object_type, relation in COMPACT_OBJECT_TYPES.items():
+            model = ZaakObject._meta.get_field(relation).related_model
+            moved = 0
+            while True:
+                with transaction.atomic():
+                    count = move(object_type, model, chunk_size)
+                if not count:
+                    break
+                moved += count
+
+            if moved:
+                self.stdout.write(f"  {object_type}: {moved}")
+            total += moved
+
+        action = "Expanded" if options["expand"] else "Compacted"
+        self.stdout.write(self.style.SUCCESS(f"{action} {total} zaakobjecten"))
+
+    def _compact(self, object_type: str, model, chunk_size: int) -> int:
+        objects = list(
+            model.objects.filter(
+                zaakobject__object_type=object_type,
+                zaakobject___object_identificatie__isnull=True,
+            )
+            .select_for_update()
+            .order_by("pk")[:chunk_size]
+        )
+        fields = get_identificatie_fields(model)
+
+        zaakobjecten = [
+            ZaakObject(
+                pk=obj.zaakobject_id,
+                _object_identificatie={
+                    field.attname: field.value_from_object(obj) for field in fields
+                },
+            )
+            for obj in objects
+        ]
+        ZaakObject.objects.bulk_update(zaakobjecten, ["_object_identificatie"])
+        model.objects.filter(pk__in=[obj.pk for obj in objects]).delete()
+        return len(objects)
+
+    def _expand(self, object_type: str, model, chunk_size: int) -> int:
+        zaakobjecten = list(
+            ZaakObject.objects.filter(
+                object_type=object_type, _object_identificatie__isnull=False
+            )
+            .select_for_update()
+            .order_by("pk")[:chunk_size]
+        )
+
+        model.objects.bulk_create(
+            [
+                model(zaakobject_id=zaakobject.pk, **zaakobject._object_identificatie)
+                for zaakobject in zaakobjecten
+            ]
+        )
+        ZaakObject.objects.filter(pk__in=[obj.pk for obj in zaakobjecten]).update(
+            _object_identificatie=None
+        )
+        return len(zaakobjecten)
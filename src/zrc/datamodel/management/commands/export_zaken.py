@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max, Min
+
+from zrc.datamodel.export import ColumnarWriter, NDJSONWriter, ZaakExporter
+from zrc.datamodel.models import Zaak
+
+STATE_FILE = "export-state.json"
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_COLUMNAR = "columnar"
+
+FILTER_FIELDS = ("bronorganisatie", "zaaktype")
+
+
+class Command(BaseCommand):
+    help = (
+        "Export zaken with their statussen, resultaat, rollen, zaakobjecten and "
+        "eigenschappen. Interrupted exports can be continued with --resume."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", help="Directory to write the export to")
+        parser.add_argument(
+            "--format",
+            choices=(FORMAT_NDJSON, FORMAT_COLUMNAR),
+            default=FORMAT_NDJSON,
+            help=(
+                "ndjson writes one zaak with its related resources per line, "
+                "columnar writes one CSV file per resource"
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of zaken to fetch related resources for at once",
+        )
+        parser.add_argument(
+            "--partitions",
+            type=int,
+            default=1,
+            help="Number of primary key ranges to export in parallel",
+        )
+        parser.add_argument("--bronorganisatie", help="Only export these zaken")
+        parser.add_argument("--zaaktype", help="Only export these zaken")
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=(
+                "Continue a previous export in the same directory, with the "
+                "format and filters it was started with. The files are truncated "
+                "to the last recorded chunk, the chunk that was being written "
+                "when the export was interrupted is exported again"
+            ),
+        )
+
+    def handle(self, **options):
+        self.directory = options["directory"]
+        self.format = options["format"]
+        self.chunk_size = options["chunk_size"]
+        self.state_lock = threading.Lock()
+
+        filters = {field: options[field] for field in FILTER_FIELDS if options[field]}
+
+        if options["resume"]:
+            self.state = self._read_state(filters)
+            self.queryset = Zaak.objects.filter(**self.state["filters"])
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            self.queryset = Zaak.objects.filter(**filters)
+            self.state = {
+                "format": self.format,
+                "filters": filters,
+                "partitions": self._get_partitions(options["partitions"]),
+            }
+            self._write_state()
+
+        start = time.monotonic()
+        partitions = self.state["partitions"]
+        if len(partitions) == 1:
+            counts = [self._export_partition(0, resume=options["resume"])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+                futures = [
+                    executor.submit(
+                        self._export_partition_thread, index, options["resume"]
+                    )
+                    for index in range(len(partitions))
+                ]
+                counts = [future.result() for future in futures]
+
+        total = sum(counts)
+        duration = time.monotonic() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {total} zaken in {duration:.1f}s "
+                f"({total / max(duration, 0.001):.0f} zaken/s)"
+            )
+        )
+
+    def _get_partitions(self, number: int) -> list:
+        bounds = self.queryset.aggregate(min_pk=Min("pk"), max_pk=Max("pk"))
+        if bounds["min_pk"] is None:
+            return [{"last": 0, "end": 0}]
+
+        start, end = bounds["min_pk"] - 1, bounds["max_pk"]
+        size = max((end - start) // number, 1)
+        partitions = []
+        for index in range(number):
+            partition_end = end if index == number - 1 else start + size
+            partitions.append({"last": start, "end": partition_end})
+            start = partition_end
+            if start >= end:
+                break
+        return partitions
+
+    def _read_state(self, filters: dict) -> dict:
+        path = os.path.join(self.directory, STATE_FILE)
+        if not os.path.exists(path):
+            raise CommandError(f"No export to resume in {self.directory}")
+
+        with open(path) as infile:
+            state = json.load(infile)
+        if state["format"] != self.format:
+            raise CommandError(f"The export was started in {state['format']} format")
+        # the filters default to the ones the export was started with
+        for field, value in filters.items():
+            if state["filters"].get(field) != value:
+                raise CommandError(
+                    f"The export was started with --{field}="
+                    f"{state['filters'].get(field, '')}"
+                )
+        return state
+
+    def _write_state(self):
+        path = os.path.join(self.directory, STATE_FILE)
+        with open(f"{path}.tmp", "w") as outfile:
+            json.dump(self.state, outfile)
+        os.replace(f"{path}.tmp", path)
+
+    def _export_partition_thread(self, index: int, resume: bool) -> int:
+        try:
+            return self._export_partition(index, resume)
+        finally:
+            # every worker thread has its own database connection
+            connection.close()
+
+    def _export_partition(self, index: int, resume: bool) -> int:
+        partition = self.state["partitions"][index]
+        exporter = ZaakExporter(
+            queryset=self.queryset,
+            chunk_size=self.chunk_size,
+            start_after=partition["last"],
+            end=partition["end"],
+        )
+
+        # continue after the last recorded chunk, a partially written chunk is
+        # discarded and exported again
+        offset = partition["offset"] if resume else None
+        if self.format == FORMAT_NDJSON:
+            path = os.path.join(self.directory, f"zaken-{index}.ndjson")
+            writer = NDJSONWriter(path, offset)
+        else:
+            path = os.path.join(self.directory, f"part-{index}")
+            writer = ColumnarWriter(path, offset)
+
+        count = 0
+        try:
+            if not resume:
+                with self.state_lock:
+                    partition["offset"] = writer.tell()
+                    self._write_state()
+
+            for last_pk, records in exporter.iter_chunks():
+                count += writer.write(records)
+                writer.flush()
+                # only record progress once the chunk is written
+                with self.state_lock:
+                    partition.update(last=last_pk, offset=writer.tell())
+                    self._write_state()
+                self.stdout.write(f"  partition {index}: {count} zaken")
+        finally:
+            writer.close()
+        return count
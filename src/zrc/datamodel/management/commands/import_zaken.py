@@ -0,0 +1,59 @@
+import time
+
+from django.core.management import BaseCommand
+
+from zrc.datamodel.importer import ZaakImporter, read_csv, read_ndjson
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+
+READERS = {FORMAT_NDJSON: read_ndjson, FORMAT_CSV: read_csv}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import (legacy) zaken in bulk, bypassing the API. No notifications are "
+        "sent and nothing is synchronised with the DRC."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="NDJSON or CSV file to import")
+        parser.add_argument(
+            "--format",
+            choices=tuple(READERS),
+            help="Format of the file, derived from the extension by default",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of zaken to insert per transaction",
+        )
+
+    def handle(self, **options):
+        path = options["file"]
+        format = options["format"] or (
+            FORMAT_CSV if path.lower().endswith(".csv") else FORMAT_NDJSON
+        )
+        importer = ZaakImporter(chunk_size=options["chunk_size"])
+
+        imported = failed = 0
+        start = time.monotonic()
+        with open(path, newline="" if format == FORMAT_CSV else None) as infile:
+            for result in importer.run(READERS[format](infile)):
+                imported += result.imported
+                failed += len(result.errors)
+                for line, errors in result.errors:
+                    self.stderr.write(f"  record {line}: {errors}")
+                duration = time.monotonic() - start
+                self.stdout.write(
+                    f"  {imported} zaken imported "
+                    f"({imported / max(duration, 0.001):.0f} zaken/s)"
+                )
+
+        duration = time.monotonic() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported} zaken in {duration:.1f}s, {failed} rejected"
+            )
+        )
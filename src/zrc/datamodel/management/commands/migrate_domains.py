@@ -1,5 +1,12 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 from django.apps import apps
 from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F, Func, Max, Min, Value
+
+from vng_api_common.caching.signals import is_etag_model
 
 ZRC = ("https://ref.tst.vng.cloud/zrc/", "https://zaken-api.vng.cloud/")
 DRC = ("https://ref.tst.vng.cloud/drc/", "https://documenten-api.vng.cloud/")
@@ -41,13 +48,97 @@ MAPPING = BASE_MAPPING + (
     ("datamodel.ZaakEigenschap", "eigenschap", *ZTC),
     ("datamodel.ZaakInformatieObject", "informatieobject", *DRC),
     ("datamodel.ZaakBesluit", "besluit", *BRC),
+    ("datamodel.ZaakSummary", "statustype", *ZTC),
+    ("datamodel.ZaakSummary", "resultaattype", *ZTC),
 )
 
+# models without an ETag of their own, that are part of the representation
+# of a model with an ETag - the ETags of the latter must be cleared as well
+ETAG_PARENTS = {
+    "datamodel.RelevanteZaakRelatie": "zaak",
+}
+
+
+def group_per_table(mapping: tuple) -> dict:
+    """
+    Group the rewrites per table that they update.
+
+    The rewrites of a model in ``ETAG_PARENTS`` also update the ETags of the
+    parent model, so they are grouped with the parent model.
+    """
+    groups = {}
+    for model, field, old, new in mapping:
+        group = model
+        if model in ETAG_PARENTS:
+            parent_field = apps.get_model(model)._meta.get_field(ETAG_PARENTS[model])
+            group = parent_field.related_model._meta.label
+        groups.setdefault(group, []).append((model, field, old, new))
+    return groups
+
+
+class RegexpReplace(Func):
+    function = "REGEXP_REPLACE"
+
+
+def replace_prefix(field: str, old: str, new: str) -> Func:
+    """
+    Build the expression replacing the ``old`` prefix of ``field`` by ``new``.
+    """
+    pattern = "^" + re.escape(old)
+    # backslashes are special in the replacement string
+    replacement = new.replace("\\", "\\\\")
+    return RegexpReplace(F(field), Value(pattern), Value(replacement))
+
 
 class Command(BaseCommand):
     help = "Update data references from old to new domains"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help=(
+                "Rewrite the references with set-based UPDATE queries instead "
+                "of saving every object. Model save logic and signals are "
+                "bypassed, the ETags of affected resources are cleared."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of objects that would be updated.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10000,
+            help="Primary key range to update per query in bulk mode.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of tables to process in parallel in bulk mode.",
+        )
+
     def handle(self, **options):
+        if options["dry_run"]:
+            self.dry_run()
+        elif options["bulk"]:
+            self.bulk_update(options["chunk_size"], options["workers"])
+        else:
+            self.update_objects()
+
+    def dry_run(self):
+        for model, field, old, new in MAPPING:
+            count = (
+                apps.get_model(model)
+                .objects.filter(**{f"{field}__startswith": old})
+                .count()
+            )
+            self.stdout.write(f"{model}.{field}: {count} objects to update")
+
+    def update_objects(self):
         for model, field, old, new in MAPPING:
             self.stdout.write(f"Migrating {model}.{field}")
             model = apps.get_model(model)
@@ -57,3 +148,64 @@ class Command(BaseCommand):
             for obj in objects:
                 setattr(obj, field, getattr(obj, field).replace(old, new, 1))
                 obj.save()
+
+    def bulk_update(self, chunk_size: int, workers: int):
+        # a table is only updated by the worker processing its group
+        groups = group_per_table(MAPPING)
+
+        if workers <= 1:
+            for rewrites in groups.values():
+                self._bulk_update_group(rewrites, chunk_size)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._bulk_update_group_thread, rewrites, chunk_size)
+                for rewrites in groups.values()
+            ]
+            # re-raise any errors
+            for future in futures:
+                future.result()
+
+    def _bulk_update_group_thread(self, rewrites: list, chunk_size: int):
+        try:
+            self._bulk_update_group(rewrites, chunk_size)
+        finally:
+            # every worker thread has its own database connection
+            connection.close()
+
+    def _bulk_update_group(self, rewrites: list, chunk_size: int):
+        for label, field, old, new in rewrites:
+            model = apps.get_model(label)
+            updated = self._bulk_update_field(model, field, old, new, chunk_size)
+            self.stdout.write(f"{label}.{field}: updated {updated} objects")
+
+    def _bulk_update_field(
+        self, model, field: str, old: str, new: str, chunk_size: int
+    ) -> int:
+        label = model._meta.label
+        queryset = model.objects.filter(**{f"{field}__startswith": old})
+        bounds = queryset.aggregate(min_pk=Min("pk"), max_pk=Max("pk"))
+        if bounds["min_pk"] is None:
+            return 0
+
+        values = {field: replace_prefix(field, old, new)}
+        # the representation changes, so the ETag must be recalculated
+        if is_etag_model(model):
+            values["_etag"] = ""
+        parent_field = ETAG_PARENTS.get(label)
+
+        updated = 0
+        for start in range(bounds["min_pk"], bounds["max_pk"] + 1, chunk_size):
+            chunk = queryset.filter(pk__gte=start, pk__lt=start + chunk_size)
+            with transaction.atomic():
+                if parent_field:
+                    self._clear_parent_etags(model, parent_field, chunk)
+                updated += chunk.update(**values)
+            self.stdout.write(f"  {label}.{field}: {updated} updated...")
+        return updated
+
+    def _clear_parent_etags(self, model, parent_field: str, chunk):
+        parent_model = model._meta.get_field(parent_field).related_model
+        parent_ids = chunk.values(f"{parent_field}_id")
+        parent_model.objects.filter(pk__in=parent_ids).update(_etag="")
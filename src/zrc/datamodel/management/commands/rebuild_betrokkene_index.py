@@ -0,0 +1,46 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from zrc.datamodel.models import BetrokkeneIndex, Rol
+
+
+class Command(BaseCommand):
+    help = "(Re)build the denormalised betrokkene index from the rollen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rollen to process per transaction",
+        )
+
+    def handle(self, **options):
+        chunk_size = options["chunk_size"]
+        total = Rol.objects.count()
+        self.stdout.write(f"Rebuilding the betrokkene index of {total} rollen...")
+
+        processed = 0
+        entries = 0
+        last_pk = 0
+        while True:
+            rol_ids = list(
+                Rol.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not rol_ids:
+                break
+
+            with transaction.atomic():
+                entries += BetrokkeneIndex.objects.rebuild(rol_ids)
+
+            last_pk = rol_ids[-1]
+            processed += len(rol_ids)
+            self.stdout.write(f"  {processed}/{total}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {entries} betrokkene index entries of {processed} rollen"
+            )
+        )
@@ -0,0 +1,42 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from zrc.datamodel.models import Zaak, ZaakSummary
+
+
+class Command(BaseCommand):
+    help = "(Re)build the denormalised zaak summaries from statussen, resultaten and rollen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of zaken to process per transaction",
+        )
+
+    def handle(self, **options):
+        chunk_size = options["chunk_size"]
+        total = Zaak.objects.count()
+        self.stdout.write(f"Rebuilding summaries of {total} zaken...")
+
+        processed = 0
+        last_pk = 0
+        while True:
+            zaak_ids = list(
+                Zaak.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:chunk_size]
+            )
+            if not zaak_ids:
+                break
+
+            with transaction.atomic():
+                ZaakSummary.objects.ensure_exists(zaak_ids)
+                ZaakSummary.objects.filter(zaak_id__in=zaak_ids).refresh()
+
+            last_pk = zaak_ids[-1]
+            processed += len(zaak_ids)
+            self.stdout.write(f"  {processed}/{total}")
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {processed} zaak summaries"))
@@ -0,0 +1,114 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management import BaseCommand
+from django.db import connections
+
+from zrc.datamodel.archiving import get_recalculable_zaken, recalculate
+from zrc.datamodel.models import ResultaatTypeArchiefregel
+from zrc.utils.exceptions import DetermineProcessEndDateException
+
+
+def _init_worker():
+    django.setup()
+    # never share the connection of the parent process
+    connections.close_all()
+
+
+def _recalculate(resultaattype: str, zaak_ids: list) -> int:
+    regel = ResultaatTypeArchiefregel.objects.get(resultaattype=resultaattype)
+    return recalculate(regel, zaak_ids)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the archiefnominatie and archiefactiedatum of closed zaken "
+        "that are not archived yet, from the archiving rules of their resultaattype"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resultaattype",
+            action="append",
+            help="Only recalculate the zaken with this resultaattype (repeatable)",
+        )
+        parser.add_argument(
+            "--sync",
+            action="store_true",
+            help="Synchronise the archiving rules from the Catalogi API first",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of zaken to update per statement",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes",
+        )
+
+    def handle(self, **options):
+        chunk_size = options["chunk_size"]
+        zaken = get_recalculable_zaken()
+        resultaattypen = options["resultaattype"] or sorted(
+            zaken.order_by()
+            .values_list("resultaat__resultaattype", flat=True)
+            .distinct()
+        )
+
+        start = time.monotonic()
+        tasks = []
+        for resultaattype in resultaattypen:
+            # every rule is retrieved at most once
+            try:
+                if options["sync"]:
+                    ResultaatTypeArchiefregel.objects.sync(resultaattype)
+                else:
+                    ResultaatTypeArchiefregel.objects.get_for_resultaattype(
+                        resultaattype
+                    )
+            except Exception as exc:
+                self.stderr.write(f"  {resultaattype}: {exc}")
+                continue
+
+            zaak_ids = list(
+                get_recalculable_zaken(resultaattype)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            for index in range(0, len(zaak_ids), chunk_size):
+                tasks.append((resultaattype, zaak_ids[index : index + chunk_size]))
+
+        total = self._run(tasks, options["workers"])
+
+        duration = time.monotonic() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recalculated {total} zaken of {len(resultaattypen)} "
+                f"resultaattypen in {duration:.1f}s"
+            )
+        )
+
+    def _run(self, tasks: list, workers: int) -> int:
+        if workers == 1:
+            return sum(self._report(task, _recalculate, *task) for task in tasks)
+
+        # the worker processes open their own connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [(task, pool.submit(_recalculate, *task)) for task in tasks]
+            return sum(self._report(task, future.result) for task, future in futures)
+
+    def _report(self, task: tuple, func, *args) -> int:
+        resultaattype, zaak_ids = task
+        try:
+            updated = func(*args)
+        except DetermineProcessEndDateException as exc:
+            self.stderr.write(f"  {resultaattype}: {exc}")
+            return 0
+        self.stdout.write(f"  {resultaattype}: {updated}/{len(zaak_ids)} zaken")
+        return updated
@@ -0,0 +1,34 @@
+from django.core.management import BaseCommand
+
+from zrc.datamodel.models import Resultaat, ResultaatTypeArchiefregel
+
+
+class Command(BaseCommand):
+    help = (
+        "Synchronise the archiving rules of all resultaattypen in use from the "
+        "Catalogi API"
+    )
+
+    def handle(self, **options):
+        resultaattypen = set(
+            Resultaat.objects.values_list("resultaattype", flat=True).distinct()
+        ) | set(
+            ResultaatTypeArchiefregel.objects.values_list("resultaattype", flat=True)
+        )
+
+        failed = 0
+        for resultaattype in sorted(resultaattypen):
+            try:
+                regel = ResultaatTypeArchiefregel.objects.sync(resultaattype)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"  {resultaattype}: {exc}")
+            else:
+                self.stdout.write(f"  {resultaattype} (versie {regel.versie})")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synchronised {len(resultaattypen) - failed} resultaattypen, "
+                f"{failed} failed"
+            )
+        )
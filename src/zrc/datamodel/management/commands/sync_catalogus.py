@@ -0,0 +1,37 @@
+from django.core.management import BaseCommand
+
+from zrc.datamodel.constants import CatalogusResource
+from zrc.datamodel.models import CatalogusObject, Zaak
+
+
+class Command(BaseCommand):
+    help = (
+        "Mirror the zaaktypen in use, with their statustypen, roltypen, "
+        "resultaattypen, eigenschappen and informatieobjecttypen, from the "
+        "Catalogi API"
+    )
+
+    def handle(self, **options):
+        zaaktypen = set(
+            Zaak.objects.values_list("zaaktype", flat=True).distinct()
+        ) | set(
+            CatalogusObject.objects.filter(
+                resource=CatalogusResource.zaaktype
+            ).values_list("url", flat=True)
+        )
+
+        failed = 0
+        for zaaktype in sorted(zaaktypen):
+            try:
+                count = CatalogusObject.objects.sync_zaaktype(zaaktype)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"  {zaaktype}: {exc}")
+            else:
+                self.stdout.write(f"  {zaaktype} ({count} resources)")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synchronised {len(zaaktypen) - failed} zaaktypen, {failed} failed"
+            )
+        )
@@ -0,0 +1,51 @@
+from django.core.management import BaseCommand
+
+from zrc.api.utils import get_absolute_url
+from zrc.datamodel.models import ZaakInformatieObject
+from zrc.sync.signals import sync_create_zio
+from zrc.utils.client import get_client
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the missing relations of zaakinformatieobjecten in the "
+        "Documenten API, for example after a failed deferred synchronisation"
+    )
+
+    def handle(self, **options):
+        relations = ZaakInformatieObject.objects.filter(
+            _objectinformatieobject=""
+        ).select_related("zaak")
+
+        created, failed = 0, 0
+        for relation in relations.iterator():
+            try:
+                if self._sync(relation):
+                    created += 1
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"  {relation.informatieobject}: {exc}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {created} relations in the Documenten API, {failed} failed"
+            )
+        )
+
+    def _sync(self, relation: ZaakInformatieObject) -> bool:
+        client = get_client(relation.informatieobject)
+        existing = client.list(
+            "objectinformatieobject",
+            query_params={
+                "object": get_absolute_url("zaak-detail", relation.zaak.uuid),
+                "informatieobject": relation.informatieobject,
+            },
+        )
+        if existing:
+            ZaakInformatieObject.objects.filter(pk=relation.pk).update(
+                _objectinformatieobject=existing[0]["url"]
+            )
+            return False
+
+        sync_create_zio(relation)
+        return True
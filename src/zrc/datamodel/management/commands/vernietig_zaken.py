@@ -0,0 +1,77 @@
+import time
+from datetime import date
+
+from django.core.management import BaseCommand
+
+from zrc.datamodel.vernietiging import (
+    get_chunks,
+    get_vernietigbare_zaken,
+    vernietig_zaken,
+)
+from zrc.sync.signals import SyncError
+
+
+class Command(BaseCommand):
+    help = (
+        "Destroy the zaken with archiefnominatie 'vernietigen' whose "
+        "archiefactiedatum has passed, with their deelzaken. Zaken with besluiten "
+        "are skipped"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--datum",
+            type=date.fromisoformat,
+            help="Destroy the zaken to be destroyed on this date (YYYY-MM-DD) "
+            "instead of today",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of zaken to destroy per transaction",
+        )
+        parser.add_argument(
+            "--toelichting",
+            default="",
+            help="Toelichting of the audit trail entries",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of zaken to destroy",
+        )
+
+    def handle(self, **options):
+        datum = options["datum"]
+        zaken = get_vernietigbare_zaken(datum)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"{zaken.count()} zaken can be destroyed")
+            )
+            return
+
+        start = time.monotonic()
+        total = failed = 0
+        for chunk in get_chunks(zaken, options["chunk_size"]):
+            try:
+                destroyed = vernietig_zaken(
+                    chunk, datum=datum, toelichting=options["toelichting"]
+                )
+            except SyncError as exc:
+                self.stderr.write(f"  {len(chunk)} zaken not destroyed: {exc}")
+                failed += len(chunk)
+                continue
+
+            total += destroyed
+            self.stdout.write(f"  {destroyed} zaken")
+
+        duration = time.monotonic() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Destroyed {total} zaken in {duration:.1f}s: "
+                f"{60 * total / max(duration, 0.001):.0f} zaken/min"
+                + (f", {failed} zaken failed" if failed else "")
+            )
+        )
@@ -0,0 +1,82 @@
+# Generated by Django 2.2.19 on 2026-10-19 11:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0088_zaak_opdrachtgevende_organisatie"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ZaakSummary",
+            fields=[
+                (
+                    "zaak",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="datamodel.Zaak",
+                    ),
+                ),
+                (
+                    "statustype",
+                    models.URLField(
+                        blank=True,
+                        db_index=True,
+                        help_text="URL-referentie naar het STATUSTYPE van de huidige STATUS.",
+                        max_length=1000,
+                        verbose_name="statustype",
+                    ),
+                ),
+                (
+                    "datum_status_gezet",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="De datum waarop de huidige STATUS is gezet.",
+                        null=True,
+                        verbose_name="datum status gezet",
+                    ),
+                ),
+                (
+                    "resultaattype",
+                    models.URLField(
+                        blank=True,
+                        db_index=True,
+                        help_text="URL-referentie naar het RESULTAATTYPE van het RESULTAAT.",
+                        max_length=1000,
+                        verbose_name="resultaattype",
+                    ),
+                ),
+                (
+                    "initiator_bsn",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="Het burgerservicenummer van de initiator van de ZAAK.",
+                        max_length=9,
+                        verbose_name="BSN initiator",
+                    ),
+                ),
+                (
+                    "behandelaar_identificatie",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="De identificatie van de MEDEWERKER die de ZAAK behandelt.",
+                        max_length=24,
+                        verbose_name="identificatie behandelaar",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "zaaksamenvatting",
+                "verbose_name_plural": "zaaksamenvattingen",
+            },
+        ),
+    ]
@@ -0,0 +1,131 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0089_zaaksummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResultaatTypeArchiefregel",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resultaattype",
+                    models.URLField(
+                        help_text="URL-referentie naar het RESULTAATTYPE (in de Catalogi API).",
+                        max_length=1000,
+                        unique=True,
+                        verbose_name="resultaattype",
+                    ),
+                ),
+                (
+                    "zaaktype",
+                    models.URLField(
+                        blank=True,
+                        db_index=True,
+                        help_text="URL-referentie naar het ZAAKTYPE van het RESULTAATTYPE.",
+                        max_length=1000,
+                        verbose_name="zaaktype",
+                    ),
+                ),
+                (
+                    "archiefnominatie",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            (
+                                "blijvend_bewaren",
+                                "Het zaakdossier moet bewaard blijven en op de Archiefactiedatum overgedragen worden naar een archiefbewaarplaats.",
+                            ),
+                            (
+                                "vernietigen",
+                                "Het zaakdossier moet op of na de Archiefactiedatum vernietigd worden.",
+                            ),
+                        ],
+                        max_length=40,
+                        verbose_name="archiefnominatie",
+                    ),
+                ),
+                (
+                    "archiefactietermijn",
+                    models.CharField(
+                        blank=True,
+                        help_text="De archiefactietermijn als ISO 8601 duur.",
+                        max_length=50,
+                        verbose_name="archiefactietermijn",
+                    ),
+                ),
+                (
+                    "afleidingswijze",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("afgehandeld", "Afgehandeld"),
+                            ("ander_datumkenmerk", "Ander datumkenmerk"),
+                            ("eigenschap", "Eigenschap"),
+                            ("gerelateerde_zaak", "Gerelateerde zaak"),
+                            ("hoofdzaak", "Hoofdzaak"),
+                            ("ingangsdatum_besluit", "Ingangsdatum besluit"),
+                            ("termijn", "Termijn"),
+                            ("vervaldatum_besluit", "Vervaldatum besluit"),
+                            ("zaakobject", "Zaakobject"),
+                        ],
+                        max_length=20,
+                        verbose_name="afleidingswijze",
+                    ),
+                ),
+                (
+                    "datumkenmerk",
+                    models.CharField(
+                        blank=True, max_length=80, verbose_name="datumkenmerk"
+                    ),
+                ),
+                (
+                    "objecttype",
+                    models.CharField(
+                        blank=True, max_length=80, verbose_name="objecttype"
+                    ),
+                ),
+                (
+                    "procestermijn",
+                    models.CharField(
+                        blank=True,
+                        help_text="De procestermijn als ISO 8601 duur.",
+                        max_length=50,
+                        verbose_name="procestermijn",
+                    ),
+                ),
+                (
+                    "versie",
+                    models.PositiveIntegerField(
+                        default=1,
+                        help_text="Wordt opgehoogd bij iedere wijziging van de regels.",
+                        verbose_name="versie",
+                    ),
+                ),
+                (
+                    "gesynchroniseerd",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="gesynchroniseerd"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "archiefregel resultaattype",
+                "verbose_name_plural": "archiefregels resultaattypen",
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:12
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def check_duplicate_rollen(apps, _):
+    Rol = apps.get_model("datamodel", "Rol")
+    duplicates = (
+        Rol.objects.filter(omschrijving_generiek__in=["initiator", "zaakcoordinator"])
+        .values("zaak__uuid", "omschrijving_generiek")
+        .annotate(amount=Count("pk"))
+        .filter(amount__gt=1)
+    )
+    if duplicates:
+        zaken = ", ".join(
+            f"{duplicate['zaak__uuid']} ({duplicate['omschrijving_generiek']})"
+            for duplicate in duplicates
+        )
+        raise RuntimeError(
+            f"These zaken have more than one initiator or zaakcoordinator, "
+            f"remove the extra rollen before migrating: {zaken}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0090_resultaattypearchiefregel"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_rollen, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="rol",
+            index=models.Index(
+                fields=["zaak", "omschrijving_generiek"],
+                name="datamodel_r_zaak_id_984acd_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="rol",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    omschrijving_generiek__in=["initiator", "zaakcoordinator"]
+                ),
+                fields=("zaak", "omschrijving_generiek"),
+                name="unique_rol_omschrijving_generiek",
+            ),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:18
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0091_rol_omschrijving_generiek"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogusObject",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(max_length=1000, unique=True, verbose_name="url"),
+                ),
+                (
+                    "resource",
+                    models.CharField(
+                        choices=[
+                            ("zaaktype", "Zaaktype"),
+                            ("statustype", "Statustype"),
+                            ("roltype", "Roltype"),
+                            ("resultaattype", "Resultaattype"),
+                            ("eigenschap", "Eigenschap"),
+                            ("informatieobjecttype", "Informatieobjecttype"),
+                        ],
+                        max_length=50,
+                        verbose_name="resource",
+                    ),
+                ),
+                (
+                    "zaaktype",
+                    models.URLField(
+                        blank=True,
+                        db_index=True,
+                        help_text="URL-referentie naar het ZAAKTYPE waar de resource bij hoort.",
+                        max_length=1000,
+                        verbose_name="zaaktype",
+                    ),
+                ),
+                (
+                    "data",
+                    django.contrib.postgres.fields.jsonb.JSONField(verbose_name="data"),
+                ),
+                (
+                    "gesynchroniseerd",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="gesynchroniseerd"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "catalogusobject",
+                "verbose_name_plural": "catalogusobjecten",
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0092_catalogusobject"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaakinformatieobject",
+            name="_objectinformatieobject",
+            field=models.URLField(
+                blank=True,
+                help_text="Link to the related object in the Documenten API",
+                verbose_name="objectinformatieobject",
+            ),
+        ),
+    ]
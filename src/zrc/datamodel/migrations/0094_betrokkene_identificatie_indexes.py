@@ -0,0 +1,61 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0093_zaakinformatieobject_objectinformatieobject"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="medewerker",
+            index=models.Index(
+                fields=["identificatie"], name="datamodel_m_identif_f25860_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="natuurlijkpersoon",
+            index=models.Index(
+                fields=["inp_bsn"], name="datamodel_n_inp_bsn_f1a3d9_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="natuurlijkpersoon",
+            index=models.Index(
+                fields=["anp_identificatie"], name="datamodel_n_anp_ide_66e1a8_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="natuurlijkpersoon",
+            index=models.Index(
+                fields=["inp_a_nummer"], name="datamodel_n_inp_a_n_3973c5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nietnatuurlijkpersoon",
+            index=models.Index(
+                fields=["inn_nnp_id"], name="datamodel_n_inn_nnp_f403aa_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nietnatuurlijkpersoon",
+            index=models.Index(
+                fields=["ann_identificatie"], name="datamodel_n_ann_ide_86bd09_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organisatorischeeenheid",
+            index=models.Index(
+                fields=["identificatie"], name="datamodel_o_identif_e3c67e_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vestiging",
+            index=models.Index(
+                fields=["vestigings_nummer"], name="datamodel_v_vestigi_d5465a_idx"
+            ),
+        ),
+    ]
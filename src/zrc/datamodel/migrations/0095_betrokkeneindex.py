@@ -0,0 +1,132 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# (identificatie_type, table, column) of the indexed betrokkene identificaties
+IDENTIFICATIES = [
+    ("inp_bsn", "datamodel_natuurlijkpersoon", "inp_bsn"),
+    ("anp_identificatie", "datamodel_natuurlijkpersoon", "anp_identificatie"),
+    ("inp_a_nummer", "datamodel_natuurlijkpersoon", "inp_a_nummer"),
+    ("inn_nnp_id", "datamodel_nietnatuurlijkpersoon", "inn_nnp_id"),
+    ("ann_identificatie", "datamodel_nietnatuurlijkpersoon", "ann_identificatie"),
+    ("vestigings_nummer", "datamodel_vestiging", "vestigings_nummer"),
+    ("organisatorische_eenheid", "datamodel_organisatorischeeenheid", "identificatie"),
+    ("medewerker", "datamodel_medewerker", "identificatie"),
+]
+
+# fill the index before its indexes are created
+BACKFILL = [
+    f"""
+    INSERT INTO datamodel_betrokkeneindex
+        (identificatie_type, identificatie, zaak_id, rol_id, omschrijving_generiek)
+    SELECT '{identificatie_type}', b.{column}, r.zaak_id, r.id, r.omschrijving_generiek
+    FROM {table} b
+    INNER JOIN datamodel_rol r ON r.id = b.rol_id
+    WHERE b.{column} <> ''
+    """
+    for identificatie_type, table, column in IDENTIFICATIES
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0094_betrokkene_identificatie_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BetrokkeneIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "identificatie_type",
+                    models.CharField(
+                        choices=[
+                            ("inp_bsn", "BSN natuurlijk persoon"),
+                            (
+                                "anp_identificatie",
+                                "Identificatie ander natuurlijk persoon",
+                            ),
+                            ("inp_a_nummer", "A-nummer natuurlijk persoon"),
+                            ("inn_nnp_id", "RSIN niet-natuurlijk persoon"),
+                            (
+                                "ann_identificatie",
+                                "Identificatie ander niet-natuurlijk persoon",
+                            ),
+                            ("vestigings_nummer", "Vestigingsnummer"),
+                            (
+                                "organisatorische_eenheid",
+                                "Identificatie organisatorische eenheid",
+                            ),
+                            ("medewerker", "Identificatie medewerker"),
+                        ],
+                        max_length=50,
+                        verbose_name="type identificatie",
+                    ),
+                ),
+                (
+                    "identificatie",
+                    models.CharField(max_length=24, verbose_name="identificatie"),
+                ),
+                (
+                    "omschrijving_generiek",
+                    models.CharField(
+                        blank=True, max_length=80, verbose_name="omschrijving generiek"
+                    ),
+                ),
+                (
+                    "rol",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="datamodel.Rol",
+                    ),
+                ),
+                (
+                    "zaak",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="datamodel.Zaak",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "betrokkene-index",
+                "verbose_name_plural": "betrokkene-indexen",
+            },
+        ),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="betrokkeneindex",
+            index=models.Index(
+                fields=["identificatie_type", "identificatie", "zaak"],
+                name="datamodel_b_identif_203510_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="betrokkeneindex",
+            index=models.Index(
+                fields=["identificatie_type", "identificatie", "rol"],
+                name="datamodel_b_identif_1e4c3a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="betrokkeneindex",
+            index=models.Index(fields=["zaak"], name="datamodel_b_zaak_id_a514c7_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="betrokkeneindex",
+            unique_together={("rol", "identificatie_type")},
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:31
+
+import django.contrib.postgres.fields.jsonb
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0095_betrokkeneindex"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaakobject",
+            name="_object_identificatie",
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                blank=True,
+                help_text="The `objectIdentificatie` of a compact object type, see ZAAKOBJECT_COMPACT_STORAGE",
+                null=True,
+                verbose_name="object identificatie",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaakobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["_object_identificatie"], name="datamodel_z__object_3e45a5_gin"
+            ),
+        ),
+    ]
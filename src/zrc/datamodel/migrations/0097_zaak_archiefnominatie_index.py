@@ -0,0 +1,20 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0096_zaakobject_object_identificatie"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["archiefnominatie", "archiefactiedatum"],
+                name="datamodel_z_archief_c99a16_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 2.2.19 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0097_zaak_archiefnominatie_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="zaak",
+            name="datamodel_z_archief_c99a16_idx",
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                condition=models.Q(
+                    ("archiefactiedatum__isnull", False),
+                    ("archiefstatus", "nog_te_archiveren"),
+                ),
+                fields=["archiefactiedatum", "id"],
+                name="zaak_archiefwerkvoorraad_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                condition=models.Q(
+                    ("archiefactiedatum__isnull", False),
+                    ("archiefstatus", "nog_te_archiveren"),
+                ),
+                fields=["archiefnominatie", "archiefactiedatum", "id"],
+                name="zaak_archiefnominatie_idx",
+            ),
+        ),
+    ]
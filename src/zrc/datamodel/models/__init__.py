@@ -1,3 +1,7 @@
+from .archiving import *  # noqa
 from .betrokkene import *  # noqa
+from .betrokkene_index import *  # noqa
+from .catalogus import *  # noqa
 from .core import *  # noqa
+from .summary import *  # noqa
 from .zaakobjecten import *  # noqa
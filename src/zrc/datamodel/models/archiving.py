@@ -0,0 +1,153 @@
+from functools import lru_cache
+
+from django.db import models, transaction
+from django.utils.translation import ugettext_lazy as _
+
+import isodate
+from vng_api_common.constants import (
+    Archiefnominatie,
+    BrondatumArchiefprocedureAfleidingswijze,
+)
+
+from zrc.utils.client import get_client
+
+__all__ = ["ResultaatTypeArchiefregel", "parse_duration"]
+
+
+@lru_cache(maxsize=None)
+def parse_duration(duration: str):
+    """
+    Parse an ISO 8601 duration, the same few termijnen are used over and over.
+    """
+    return isodate.parse_duration(duration)
+
+
+def retrieve_resultaattype(url: str) -> dict:
+    client = get_client(url, scopes=["zds.scopes.zaaktypes.lezen"])
+    return client.retrieve("resultaattype", url=url)
+
+
+class ResultaatTypeArchiefregelQuerySet(models.QuerySet):
+    def get_for_resultaattype(self, url: str) -> "ResultaatTypeArchiefregel":
+        """
+        Return the archiving rules of the RESULTAATTYPE, retrieving them from
+        the Catalogi API if they are not known yet.
+        """
+        try:
+            return self.get(resultaattype=url)
+        except self.model.DoesNotExist:
+            return self.sync(url)
+
+    def sync(self, url: str, resultaattype: dict = None) -> "ResultaatTypeArchiefregel":
+        """
+        Store the archiving rules of the (retrieved) RESULTAATTYPE.
+
+        The version is increased when the rules changed.
+        """
+        if resultaattype is None:
+            resultaattype = retrieve_resultaattype(url)
+
+        brondatum_archiefprocedure = (
+            resultaattype.get("brondatumArchiefprocedure") or {}
+        )
+        values = {
+            "zaaktype": resultaattype.get("zaaktype") or "",
+            "archiefnominatie": resultaattype.get("archiefnominatie") or "",
+            "archiefactietermijn": resultaattype.get("archiefactietermijn") or "",
+            "afleidingswijze": brondatum_archiefprocedure.get("afleidingswijze") or "",
+            "datumkenmerk": brondatum_archiefprocedure.get("datumkenmerk") or "",
+            "objecttype": brondatum_archiefprocedure.get("objecttype") or "",
+            "procestermijn": brondatum_archiefprocedure.get("procestermijn") or "",
+        }
+
+        with transaction.atomic():
+            regel, created = self.select_for_update().get_or_create(
+                resultaattype=url, defaults=values
+            )
+            if created:
+                return regel
+
+            changed = [
+                field
+                for field, value in values.items()
+                if getattr(regel, field) != value
+            ]
+            for field in changed:
+                setattr(regel, field, values[field])
+            if changed:
+                regel.versie += 1
+            regel.save()
+        return regel
+
+
+class ResultaatTypeArchiefregel(models.Model):
+    """
+    Local copy of the archiving rules of a RESULTAATTYPE.
+
+    Closing a ZAAK derives the archiving parameters from these rules, instead
+    of retrieving the RESULTAATTYPE from the Catalogi API. The rules are
+    refreshed through the notifications of the Catalogi API, see
+    :mod:`zrc.datamodel.handlers`.
+    """
+
+    resultaattype = models.URLField(
+        _("resultaattype"),
+        max_length=1000,
+        unique=True,
+        help_text=_("URL-referentie naar het RESULTAATTYPE (in de Catalogi API)."),
+    )
+    zaaktype = models.URLField(
+        _("zaaktype"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("URL-referentie naar het ZAAKTYPE van het RESULTAATTYPE."),
+    )
+    archiefnominatie = models.CharField(
+        _("archiefnominatie"),
+        max_length=40,
+        blank=True,
+        choices=Archiefnominatie.choices,
+    )
+    archiefactietermijn = models.CharField(
+        _("archiefactietermijn"),
+        max_length=50,
+        blank=True,
+        help_text=_("De archiefactietermijn als ISO 8601 duur."),
+    )
+    afleidingswijze = models.CharField(
+        _("afleidingswijze"),
+        max_length=20,
+        blank=True,
+        choices=BrondatumArchiefprocedureAfleidingswijze.choices,
+    )
+    datumkenmerk = models.CharField(_("datumkenmerk"), max_length=80, blank=True)
+    objecttype = models.CharField(_("objecttype"), max_length=80, blank=True)
+    procestermijn = models.CharField(
+        _("procestermijn"),
+        max_length=50,
+        blank=True,
+        help_text=_("De procestermijn als ISO 8601 duur."),
+    )
+
+    versie = models.PositiveIntegerField(
+        _("versie"),
+        default=1,
+        help_text=_("Wordt opgehoogd bij iedere wijziging van de regels."),
+    )
+    gesynchroniseerd = models.DateTimeField(_("gesynchroniseerd"), auto_now=True)
+
+    objects = ResultaatTypeArchiefregelQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("archiefregel resultaattype")
+        verbose_name_plural = _("archiefregels resultaattypen")
+
+    def __str__(self):
+        return self.resultaattype
+
+    @property
+    def archiefactietermijn_duur(self):
+        if not self.archiefactietermijn:
+            return None
+        return parse_duration(self.archiefactietermijn)
@@ -110,6 +110,11 @@ class NatuurlijkPersoon(AbstractRolZaakobjectZakelijkRechtRelation):
 
     class Meta:
         verbose_name = "natuurlijk persoon"
+        indexes = [
+            models.Index(fields=["inp_bsn"]),
+            models.Index(fields=["anp_identificatie"]),
+            models.Index(fields=["inp_a_nummer"]),
+        ]
 
 
 class NietNatuurlijkPersoon(AbstractRolZaakobjectZakelijkRechtRelation):
@@ -146,6 +151,10 @@ class NietNatuurlijkPersoon(AbstractRolZaakobjectZakelijkRechtRelation):
 
     class Meta:
         verbose_name = "niet-natuurlijk persoon"
+        indexes = [
+            models.Index(fields=["inn_nnp_id"]),
+            models.Index(fields=["ann_identificatie"]),
+        ]
 
 
 class Vestiging(AbstractRolZaakobjectRelation):
@@ -167,6 +176,7 @@ class Vestiging(AbstractRolZaakobjectRelation):
 
     class Meta:
         verbose_name = "vestiging"
+        indexes = [models.Index(fields=["vestigings_nummer"])]
 
 
 class OrganisatorischeEenheid(AbstractRolZaakobjectRelation):
@@ -191,6 +201,7 @@ class OrganisatorischeEenheid(AbstractRolZaakobjectRelation):
 
     class Meta:
         verbose_name = "organisatorische eenheid"
+        indexes = [models.Index(fields=["identificatie"])]
 
 
 class Medewerker(AbstractRolZaakobjectRelation):
@@ -224,6 +235,7 @@ class Medewerker(AbstractRolZaakobjectRelation):
 
     class Meta:
         verbose_name = "medewerker"
+        indexes = [models.Index(fields=["identificatie"])]
 
 
 # models for nested objects
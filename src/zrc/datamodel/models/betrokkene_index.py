@@ -0,0 +1,131 @@
+from typing import Iterable
+
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from ..constants import BetrokkeneIdentificatie
+from .betrokkene import (
+    Medewerker,
+    NatuurlijkPersoon,
+    NietNatuurlijkPersoon,
+    OrganisatorischeEenheid,
+    Vestiging,
+)
+from .core import Rol, Zaak
+
+__all__ = ["BetrokkeneIndex"]
+
+
+# the indexed identificaties, per betrokkene model
+BETROKKENE_IDENTIFICATIES = {
+    NatuurlijkPersoon: {
+        BetrokkeneIdentificatie.inp_bsn: "inp_bsn",
+        BetrokkeneIdentificatie.anp_identificatie: "anp_identificatie",
+        BetrokkeneIdentificatie.inp_a_nummer: "inp_a_nummer",
+    },
+    NietNatuurlijkPersoon: {
+        BetrokkeneIdentificatie.inn_nnp_id: "inn_nnp_id",
+        BetrokkeneIdentificatie.ann_identificatie: "ann_identificatie",
+    },
+    Vestiging: {BetrokkeneIdentificatie.vestigings_nummer: "vestigings_nummer"},
+    OrganisatorischeEenheid: {
+        BetrokkeneIdentificatie.organisatorische_eenheid: "identificatie"
+    },
+    Medewerker: {BetrokkeneIdentificatie.medewerker: "identificatie"},
+}
+
+
+class BetrokkeneIndexQuerySet(models.QuerySet):
+    def update_betrokkene(self, betrokkene: models.Model) -> None:
+        """
+        Replace the index entries of the (saved) betrokkene of a ROL.
+        """
+        identificaties = BETROKKENE_IDENTIFICATIES[type(betrokkene)]
+        self.filter(
+            rol_id=betrokkene.rol_id, identificatie_type__in=identificaties
+        ).delete()
+
+        rol = betrokkene.rol
+        self.bulk_create(
+            [
+                self.model(
+                    identificatie_type=identificatie_type,
+                    identificatie=getattr(betrokkene, field),
+                    zaak_id=rol.zaak_id,
+                    rol=rol,
+                    omschrijving_generiek=rol.omschrijving_generiek,
+                )
+                for identificatie_type, field in identificaties.items()
+                if getattr(betrokkene, field)
+            ]
+        )
+
+    def rebuild(self, rol_ids: Iterable[int]) -> int:
+        """
+        Rebuild the index entries of the ROLlen from the betrokkene tables.
+
+        :return: the number of index entries
+        """
+        self.filter(rol_id__in=rol_ids).delete()
+
+        entries = []
+        for model, identificaties in BETROKKENE_IDENTIFICATIES.items():
+            for identificatie_type, field in identificaties.items():
+                values = (
+                    model.objects.filter(rol_id__in=rol_ids)
+                    .exclude(**{field: ""})
+                    .values_list(
+                        "rol_id", "rol__zaak_id", "rol__omschrijving_generiek", field
+                    )
+                )
+                entries += [
+                    self.model(
+                        identificatie_type=identificatie_type,
+                        identificatie=identificatie,
+                        zaak_id=zaak_id,
+                        rol_id=rol_id,
+                        omschrijving_generiek=omschrijving_generiek,
+                    )
+                    for rol_id, zaak_id, omschrijving_generiek, identificatie in values
+                ]
+        self.bulk_create(entries)
+        return len(entries)
+
+
+class BetrokkeneIndex(models.Model):
+    """
+    Denormalised lookup of the ZAAKen and ROLlen of a betrokkene, by the
+    identificatie of the betrokkene.
+
+    Kept up to date by ``zrc.datamodel.signals``, and (re)built with the
+    ``rebuild_betrokkene_index`` management command.
+    """
+
+    identificatie_type = models.CharField(
+        _("type identificatie"),
+        max_length=50,
+        choices=BetrokkeneIdentificatie.choices,
+    )
+    identificatie = models.CharField(_("identificatie"), max_length=24)
+    zaak = models.ForeignKey(Zaak, on_delete=models.CASCADE, db_index=False)
+    rol = models.ForeignKey(Rol, on_delete=models.CASCADE, db_index=False)
+    omschrijving_generiek = models.CharField(
+        _("omschrijving generiek"), max_length=80, blank=True
+    )
+
+    objects = BetrokkeneIndexQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("betrokkene-index")
+        verbose_name_plural = _("betrokkene-indexen")
+        # also serves the lookups and cascade deletes by rol
+        unique_together = ("rol", "identificatie_type")
+        indexes = [
+            models.Index(fields=["identificatie_type", "identificatie", "zaak"]),
+            models.Index(fields=["identificatie_type", "identificatie", "rol"]),
+            # for the cascade deletes of zaken
+            models.Index(fields=["zaak"]),
+        ]
+
+    def __str__(self):
+        return f"{self.identificatie_type} {self.identificatie}: {self.rol_id}"
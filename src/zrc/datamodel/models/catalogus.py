@@ -0,0 +1,120 @@
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from zrc.utils.client import get_client
+
+from ..constants import CatalogusResource
+
+__all__ = ["CatalogusObject"]
+
+
+# attributes of a ZAAKTYPE listing the mirrored resources of the ZAAKTYPE
+ZAAKTYPE_RESOURCES = {
+    "statustypen": CatalogusResource.statustype,
+    "roltypen": CatalogusResource.roltype,
+    "resultaattypen": CatalogusResource.resultaattype,
+    "eigenschappen": CatalogusResource.eigenschap,
+    "informatieobjecttypen": CatalogusResource.informatieobjecttype,
+}
+
+
+def retrieve_catalogus_object(resource: str, url: str) -> dict:
+    client = get_client(url, scopes=["zds.scopes.zaaktypes.lezen"])
+    return client.retrieve(resource, url=url)
+
+
+class CatalogusObjectQuerySet(models.QuerySet):
+    def get_data(self, url: str) -> Optional[dict]:
+        return self.filter(url=url).values_list("data", flat=True).first()
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, dict]:
+        return dict(self.filter(url__in=urls).values_list("url", "data"))
+
+    def get_or_retrieve(
+        self, resource: str, url: str, retrieve: Callable[[], dict]
+    ) -> dict:
+        """
+        Return the mirrored resource, or retrieve it with ``retrieve`` and add it
+        to the mirror.
+
+        Without ``CATALOGUS_MIRROR_ENABLED`` the resource is always retrieved.
+        """
+        if not settings.CATALOGUS_MIRROR_ENABLED:
+            return retrieve()
+
+        data = self.get_data(url)
+        if data is None:
+            data = retrieve()
+            self.store(resource, url, data)
+        return data
+
+    def store(self, resource: str, url: str, data: dict) -> "CatalogusObject":
+        zaaktype = url if resource == CatalogusResource.zaaktype else ""
+        obj, _ = self.update_or_create(
+            url=url,
+            defaults={
+                "resource": resource,
+                "zaaktype": data.get("zaaktype") or zaaktype,
+                "data": data,
+            },
+        )
+        return obj
+
+    def sync(self, resource: str, url: str) -> "CatalogusObject":
+        return self.store(resource, url, retrieve_catalogus_object(resource, url))
+
+    def sync_zaaktype(self, url: str) -> int:
+        """
+        Mirror the ZAAKTYPE with its statustypen, roltypen, resultaattypen,
+        eigenschappen and informatieobjecttypen.
+
+        :return: the number of mirrored resources
+        """
+        zaaktype = self.sync(CatalogusResource.zaaktype, url).data
+
+        urls = {url}
+        for attribute, resource in ZAAKTYPE_RESOURCES.items():
+            for resource_url in zaaktype.get(attribute) or []:
+                self.sync(resource, resource_url)
+                urls.add(resource_url)
+
+        # resources removed from a concept zaaktype
+        self.filter(zaaktype=url).exclude(url__in=urls).delete()
+        return len(urls)
+
+
+class CatalogusObject(models.Model):
+    """
+    Local copy of a resource of the Catalogi API.
+
+    Used instead of the Catalogi API when ``CATALOGUS_MIRROR_ENABLED`` is set.
+    The copies are refreshed through the notifications of the Catalogi API,
+    see :mod:`zrc.datamodel.handlers`.
+    """
+
+    url = models.URLField(_("url"), max_length=1000, unique=True)
+    resource = models.CharField(
+        _("resource"), max_length=50, choices=CatalogusResource.choices
+    )
+    zaaktype = models.URLField(
+        _("zaaktype"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("URL-referentie naar het ZAAKTYPE waar de resource bij hoort."),
+    )
+    data = JSONField(_("data"))
+    gesynchroniseerd = models.DateTimeField(_("gesynchroniseerd"), auto_now=True)
+
+    objects = CatalogusObjectQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("catalogusobject")
+        verbose_name_plural = _("catalogusobjecten")
+
+    def __str__(self):
+        return f"{self.resource}: {self.url}"
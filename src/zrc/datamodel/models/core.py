@@ -1,14 +1,15 @@
 import logging
 import uuid
 from datetime import date
+from typing import Optional
 
 from django.conf import settings
 from django.contrib.gis.db.models import GeometryField
-from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.fields import ArrayField, JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.crypto import get_random_string
-from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.caching import ETagMixin
@@ -26,14 +27,14 @@ from vng_api_common.fields import (
     RSINField,
     VertrouwelijkheidsAanduidingField,
 )
-from vng_api_common.models import APICredential, APIMixin
-from vng_api_common.utils import (
-    generate_unique_identification,
-    request_object_attribute,
-)
+from vng_api_common.models import APIMixin
+from vng_api_common.utils import request_object_attribute
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from zrc.utils.client import get_client
+
 from ..constants import AardZaakRelatie, BetalingsIndicatie, IndicatieMachtiging
+from ..identificatie import generate_identificatie
 from ..query import ZaakQuerySet, ZaakRelatedQuerySet
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,12 @@ __all__ = [
 ]
 
 
+# ZAAKen which still have to be archived or destroyed
+ARCHIEFWERKVOORRAAD = models.Q(
+    archiefstatus=Archiefstatus.nog_te_archiveren, archiefactiedatum__isnull=False
+)
+
+
 class Zaak(ETagMixin, APIMixin, models.Model):
     """
     Modelleer de structuur van een ZAAK.
@@ -304,15 +311,26 @@ class Zaak(ETagMixin, APIMixin, models.Model):
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
         unique_together = ("bronorganisatie", "identificatie")
+        # the open archiving work only, see ZaakViewSet._archiefwerkvoorraad
+        indexes = [
+            models.Index(
+                name="zaak_archiefwerkvoorraad_idx",
+                fields=["archiefactiedatum", "id"],
+                condition=ARCHIEFWERKVOORRAAD,
+            ),
+            models.Index(
+                name="zaak_archiefnominatie_idx",
+                fields=["archiefnominatie", "archiefactiedatum", "id"],
+                condition=ARCHIEFWERKVOORRAAD,
+            ),
+        ]
 
     def __str__(self):
         return self.identificatie
 
     def save(self, *args, **kwargs):
         if not self.identificatie:
-            self.identificatie = generate_unique_identification(
-                self, "registratiedatum"
-            )
+            self.identificatie = generate_identificatie(self, "registratiedatum")
 
         if (
             self.betalingsindicatie == BetalingsIndicatie.nvt
@@ -322,9 +340,18 @@ class Zaak(ETagMixin, APIMixin, models.Model):
 
         super().save(*args, **kwargs)
 
+    @property
+    def current_status(self) -> Optional["Status"]:
+        # use the prefetched statussen (ordered by -datum_status_gezet) if present
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "status_set" in prefetched:
+            statussen = list(prefetched["status_set"])
+            return statussen[0] if statussen else None
+        return self.status_set.order_by("-datum_status_gezet").first()
+
     @property
     def current_status_uuid(self):
-        status = self.status_set.order_by("-datum_status_gezet").first()
+        status = self.current_status
         return status.uuid if status else None
 
     @property
@@ -444,6 +471,11 @@ class Resultaat(ETagMixin, models.Model):
         return self._unique_representation
 
 
+# a ZAAK has at most one ROL of these kinds
+UNIQUE_ROL_OMSCHRIJVINGEN = [RolOmschrijving.initiator, RolOmschrijving.zaakcoordinator]
+UNIQUE_ROL_CONSTRAINT = "unique_rol_omschrijving_generiek"
+
+
 class Rol(ETagMixin, models.Model):
     """
     Modelleer de rol van een BETROKKENE bij een ZAAK.
@@ -505,6 +537,14 @@ class Rol(ETagMixin, models.Model):
     class Meta:
         verbose_name = "Rol"
         verbose_name_plural = "Rollen"
+        indexes = [models.Index(fields=["zaak", "omschrijving_generiek"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["zaak", "omschrijving_generiek"],
+                condition=models.Q(omschrijving_generiek__in=UNIQUE_ROL_OMSCHRIJVINGEN),
+                name=UNIQUE_ROL_CONSTRAINT,
+            )
+        ]
 
     def save(self, *args, **kwargs):
         # derive text fields from RolType
@@ -518,9 +558,7 @@ class Rol(ETagMixin, models.Model):
         if self.omschrijving and self.omschrijving_generiek:
             return
 
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(self.roltype)
-        client.auth = APICredential.get_auth(self.roltype)
+        client = get_client(self.roltype)
         roltype = client.retrieve("roltype", url=self.roltype)
 
         self.omschrijving = roltype["omschrijving"]
@@ -538,6 +576,30 @@ class Rol(ETagMixin, models.Model):
         return f"({self.zaak.unique_representation()}) - {betrokkene.rsplit('/')[-1]}"
 
 
+# the object types with a flat ``objectIdentificatie``, with the one-to-one
+# relation of a ZAAKOBJECT holding it. With ``ZAAKOBJECT_COMPACT_STORAGE`` it
+# is stored on the ZAAKOBJECT itself instead, see ``ZaakObject.is_compact``.
+COMPACT_OBJECT_TYPES = {
+    ZaakobjectTypes.adres: "adres",
+    ZaakobjectTypes.buurt: "buurt",
+    ZaakobjectTypes.gemeente: "gemeente",
+    ZaakobjectTypes.gemeentelijke_openbare_ruimte: "gemeentelijkeopenbareruimte",
+    ZaakobjectTypes.inrichtingselement: "inrichtingselement",
+    ZaakobjectTypes.kadastrale_onroerende_zaak: "kadastraleonroerendezaak",
+    ZaakobjectTypes.kunstwerkdeel: "kunstwerkdeel",
+    ZaakobjectTypes.maatschappelijke_activiteit: "maatschappelijkeactiviteit",
+    ZaakobjectTypes.openbare_ruimte: "openbareruimte",
+    ZaakobjectTypes.pand: "pand",
+    ZaakobjectTypes.spoorbaandeel: "spoorbaandeel",
+    ZaakobjectTypes.terreindeel: "terreindeel",
+    ZaakobjectTypes.waterdeel: "waterdeel",
+    ZaakobjectTypes.wegdeel: "wegdeel",
+    ZaakobjectTypes.wijk: "wijk",
+    ZaakobjectTypes.woonplaats: "woonplaats",
+    ZaakobjectTypes.overige: "overige",
+}
+
+
 class ZaakObject(ETagMixin, models.Model):
     """
     Modelleer een object behorende bij een ZAAK.
@@ -576,12 +638,52 @@ class ZaakObject(ETagMixin, models.Model):
         help_text="Beschrijft het type OBJECT als `objectType` de waarde "
         '"overige" heeft.',
     )
+    _object_identificatie = JSONField(
+        "object identificatie",
+        null=True,
+        blank=True,
+        help_text="The `objectIdentificatie` of a compact object type, see "
+        "ZAAKOBJECT_COMPACT_STORAGE",
+    )
 
     objects = ZaakRelatedQuerySet.as_manager()
 
     class Meta:
         verbose_name = "zaakobject"
         verbose_name_plural = "zaakobjecten"
+        indexes = [GinIndex(fields=["_object_identificatie"])]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the fields are not loaded if deferred
+        if (
+            instance.__dict__.get("_object_identificatie") is not None
+            and "object_type" in instance.__dict__
+        ):
+            instance._cache_object_identificatie()
+        return instance
+
+    @staticmethod
+    def is_compact(object_type: str) -> bool:
+        """
+        Whether the ``objectIdentificatie`` of new ZAAKOBJECTen of the type is
+        stored on the ZAAKOBJECT itself.
+        """
+        return (
+            settings.ZAAKOBJECT_COMPACT_STORAGE and object_type in COMPACT_OBJECT_TYPES
+        )
+
+    def set_object_identificatie(self, data: dict) -> None:
+        self._object_identificatie = data
+        self._cache_object_identificatie()
+
+    def _cache_object_identificatie(self) -> None:
+        # expose the stored identificatie through the one-to-one relation, as if
+        # it was loaded from the table of the type
+        relation = self._meta.get_field(COMPACT_OBJECT_TYPES[self.object_type])
+        obj = relation.related_model(zaakobject=self, **self._object_identificatie)
+        relation.set_cached_value(self, obj)
 
     def _get_object(self) -> dict:
         """
@@ -590,15 +692,19 @@ class ZaakObject(ETagMixin, models.Model):
         :return: A `dict` representing the object.
         """
         if not hasattr(self, "_object"):
-            object_url = self.object
             self._object = None
-            if object_url:
-                Client = import_string(settings.ZDS_CLIENT_CLASS)
-                client = Client.from_url(object_url)
-                client.auth = APICredential.get_auth(object_url)
-                self._object = client.retrieve(self.object_type.lower(), url=object_url)
+            if self.object:
+                self._object = self._retrieve_object(self._get_object_client())
         return self._object
 
+    def _get_object_client(self):
+        client = get_client(self.object)
+        return client
+
+    def _retrieve_object(self, client) -> dict:
+        # does not touch the database, so it's safe to call from other threads
+        return client.retrieve(self.object_type.lower(), url=self.object)
+
     def unique_representation(self):
         if self.object == "":
             return f"({self.zaak.unique_representation()}) - {self.relatieomschrijving}"
@@ -714,6 +820,11 @@ class ZaakInformatieObject(ETagMixin, models.Model):
         "Geldige waardes zijn datumtijden gelegen op of voor de "
         "huidige datum en tijd.",
     )
+    _objectinformatieobject = models.URLField(
+        "objectinformatieobject",
+        blank=True,
+        help_text="Link to the related object in the Documenten API",
+    )
 
     objects = ZaakRelatedQuerySet.as_manager()
 
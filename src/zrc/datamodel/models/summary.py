@@ -0,0 +1,140 @@
+from django.db import models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.translation import ugettext_lazy as _
+
+from vng_api_common.constants import RolOmschrijving
+
+from ..query import ZaakRelatedQuerySet
+from .betrokkene import Medewerker, NatuurlijkPersoon
+from .core import Resultaat, Status, Zaak
+
+__all__ = ["ZaakSummary"]
+
+
+def _first(queryset: models.QuerySet, field: str, default=None):
+    expression = Subquery(queryset.values(field)[:1])
+    if default is None:
+        return expression
+    return Coalesce(expression, Value(default))
+
+
+def get_summary_expressions() -> dict:
+    """
+    Expressions deriving the summary columns from the source tables.
+
+    The expressions are correlated on ``zaak_id`` of the summary row being
+    updated, which allows (re)computing many rows with a single ``UPDATE``.
+    """
+    statussen = Status.objects.filter(zaak=OuterRef("zaak_id")).order_by(
+        "-datum_status_gezet"
+    )
+    resultaten = Resultaat.objects.filter(zaak=OuterRef("zaak_id"))
+    initiators = NatuurlijkPersoon.objects.filter(
+        rol__zaak=OuterRef("zaak_id"),
+        rol__omschrijving_generiek=RolOmschrijving.initiator,
+    ).order_by("rol__pk")
+    behandelaars = Medewerker.objects.filter(
+        rol__zaak=OuterRef("zaak_id"),
+        rol__omschrijving_generiek=RolOmschrijving.behandelaar,
+    ).order_by("rol__pk")
+
+    return {
+        "statustype": _first(statussen, "statustype", default=""),
+        "datum_status_gezet": _first(statussen, "datum_status_gezet"),
+        "resultaattype": _first(resultaten, "resultaattype", default=""),
+        "initiator_bsn": _first(initiators, "inp_bsn", default=""),
+        "behandelaar_identificatie": _first(behandelaars, "identificatie", default=""),
+    }
+
+
+STATUS_FIELDS = ("statustype", "datum_status_gezet")
+RESULTAAT_FIELDS = ("resultaattype",)
+ROL_FIELDS = ("initiator_bsn", "behandelaar_identificatie")
+
+
+class ZaakSummaryQuerySet(ZaakRelatedQuerySet):
+    def refresh(self, fields=None) -> int:
+        """
+        Recompute (a subset of) the summary columns from the source tables.
+
+        :return: the number of updated summary rows
+        """
+        expressions = get_summary_expressions()
+        if fields is not None:
+            expressions = {field: expressions[field] for field in fields}
+        return self.update(**expressions)
+
+    def refresh_for_zaak(self, zaak_id: int, fields=None) -> None:
+        """
+        Recompute the summary of a single ZAAK, creating it if needed.
+        """
+        if self.filter(zaak_id=zaak_id).refresh(fields=fields):
+            return
+
+        # the summary does not exist (yet) - zaken created before the summary
+        # table was introduced are backfilled with ``rebuild_zaak_summaries``
+        self.ensure_exists([zaak_id])
+        self.filter(zaak_id=zaak_id).refresh()
+
+    def ensure_exists(self, zaak_ids) -> None:
+        self.bulk_create(
+            [self.model(zaak_id=zaak_id) for zaak_id in zaak_ids],
+            ignore_conflicts=True,
+        )
+
+
+class ZaakSummary(models.Model):
+    """
+    Denormalised, read-only summary of a ZAAK for listings.
+
+    The values are derived from the STATUSsen, RESULTAAT and ROLlen of the
+    ZAAK and kept up to date by ``zrc.datamodel.signals``.
+    """
+
+    zaak = models.OneToOneField(
+        Zaak, on_delete=models.CASCADE, primary_key=True, related_name="summary"
+    )
+    statustype = models.URLField(
+        _("statustype"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("URL-referentie naar het STATUSTYPE van de huidige STATUS."),
+    )
+    datum_status_gezet = models.DateTimeField(
+        _("datum status gezet"),
+        null=True,
+        blank=True,
+        help_text=_("De datum waarop de huidige STATUS is gezet."),
+    )
+    resultaattype = models.URLField(
+        _("resultaattype"),
+        max_length=1000,
+        blank=True,
+        db_index=True,
+        help_text=_("URL-referentie naar het RESULTAATTYPE van het RESULTAAT."),
+    )
+    initiator_bsn = models.CharField(
+        _("BSN initiator"),
+        max_length=9,
+        blank=True,
+        db_index=True,
+        help_text=_("Het burgerservicenummer van de initiator van de ZAAK."),
+    )
+    behandelaar_identificatie = models.CharField(
+        _("identificatie behandelaar"),
+        max_length=24,
+        blank=True,
+        db_index=True,
+        help_text=_("De identificatie van de MEDEWERKER die de ZAAK behandelt."),
+    )
+
+    objects = ZaakSummaryQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("zaaksamenvatting")
+        verbose_name_plural = _("zaaksamenvattingen")
+
+    def __str__(self):
+        return str(self.zaak)
@@ -0,0 +1,136 @@
+"""
+Keep the denormalised :class:`zrc.datamodel.models.ZaakSummary` and
+:class:`zrc.datamodel.models.BetrokkeneIndex` up to date.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    BetrokkeneIndex,
+    Medewerker,
+    NatuurlijkPersoon,
+    NietNatuurlijkPersoon,
+    OrganisatorischeEenheid,
+    Resultaat,
+    Rol,
+    Status,
+    Vestiging,
+    Zaak,
+    ZaakSummary,
+)
+from .models.betrokkene_index import BETROKKENE_IDENTIFICATIES
+from .models.summary import RESULTAAT_FIELDS, ROL_FIELDS, STATUS_FIELDS
+
+
+@receiver(post_save, sender=Zaak, dispatch_uid="datamodel.create_zaak_summary")
+def create_zaak_summary(sender, instance: Zaak, created: bool = False, **kwargs):
+    if created:
+        ZaakSummary.objects.ensure_exists([instance.pk])
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Status,
+    dispatch_uid="datamodel.update_summary_status",
+)
+def update_summary_status(sender, instance: Status, **kwargs):
+    _refresh(kwargs["signal"], instance.zaak_id, STATUS_FIELDS)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Resultaat,
+    dispatch_uid="datamodel.update_summary_resultaat",
+)
+def update_summary_resultaat(sender, instance: Resultaat, **kwargs):
+    _refresh(kwargs["signal"], instance.zaak_id, RESULTAAT_FIELDS)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=Rol,
+    dispatch_uid="datamodel.update_summary_rol",
+)
+def update_summary_rol(sender, instance: Rol, **kwargs):
+    _refresh(kwargs["signal"], instance.zaak_id, ROL_FIELDS)
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=NatuurlijkPersoon,
+    dispatch_uid="datamodel.update_summary_natuurlijkpersoon",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Medewerker,
+    dispatch_uid="datamodel.update_summary_medewerker",
+)
+def update_summary_betrokkene(sender, instance, **kwargs):
+    # the betrokkene identificatie is created after the rol itself
+    if instance.rol_id is None:
+        return
+
+    zaak_ids = Rol.objects.filter(pk=instance.rol_id).values_list("zaak_id", flat=True)
+    for zaak_id in zaak_ids:
+        _refresh(kwargs["signal"], zaak_id, ROL_FIELDS)
+
+
+@receiver(post_save, sender=Rol, dispatch_uid="datamodel.update_betrokkene_index_rol")
+def update_betrokkene_index_rol(sender, instance: Rol, created: bool = False, **kwargs):
+    # the index entries are added with the betrokkene identificatie
+    if created:
+        return
+
+    BetrokkeneIndex.objects.filter(rol=instance).update(
+        zaak_id=instance.zaak_id, omschrijving_generiek=instance.omschrijving_generiek
+    )
+
+
+@receiver(
+    [post_save, post_delete],
+    sender=NatuurlijkPersoon,
+    dispatch_uid="datamodel.update_betrokkene_index_natuurlijkpersoon",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=NietNatuurlijkPersoon,
+    dispatch_uid="datamodel.update_betrokkene_index_nietnatuurlijkpersoon",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Vestiging,
+    dispatch_uid="datamodel.update_betrokkene_index_vestiging",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=OrganisatorischeEenheid,
+    dispatch_uid="datamodel.update_betrokkene_index_organisatorischeeenheid",
+)
+@receiver(
+    [post_save, post_delete],
+    sender=Medewerker,
+    dispatch_uid="datamodel.update_betrokkene_index_medewerker",
+)
+def update_betrokkene_index(sender, instance, **kwargs):
+    # the same models hold the identification of zaakobjecten
+    if instance.rol_id is None:
+        return
+
+    if kwargs["signal"] is post_delete:
+        # the rol may be deleted already as part of a cascade - only remove
+        # the entries
+        BetrokkeneIndex.objects.filter(
+            rol_id=instance.rol_id,
+            identificatie_type__in=BETROKKENE_IDENTIFICATIES[sender],
+        ).delete()
+    else:
+        BetrokkeneIndex.objects.update_betrokkene(instance)
+
+
+def _refresh(signal, zaak_id: int, fields) -> None:
+    if signal is post_delete:
+        # the summary may be deleted already as part of a cascade - never
+        # (re)create it here
+        ZaakSummary.objects.filter(zaak_id=zaak_id).refresh(fields=fields)
+    else:
+        ZaakSummary.objects.refresh_for_zaak(zaak_id, fields=fields)
@@ -12,6 +12,7 @@ from vng_api_common.constants import (
 )
 
 from ..constants import AardZaakRelatie
+from ..models.core import UNIQUE_ROL_OMSCHRIJVINGEN
 
 
 class ZaakFactory(factory.django.DjangoModelFactory):
@@ -84,7 +85,10 @@ class RolFactory(factory.django.DjangoModelFactory):
     betrokkene_type = factory.fuzzy.FuzzyChoice(RolTypes.values)
     roltype = factory.Faker("url")
     omschrijving = factory.Faker("word")
-    omschrijving_generiek = factory.fuzzy.FuzzyChoice(RolOmschrijving.values)
+    # initiator and zaakcoordinator are unique per zaak, set them explicitly
+    omschrijving_generiek = factory.fuzzy.FuzzyChoice(
+        set(RolOmschrijving.values) - set(UNIQUE_ROL_OMSCHRIJVINGEN)
+    )
 
     class Meta:
         model = "datamodel.Rol"
@@ -0,0 +1,102 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from vng_api_common.constants import (
+    Archiefnominatie,
+    BrondatumArchiefprocedureAfleidingswijze,
+)
+
+from zrc.datamodel.handlers import default
+from zrc.datamodel.models import ResultaatTypeArchiefregel
+from zrc.datamodel.utils import BrondatumCalculator
+
+from .factories import ResultaatFactory, ZaakFactory
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+RESULTAATTYPE = "https://example.com/ztc/api/v1/resultaattypen/1"
+
+
+def get_resultaattype(archiefactietermijn="P10Y") -> dict:
+    return {
+        "url": RESULTAATTYPE,
+        "zaaktype": ZAAKTYPE,
+        "archiefnominatie": Archiefnominatie.vernietigen,
+        "archiefactietermijn": archiefactietermijn,
+        "brondatumArchiefprocedure": {
+            "afleidingswijze": BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+            "datumkenmerk": None,
+            "objecttype": None,
+            "procestermijn": None,
+        },
+    }
+
+
+@patch("zrc.datamodel.models.archiving.retrieve_resultaattype")
+class ResultaatTypeArchiefregelTests(TestCase):
+    def test_get_for_resultaattype_retrieves_once(self, m):
+        m.return_value = get_resultaattype()
+
+        regel = ResultaatTypeArchiefregel.objects.get_for_resultaattype(RESULTAATTYPE)
+        ResultaatTypeArchiefregel.objects.get_for_resultaattype(RESULTAATTYPE)
+
+        m.assert_called_once_with(RESULTAATTYPE)
+        self.assertEqual(regel.zaaktype, ZAAKTYPE)
+        self.assertEqual(regel.archiefnominatie, Archiefnominatie.vernietigen)
+        self.assertEqual(regel.archiefactietermijn, "P10Y")
+        self.assertEqual(
+            regel.afleidingswijze, BrondatumArchiefprocedureAfleidingswijze.afgehandeld
+        )
+        self.assertEqual(regel.procestermijn, "")
+        self.assertEqual(regel.versie, 1)
+
+    def test_sync_increases_version_on_change(self, m):
+        m.return_value = get_resultaattype()
+        ResultaatTypeArchiefregel.objects.sync(RESULTAATTYPE)
+        regel = ResultaatTypeArchiefregel.objects.sync(RESULTAATTYPE)
+        self.assertEqual(regel.versie, 1)
+
+        m.return_value = get_resultaattype(archiefactietermijn="P5Y")
+        regel = ResultaatTypeArchiefregel.objects.sync(RESULTAATTYPE)
+
+        self.assertEqual(regel.versie, 2)
+        self.assertEqual(regel.archiefactietermijn, "P5Y")
+
+    def test_calculator_uses_local_rules(self, m):
+        ResultaatTypeArchiefregel.objects.sync(
+            RESULTAATTYPE, resultaattype=get_resultaattype()
+        )
+        zaak = ZaakFactory.create()
+        ResultaatFactory.create(zaak=zaak, resultaattype=RESULTAATTYPE)
+        calculator = BrondatumCalculator(
+            zaak, timezone.make_aware(datetime(2019, 1, 1))
+        )
+
+        self.assertEqual(calculator.calculate(), date(2029, 1, 1))
+        self.assertEqual(
+            calculator.get_archiefnominatie(), Archiefnominatie.vernietigen
+        )
+        m.assert_not_called()
+
+    def test_zaaktype_notification(self, m):
+        ResultaatTypeArchiefregel.objects.sync(
+            RESULTAATTYPE, resultaattype=get_resultaattype()
+        )
+        m.return_value = get_resultaattype(archiefactietermijn="P5Y")
+
+        default.handle(
+            {
+                "kanaal": "zaaktypen",
+                "hoofd_object": ZAAKTYPE,
+                "resource": "zaaktype",
+                "resource_url": ZAAKTYPE,
+                "actie": "update",
+                "kenmerken": {},
+            }
+        )
+
+        regel = ResultaatTypeArchiefregel.objects.get()
+        self.assertEqual(regel.archiefactietermijn, "P5Y")
+        self.assertEqual(regel.versie, 2)
@@ -0,0 +1,95 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from vng_api_common.constants import RolOmschrijving, RolTypes
+
+from zrc.datamodel.constants import BetrokkeneIdentificatie
+from zrc.datamodel.models import BetrokkeneIndex, Medewerker, NatuurlijkPersoon
+
+from .factories import RolFactory, ZaakFactory, ZaakObjectFactory
+
+
+class BetrokkeneIndexTests(TestCase):
+    def test_maintained_with_betrokkene(self):
+        rol = RolFactory.create(
+            betrokkene_type=RolTypes.natuurlijk_persoon,
+            omschrijving_generiek=RolOmschrijving.initiator,
+        )
+        persoon = NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+
+        self.assertEqual(
+            list(
+                BetrokkeneIndex.objects.values_list(
+                    "identificatie_type",
+                    "identificatie",
+                    "zaak_id",
+                    "rol_id",
+                    "omschrijving_generiek",
+                )
+            ),
+            [
+                (
+                    BetrokkeneIdentificatie.inp_bsn,
+                    "123456782",
+                    rol.zaak_id,
+                    rol.pk,
+                    RolOmschrijving.initiator,
+                )
+            ],
+        )
+
+        persoon.inp_bsn = ""
+        persoon.anp_identificatie = "12345"
+        persoon.save()
+        self.assertEqual(
+            list(
+                BetrokkeneIndex.objects.values_list(
+                    "identificatie_type", "identificatie"
+                )
+            ),
+            [(BetrokkeneIdentificatie.anp_identificatie, "12345")],
+        )
+
+        persoon.delete()
+        self.assertFalse(BetrokkeneIndex.objects.exists())
+
+    def test_removed_with_zaak(self):
+        rol = RolFactory.create(betrokkene_type=RolTypes.medewerker)
+        Medewerker.objects.create(rol=rol, identificatie="12345")
+
+        rol.zaak.delete()
+
+        self.assertFalse(BetrokkeneIndex.objects.exists())
+
+    def test_zaakobject_not_indexed(self):
+        zaakobject = ZaakObjectFactory.create()
+        NatuurlijkPersoon.objects.create(zaakobject=zaakobject, inp_bsn="123456782")
+
+        self.assertFalse(BetrokkeneIndex.objects.exists())
+
+    def test_rebuild_command(self):
+        zaak = ZaakFactory.create()
+        rol1 = RolFactory.create(zaak=zaak, betrokkene_type=RolTypes.medewerker)
+        Medewerker.objects.create(rol=rol1, identificatie="12345")
+        rol2 = RolFactory.create(zaak=zaak, betrokkene_type=RolTypes.natuurlijk_persoon)
+        NatuurlijkPersoon.objects.create(
+            rol=rol2, inp_bsn="123456782", inp_a_nummer="1234567890"
+        )
+        BetrokkeneIndex.objects.all().delete()
+
+        call_command("rebuild_betrokkene_index", chunk_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            set(
+                BetrokkeneIndex.objects.values_list(
+                    "identificatie_type", "identificatie", "zaak_id", "rol_id"
+                )
+            ),
+            {
+                (BetrokkeneIdentificatie.medewerker, "12345", zaak.pk, rol1.pk),
+                (BetrokkeneIdentificatie.inp_bsn, "123456782", zaak.pk, rol2.pk),
+                (BetrokkeneIdentificatie.inp_a_nummer, "1234567890", zaak.pk, rol2.pk),
+            },
+        )
@@ -0,0 +1,84 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
+
+from zrc.datamodel.models import ResultaatTypeArchiefregel, ZaakObject
+from zrc.datamodel.utils import BrondatumCalculator, get_zaak_objects
+
+from .factories import (
+    ResultaatFactory,
+    WozWaardeFactory,
+    ZaakFactory,
+    ZaakObjectFactory,
+)
+
+RESULTAATTYPE = "https://example.com/ztc/api/v1/resultaattypen/1"
+
+
+class GetZaakObjectsTests(TestCase):
+    def test_remote_objects(self):
+        zaak = ZaakFactory.create()
+        ZaakObjectFactory.create_batch(
+            3, zaak=zaak, object_type="pand", object="https://example.com/panden/1"
+        )
+        remote = {"einddatum": "2019-01-01T00:00:00Z"}
+
+        with patch.object(ZaakObject, "_get_object_client") as m:
+            m.return_value.retrieve.return_value = remote
+            zaak_objects = get_zaak_objects(zaak, "pand")
+
+        self.assertEqual(len(zaak_objects), 3)
+        self.assertEqual(m.call_count, 3)
+        for zaak_object in zaak_objects:
+            self.assertEqual(zaak_object._get_object(), remote)
+
+    def test_local_objects(self):
+        zaak = ZaakFactory.create()
+        for _ in range(3):
+            WozWaardeFactory.create(
+                zaakobject__zaak=zaak,
+                zaakobject__object="",
+                zaakobject__object_type="woz_waarde",
+            )
+
+        with self.assertNumQueries(1):
+            zaak_objects = get_zaak_objects(zaak, "woz_waarde")
+            for zaak_object in zaak_objects:
+                zaak_object.wozwaarde.waardepeildatum
+
+
+class BrondatumCalculatorTests(TestCase):
+    def test_zaak_objects_retrieved_once(self):
+        zaak = ZaakFactory.create()
+        ResultaatFactory.create(zaak=zaak, resultaattype=RESULTAATTYPE)
+        ZaakObjectFactory.create(
+            zaak=zaak, object_type="pand", object="https://example.com/panden/1"
+        )
+        ZaakObjectFactory.create(
+            zaak=zaak, object_type="pand", object="https://example.com/panden/2"
+        )
+        calculator = BrondatumCalculator(
+            zaak, timezone.make_aware(datetime(2019, 1, 1))
+        )
+        ResultaatTypeArchiefregel.objects.create(
+            resultaattype=RESULTAATTYPE,
+            archiefactietermijn="P10Y",
+            afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.zaakobject,
+            datumkenmerk="einddatum",
+            objecttype="pand",
+        )
+
+        with patch.object(ZaakObject, "_get_object_client") as m:
+            m.return_value.retrieve.side_effect = [
+                {"einddatum": "2018-01-01T00:00:00Z"},
+                {"einddatum": "2016-01-01T00:00:00Z"},
+            ]
+            # validation and creation both calculate the archiefactiedatum
+            self.assertEqual(calculator.calculate(), date(2028, 1, 1))
+            self.assertEqual(calculator.calculate(), date(2028, 1, 1))
+
+        self.assertEqual(m.return_value.retrieve.call_count, 2)
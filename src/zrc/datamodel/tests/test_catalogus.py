@@ -0,0 +1,101 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+from zrc.datamodel.constants import CatalogusResource
+from zrc.datamodel.handlers import default
+from zrc.datamodel.models import CatalogusObject
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+STATUSTYPE = "https://example.com/ztc/api/v1/statustypen/1"
+ROLTYPE = "https://example.com/ztc/api/v1/roltypen/1"
+
+
+def get_zaaktype(**kwargs) -> dict:
+    return {
+        "url": ZAAKTYPE,
+        "statustypen": [STATUSTYPE],
+        "roltypen": [ROLTYPE],
+        "resultaattypen": [],
+        "eigenschappen": [],
+        "informatieobjecttypen": [],
+        **kwargs,
+    }
+
+
+def retrieve(resource, url):
+    if resource == CatalogusResource.zaaktype:
+        return get_zaaktype()
+    return {"url": url, "zaaktype": ZAAKTYPE}
+
+
+@override_settings(CATALOGUS_MIRROR_ENABLED=True)
+@patch("zrc.datamodel.models.catalogus.retrieve_catalogus_object", side_effect=retrieve)
+class CatalogusObjectTests(TestCase):
+    def test_sync_zaaktype(self, m):
+        count = CatalogusObject.objects.sync_zaaktype(ZAAKTYPE)
+
+        self.assertEqual(count, 3)
+        statustype = CatalogusObject.objects.get(url=STATUSTYPE)
+        self.assertEqual(statustype.resource, CatalogusResource.statustype)
+        self.assertEqual(statustype.zaaktype, ZAAKTYPE)
+        self.assertEqual(CatalogusObject.objects.get(url=ZAAKTYPE).zaaktype, ZAAKTYPE)
+
+    def test_sync_zaaktype_removes_unlisted_resources(self, m):
+        CatalogusObject.objects.sync_zaaktype(ZAAKTYPE)
+        m.side_effect = lambda resource, url: (
+            get_zaaktype(roltypen=[])
+            if resource == CatalogusResource.zaaktype
+            else retrieve(resource, url)
+        )
+
+        CatalogusObject.objects.sync_zaaktype(ZAAKTYPE)
+
+        self.assertFalse(CatalogusObject.objects.filter(url=ROLTYPE).exists())
+
+    def test_get_or_retrieve_reads_mirror(self, m):
+        CatalogusObject.objects.sync_zaaktype(ZAAKTYPE)
+        remote = []
+
+        data = CatalogusObject.objects.get_or_retrieve(
+            CatalogusResource.statustype, STATUSTYPE, lambda: remote.append(1)
+        )
+
+        self.assertEqual(data, {"url": STATUSTYPE, "zaaktype": ZAAKTYPE})
+        self.assertEqual(remote, [])
+
+    @override_settings(CATALOGUS_MIRROR_ENABLED=False)
+    def test_get_or_retrieve_disabled(self, m):
+        data = CatalogusObject.objects.get_or_retrieve(
+            CatalogusResource.statustype, STATUSTYPE, lambda: {"url": STATUSTYPE}
+        )
+
+        self.assertEqual(data, {"url": STATUSTYPE})
+        self.assertFalse(CatalogusObject.objects.exists())
+
+    def test_zaaktype_notification(self, m):
+        default.handle(
+            {
+                "kanaal": "zaaktypen",
+                "hoofd_object": ZAAKTYPE,
+                "resource": "zaaktype",
+                "resource_url": ZAAKTYPE,
+                "actie": "update",
+                "kenmerken": {},
+            }
+        )
+
+        self.assertEqual(CatalogusObject.objects.count(), 3)
+
+        default.handle(
+            {
+                "kanaal": "zaaktypen",
+                "hoofd_object": ZAAKTYPE,
+                "resource": "zaaktype",
+                "resource_url": ZAAKTYPE,
+                "actie": "destroy",
+                "kenmerken": {},
+            }
+        )
+
+        self.assertFalse(CatalogusObject.objects.exists())
@@ -0,0 +1,261 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, TransactionTestCase
+
+from vng_api_common.constants import RolTypes, ZaakobjectTypes
+
+from zrc.datamodel.export import ZaakExporter, parse_resume_token
+from zrc.datamodel.models import Buurt, NatuurlijkPersoon, ZaakObject
+
+from .factories import (
+    ResultaatFactory,
+    RolFactory,
+    StatusFactory,
+    ZaakFactory,
+    ZaakObjectFactory,
+)
+
+
+class ExportTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def export(self, *args):
+        call_command("export_zaken", self.directory, *args, stdout=StringIO())
+
+    def read_ndjson(self, name="zaken-0.ndjson") -> list:
+        with open(os.path.join(self.directory, name)) as infile:
+            return [json.loads(line) for line in infile]
+
+
+class ZaakExporterTests(TestCase):
+    def test_chunks(self):
+        zaken = ZaakFactory.create_batch(5)
+
+        chunks = list(ZaakExporter(chunk_size=2).iter_chunks())
+
+        self.assertEqual([len(records) for _, records in chunks], [2, 2, 1])
+        self.assertEqual([last_pk for last_pk, _ in chunks][-1], zaken[-1].pk)
+
+    def test_related_resources(self):
+        hoofdzaak = ZaakFactory.create()
+        zaak = ZaakFactory.create(hoofdzaak=hoofdzaak)
+        StatusFactory.create_batch(2, zaak=zaak)
+        ResultaatFactory.create(zaak=zaak)
+        RolFactory.create(zaak=zaak)
+
+        records = list(ZaakExporter(queryset=hoofdzaak.deelzaken.all()).iter_records())
+
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual(record["uuid"], zaak.uuid)
+        self.assertEqual(record["hoofdzaak"], hoofdzaak.uuid)
+        self.assertEqual(len(record["statussen"]), 2)
+        self.assertIsNotNone(record["resultaat"])
+        self.assertEqual(len(record["rollen"]), 1)
+        self.assertEqual(record["zaakobjecten"], [])
+        self.assertEqual(parse_resume_token(record["resume_token"]), zaak.pk)
+
+    def test_identificatie(self):
+        zaak = ZaakFactory.create()
+        rol = RolFactory.create(
+            zaak=zaak, betrokkene="", betrokkene_type=RolTypes.natuurlijk_persoon
+        )
+        NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+        RolFactory.create(zaak=zaak, betrokkene_type=RolTypes.medewerker)
+        zaakobject = ZaakObjectFactory.create(
+            zaak=zaak, object="", object_type=ZaakobjectTypes.buurt
+        )
+        Buurt.objects.create(
+            zaakobject=zaakobject,
+            buurt_code="BU",
+            buurt_naam="Centrum",
+            gem_gemeente_code="0363",
+            wyk_wijk_code="WK",
+        )
+        # stored on the zaakobject itself
+        compact = ZaakObject(zaak=zaak, object_type=ZaakobjectTypes.buurt)
+        compact.set_object_identificatie(
+            {
+                "buurt_code": "BU",
+                "buurt_naam": "Oost",
+                "gem_gemeente_code": "0363",
+                "wyk_wijk_code": "WK",
+            }
+        )
+        compact.save()
+
+        record = next(ZaakExporter().iter_records())
+
+        rol1, rol2 = record["rollen"]
+        self.assertEqual(rol1["betrokkene_identificatie"]["inp_bsn"], "123456782")
+        self.assertIsNone(rol2["betrokkene_identificatie"])
+        self.assertEqual(
+            [
+                zaakobject["object_identificatie"]["buurt_naam"]
+                for zaakobject in record["zaakobjecten"]
+            ],
+            ["Centrum", "Oost"],
+        )
+        self.assertNotIn("_object_identificatie", record["zaakobjecten"][1])
+
+    def test_start_after(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(2)
+
+        records = list(ZaakExporter(start_after=zaak1.pk).iter_records())
+
+        self.assertEqual([record["uuid"] for record in records], [zaak2.uuid])
+
+
+class ExportZakenCommandTests(ExportTestMixin, TestCase):
+    def test_ndjson(self):
+        zaken = ZaakFactory.create_batch(3)
+        StatusFactory.create(zaak=zaken[0])
+
+        self.export("--chunk-size=2")
+
+        records = self.read_ndjson()
+        self.assertEqual(
+            [record["uuid"] for record in records], [str(zaak.uuid) for zaak in zaken]
+        )
+        self.assertEqual(len(records[0]["statussen"]), 1)
+        with open(os.path.join(self.directory, "export-state.json")) as infile:
+            state = json.load(infile)
+        self.assertEqual(state["partitions"][0]["last"], zaken[-1].pk)
+
+    def test_columnar(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create_batch(2, zaak=zaak)
+
+        self.export("--format=columnar")
+
+        part = os.path.join(self.directory, "part-0")
+        with open(os.path.join(part, "zaken.csv")) as infile:
+            zaken = list(csv.DictReader(infile))
+        with open(os.path.join(part, "statussen.csv")) as infile:
+            statussen = list(csv.DictReader(infile))
+        self.assertEqual([row["uuid"] for row in zaken], [str(zaak.uuid)])
+        self.assertEqual([row["zaak"] for row in statussen], [str(zaak.uuid)] * 2)
+
+    def test_columnar_identificatie(self):
+        rol = RolFactory.create(
+            betrokkene="", betrokkene_type=RolTypes.natuurlijk_persoon
+        )
+        NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+
+        self.export("--format=columnar")
+
+        with open(os.path.join(self.directory, "part-0", "rollen.csv")) as infile:
+            rollen = list(csv.DictReader(infile))
+        identificatie = json.loads(rollen[0]["betrokkene_identificatie"])
+        self.assertEqual(identificatie["inp_bsn"], "123456782")
+
+    def test_filter(self):
+        zaak = ZaakFactory.create(bronorganisatie="517439943")
+        ZaakFactory.create(bronorganisatie="000000000")
+
+        self.export("--bronorganisatie=517439943")
+
+        records = self.read_ndjson()
+        self.assertEqual([record["uuid"] for record in records], [str(zaak.uuid)])
+
+    def test_resume(self):
+        zaken = ZaakFactory.create_batch(2)
+        self.export()
+        zaak = ZaakFactory.create()
+        # simulate an export that was interrupted while writing the second zaak
+        path = os.path.join(self.directory, "zaken-0.ndjson")
+        with open(path) as infile:
+            first_line = infile.readline()
+        with open(path, "w") as outfile:
+            outfile.write(first_line + '{"uuid": ')
+        state_path = os.path.join(self.directory, "export-state.json")
+        with open(state_path) as infile:
+            state = json.load(infile)
+        state["partitions"][0].update(
+            last=zaken[0].pk, end=zaak.pk, offset=len(first_line)
+        )
+        with open(state_path, "w") as outfile:
+            json.dump(state, outfile)
+
+        self.export("--resume")
+
+        records = self.read_ndjson()
+        self.assertEqual(
+            [record["uuid"] for record in records],
+            [str(zaken[0].uuid), str(zaken[1].uuid), str(zaak.uuid)],
+        )
+
+    def test_resume_columnar(self):
+        zaak = ZaakFactory.create()
+        self.export("--format=columnar")
+        other = ZaakFactory.create()
+        state_path = os.path.join(self.directory, "export-state.json")
+        with open(state_path) as infile:
+            state = json.load(infile)
+        state["partitions"][0]["end"] = other.pk
+        with open(state_path, "w") as outfile:
+            json.dump(state, outfile)
+        # a chunk was written, but not recorded
+        path = os.path.join(self.directory, "part-0", "zaken.csv")
+        with open(path, "a") as outfile:
+            outfile.write(f"{other.uuid},")
+
+        self.export("--resume", "--format=columnar")
+
+        with open(path) as infile:
+            rows = list(csv.DictReader(infile))
+        self.assertEqual(
+            [row["uuid"] for row in rows], [str(zaak.uuid), str(other.uuid)]
+        )
+
+    def test_resume_keeps_filter(self):
+        zaak = ZaakFactory.create(bronorganisatie="517439943")
+        self.export("--bronorganisatie=517439943")
+        # created after the export was started, but with another bronorganisatie
+        other = ZaakFactory.create(bronorganisatie="000000000")
+        state_path = os.path.join(self.directory, "export-state.json")
+        with open(state_path) as infile:
+            state = json.load(infile)
+        state["partitions"][0]["end"] = other.pk
+        with open(state_path, "w") as outfile:
+            json.dump(state, outfile)
+
+        self.export("--resume")
+
+        records = self.read_ndjson()
+        self.assertEqual([record["uuid"] for record in records], [str(zaak.uuid)])
+
+    def test_resume_other_filter(self):
+        ZaakFactory.create(bronorganisatie="517439943")
+        self.export("--bronorganisatie=517439943")
+
+        with self.assertRaises(CommandError):
+            self.export("--resume", "--bronorganisatie=000000000")
+
+    def test_resume_without_export(self):
+        with self.assertRaises(CommandError):
+            self.export("--resume")
+
+
+class ExportZakenPartitionsTests(ExportTestMixin, TransactionTestCase):
+    def test_partitions(self):
+        zaken = ZaakFactory.create_batch(4)
+
+        self.export("--partitions=2")
+
+        exported = self.read_ndjson("zaken-0.ndjson") + self.read_ndjson(
+            "zaken-1.ndjson"
+        )
+        self.assertEqual(
+            sorted(record["uuid"] for record in exported),
+            sorted(str(zaak.uuid) for zaak in zaken),
+        )
@@ -0,0 +1,55 @@
+from datetime import date
+
+from django.test import TestCase
+
+from ..identificatie import reserve_identificaties
+from ..models import Zaak
+from .factories import ZaakFactory
+
+
+class ReserveIdentificatiesTests(TestCase):
+    def test_continues_after_issued_identificaties(self):
+        ZaakFactory.create(
+            bronorganisatie="517439943", identificatie="ZAAK-2019-0000000041"
+        )
+
+        self.assertEqual(
+            reserve_identificaties(Zaak, "517439943", 2019, 2),
+            ["ZAAK-2019-0000000042", "ZAAK-2019-0000000043"],
+        )
+        self.assertEqual(
+            reserve_identificaties(Zaak, "517439943", 2019),
+            ["ZAAK-2019-0000000044"],
+        )
+        self.assertEqual(
+            reserve_identificaties(Zaak, "517439943", 2020),
+            ["ZAAK-2020-0000000001"],
+        )
+
+    def test_numbered_per_bronorganisatie(self):
+        ZaakFactory.create(
+            bronorganisatie="517439943", identificatie="ZAAK-2019-0000000041"
+        )
+
+        self.assertEqual(
+            reserve_identificaties(Zaak, "000000000", 2019),
+            ["ZAAK-2019-0000000001"],
+        )
+
+    def test_skips_given_identificaties(self):
+        reserve_identificaties(Zaak, "517439943", 2019)
+        ZaakFactory.create(
+            bronorganisatie="517439943", identificatie="ZAAK-2019-0000000002"
+        )
+
+        self.assertEqual(
+            reserve_identificaties(Zaak, "517439943", 2019, 2),
+            ["ZAAK-2019-0000000003", "ZAAK-2019-0000000004"],
+        )
+
+    def test_zaak_save(self):
+        zaak = ZaakFactory.create(
+            bronorganisatie="517439943", registratiedatum=date(2019, 3, 1)
+        )
+
+        self.assertEqual(zaak.identificatie, "ZAAK-2019-0000000001")
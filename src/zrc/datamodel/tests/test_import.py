@@ -0,0 +1,183 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from zrc.datamodel.importer import ZaakImporter
+from zrc.datamodel.models import Zaak, ZaakSummary
+
+from .factories import ZaakFactory
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+STATUSTYPE = "https://example.com/ztc/api/v1/statustypen/1"
+
+
+def get_zaaktype(url: str):
+    if url != ZAAKTYPE:
+        return None
+    return {
+        "url": ZAAKTYPE,
+        "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
+    }
+
+
+def get_record(**kwargs) -> dict:
+    return {
+        "zaaktype": ZAAKTYPE,
+        "bronorganisatie": "517439943",
+        "verantwoordelijke_organisatie": "517439943",
+        "registratiedatum": "2019-03-01",
+        "startdatum": "2019-03-01",
+        **kwargs,
+    }
+
+
+@patch("zrc.datamodel.importer.ZaaktypeCache._retrieve", side_effect=get_zaaktype)
+class ZaakImporterTests(TestCase):
+    def test_import(self, m):
+        records = [
+            get_record(
+                statussen=[
+                    {
+                        "statustype": STATUSTYPE,
+                        "datum_status_gezet": "2019-03-01T12:00:00Z",
+                    }
+                ]
+            ),
+            get_record(identificatie="LEGACY-1"),
+        ]
+
+        results = list(ZaakImporter().run(records))
+
+        self.assertEqual(results[0].imported, 2)
+        self.assertEqual(results[0].errors, [])
+        zaak1, zaak2 = Zaak.objects.order_by("pk")
+        self.assertEqual(zaak1.identificatie, "ZAAK-2019-0000000001")
+        self.assertEqual(zaak2.identificatie, "LEGACY-1")
+        # derived from the zaaktype
+        self.assertEqual(
+            zaak1.vertrouwelijkheidaanduiding,
+            VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
+        )
+        self.assertEqual(zaak1.status_set.get().statustype, STATUSTYPE)
+        self.assertEqual(ZaakSummary.objects.get(zaak=zaak1).statustype, STATUSTYPE)
+        # every zaaktype is retrieved once
+        m.assert_called_once_with(ZAAKTYPE)
+
+    def test_invalid_records(self, m):
+        records = [
+            get_record(zaaktype="https://example.com/ztc/api/v1/zaaktypen/unknown"),
+            get_record(startdatum="invalid"),
+            get_record(hoofdzaak="d6f3a4d5-3ed0-4bd6-b6b2-bb8d1e5c64a0"),
+            get_record(),
+        ]
+
+        result = next(ZaakImporter().run(records))
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([line for line, _ in result.errors], [1, 2, 3])
+        self.assertIn("zaaktype", result.errors[0][1])
+        self.assertIn("startdatum", result.errors[1][1])
+        self.assertIn("hoofdzaak", result.errors[2][1])
+
+    def test_hoofdzaak(self, m):
+        existing = ZaakFactory.create()
+        records = [
+            get_record(uuid="2ab3a8b6-b6b8-4c44-9a69-d1ea1e5a0bc5"),
+            get_record(hoofdzaak="2ab3a8b6-b6b8-4c44-9a69-d1ea1e5a0bc5"),
+            get_record(hoofdzaak=str(existing.uuid)),
+        ]
+
+        list(ZaakImporter(chunk_size=2).run(records))
+
+        hoofdzaak = Zaak.objects.get(uuid="2ab3a8b6-b6b8-4c44-9a69-d1ea1e5a0bc5")
+        self.assertEqual(hoofdzaak.deelzaken.count(), 1)
+        self.assertEqual(existing.deelzaken.count(), 1)
+
+    def test_duplicate_uuid(self, m):
+        existing = ZaakFactory.create()
+        records = [
+            get_record(uuid=str(existing.uuid)),
+            get_record(uuid="2ab3a8b6-b6b8-4c44-9a69-d1ea1e5a0bc5"),
+            get_record(uuid="2ab3a8b6-b6b8-4c44-9a69-d1ea1e5a0bc5"),
+            get_record(),
+        ]
+
+        result = next(ZaakImporter().run(records))
+
+        self.assertEqual(result.imported, 2)
+        self.assertEqual([line for line, _ in result.errors], [1, 3])
+        self.assertIn("uuid", result.errors[0][1])
+        self.assertIn("uuid", result.errors[1][1])
+        self.assertEqual(Zaak.objects.count(), 3)
+
+    def test_duplicate_identificatie(self, m):
+        ZaakFactory.create(bronorganisatie="517439943", identificatie="LEGACY-1")
+        records = [
+            get_record(identificatie="LEGACY-1"),
+            get_record(identificatie="LEGACY-2"),
+            get_record(identificatie="LEGACY-2"),
+            # unique within another bronorganisatie
+            get_record(identificatie="LEGACY-1", bronorganisatie="111222333"),
+        ]
+
+        results = list(ZaakImporter(chunk_size=2).run(records))
+
+        self.assertEqual([result.imported for result in results], [1, 1])
+        self.assertEqual([line for line, _ in results[0].errors], [1])
+        self.assertEqual([line for line, _ in results[1].errors], [3])
+        self.assertIn("identificatie", results[0].errors[0][1])
+        self.assertIn("identificatie", results[1].errors[0][1])
+        self.assertEqual(
+            set(Zaak.objects.values_list("bronorganisatie", "identificatie")),
+            {
+                ("517439943", "LEGACY-1"),
+                ("517439943", "LEGACY-2"),
+                ("111222333", "LEGACY-1"),
+            },
+        )
+
+
+@patch("zrc.datamodel.importer.ZaaktypeCache._retrieve", side_effect=get_zaaktype)
+class ImportZakenCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_import_export(self, m):
+        zaak = ZaakFactory.create(zaaktype=ZAAKTYPE, identificatie="ZAAK-1")
+        call_command("export_zaken", self.directory, stdout=StringIO())
+        zaak.delete()
+
+        call_command(
+            "import_zaken",
+            os.path.join(self.directory, "zaken-0.ndjson"),
+            stdout=StringIO(),
+        )
+
+        imported = Zaak.objects.get()
+        self.assertEqual(imported.uuid, zaak.uuid)
+        self.assertEqual(imported.identificatie, "ZAAK-1")
+
+    def test_import_csv(self, m):
+        path = os.path.join(self.directory, "zaken.csv")
+        with open(path, "w") as outfile:
+            outfile.write(
+                "zaaktype,bronorganisatie,verantwoordelijke_organisatie,"
+                "registratiedatum,startdatum,producten_of_diensten\n"
+                f'{ZAAKTYPE},517439943,517439943,2019-03-01,2019-03-01,"[""https://example.com/product/1""]"\n'
+            )
+        stderr = StringIO()
+
+        call_command("import_zaken", path, stdout=StringIO(), stderr=stderr)
+
+        self.assertEqual(stderr.getvalue(), "")
+        zaak = Zaak.objects.get()
+        self.assertEqual(zaak.producten_of_diensten, ["https://example.com/product/1"])
@@ -0,0 +1,80 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+
+from zrc.datamodel.management.commands.migrate_domains import (
+    MAPPING,
+    ZRC,
+    group_per_table,
+)
+from zrc.datamodel.models import Status, Zaak
+
+from .factories import RelevanteZaakRelatieFactory, StatusFactory, ZaakFactory
+
+OLD_ZAAKTYPE = "https://ref.tst.vng.cloud/ztc/api/v1/zaaktypen/1"
+NEW_ZAAKTYPE = "https://catalogi-api.vng.cloud/api/v1/zaaktypen/1"
+
+
+class MigrateDomainsTests(TestCase):
+    def test_dry_run(self):
+        ZaakFactory.create_batch(2, zaaktype=OLD_ZAAKTYPE)
+        stdout = StringIO()
+
+        call_command("migrate_domains", dry_run=True, stdout=stdout)
+
+        self.assertIn("datamodel.Zaak.zaaktype: 2 objects to update", stdout.getvalue())
+        self.assertEqual(Zaak.objects.filter(zaaktype=OLD_ZAAKTYPE).count(), 2)
+
+    def test_bulk(self):
+        zaken = ZaakFactory.create_batch(3, zaaktype=OLD_ZAAKTYPE, with_etag=True)
+        other = ZaakFactory.create(
+            zaaktype="https://example.com/zaaktypen/1", with_etag=True
+        )
+        StatusFactory.create(
+            zaak=zaken[0],
+            statustype="https://ref.tst.vng.cloud/ztc/api/v1/statustypen/1",
+            with_etag=True,
+        )
+
+        call_command("migrate_domains", bulk=True, chunk_size=2, stdout=StringIO())
+
+        for zaak in zaken:
+            zaak.refresh_from_db()
+            self.assertEqual(zaak.zaaktype, NEW_ZAAKTYPE)
+            self.assertEqual(zaak._etag, "")
+        other.refresh_from_db()
+        self.assertEqual(other.zaaktype, "https://example.com/zaaktypen/1")
+        self.assertNotEqual(other._etag, "")
+        status = Status.objects.get()
+        self.assertEqual(
+            status.statustype, "https://catalogi-api.vng.cloud/api/v1/statustypen/1"
+        )
+        self.assertEqual(status._etag, "")
+
+    def test_group_per_table(self):
+        groups = group_per_table(MAPPING)
+
+        self.assertNotIn("datamodel.RelevanteZaakRelatie", groups)
+        self.assertIn(
+            ("datamodel.RelevanteZaakRelatie", "url", *ZRC), groups["datamodel.Zaak"]
+        )
+
+
+class MigrateDomainsParallelTests(TransactionTestCase):
+    def test_bulk_clears_parent_etag(self):
+        zaak = ZaakFactory.create(with_etag=True)
+        RelevanteZaakRelatieFactory.create(
+            zaak=zaak, url="https://ref.tst.vng.cloud/zrc/api/v1/zaken/1"
+        )
+        zaak.refresh_from_db()
+        zaak.calculate_etag_value()
+
+        call_command("migrate_domains", bulk=True, workers=2, stdout=StringIO())
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak._etag, "")
+        self.assertEqual(
+            zaak.relevante_andere_zaken.get().url,
+            "https://zaken-api.vng.cloud/api/v1/zaken/1",
+        )
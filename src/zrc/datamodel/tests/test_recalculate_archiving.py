@@ -0,0 +1,129 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from vng_api_common.constants import (
+    Archiefnominatie,
+    Archiefstatus,
+    BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
+)
+
+from zrc.datamodel.models import ResultaatTypeArchiefregel
+
+from .factories import ResultaatFactory, ZaakEigenschapFactory, ZaakFactory
+
+RESULTAATTYPE = "https://example.com/ztc/api/v1/resultaattypen/1"
+
+
+class RecalculateArchivingTests(TestCase):
+    def create_regel(self, **kwargs) -> ResultaatTypeArchiefregel:
+        return ResultaatTypeArchiefregel.objects.create(
+            resultaattype=RESULTAATTYPE,
+            archiefnominatie=Archiefnominatie.vernietigen,
+            archiefactietermijn="P10Y",
+            **kwargs,
+        )
+
+    def create_zaak(self, **kwargs):
+        zaak = ZaakFactory.create(einddatum=date(2020, 2, 29), **kwargs)
+        ResultaatFactory.create(zaak=zaak, resultaattype=RESULTAATTYPE)
+        return zaak
+
+    def recalculate(self, *args):
+        call_command(
+            "recalculate_archiving", *args, stdout=StringIO(), stderr=StringIO()
+        )
+
+    def test_afgehandeld(self):
+        self.create_regel(afleidingswijze=Afleidingswijze.afgehandeld)
+        zaak = self.create_zaak(archiefactiedatum=date(2021, 1, 1))
+        open_zaak = ZaakFactory.create()
+        ResultaatFactory.create(zaak=open_zaak, resultaattype=RESULTAATTYPE)
+        archived = self.create_zaak(
+            archiefactiedatum=date(2021, 1, 1),
+            archiefstatus=Archiefstatus.gearchiveerd,
+        )
+
+        self.recalculate()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefnominatie, Archiefnominatie.vernietigen)
+        self.assertEqual(zaak.archiefactiedatum, date(2030, 2, 28))
+        open_zaak.refresh_from_db()
+        self.assertIsNone(open_zaak.archiefactiedatum)
+        archived.refresh_from_db()
+        self.assertEqual(archived.archiefactiedatum, date(2021, 1, 1))
+
+    def test_termijn(self):
+        self.create_regel(afleidingswijze=Afleidingswijze.termijn, procestermijn="P1M")
+        zaak = self.create_zaak()
+
+        self.recalculate("--chunk-size=1")
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2030, 3, 29))
+
+    def test_hoofdzaak(self):
+        self.create_regel(afleidingswijze=Afleidingswijze.hoofdzaak)
+        hoofdzaak = ZaakFactory.create(einddatum=date(2019, 5, 1))
+        zaak = self.create_zaak(hoofdzaak=hoofdzaak)
+
+        self.recalculate()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2029, 5, 1))
+
+    def test_hoofdzaak_without_einddatum(self):
+        self.create_regel(afleidingswijze=Afleidingswijze.hoofdzaak)
+        hoofdzaak = ZaakFactory.create()
+        zaak = self.create_zaak(hoofdzaak=hoofdzaak, archiefactiedatum=date(2021, 1, 1))
+
+        self.recalculate()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2021, 1, 1))
+
+    def test_ander_datumkenmerk(self):
+        self.create_regel(
+            afleidingswijze=Afleidingswijze.ander_datumkenmerk,
+            datumkenmerk="vervaldatum",
+        )
+        zaak = self.create_zaak(archiefactiedatum=date(2021, 1, 1))
+
+        self.recalculate()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2021, 1, 1))
+
+    def test_eigenschap(self):
+        self.create_regel(
+            afleidingswijze=Afleidingswijze.eigenschap, datumkenmerk="vervaldatum"
+        )
+        zaak = self.create_zaak()
+        ZaakEigenschapFactory.create(
+            zaak=zaak, _naam="vervaldatum", waarde="2021-01-01T00:00:00Z"
+        )
+        # the brondatum can't be determined
+        other = self.create_zaak(archiefactiedatum=date(2021, 1, 1))
+
+        self.recalculate()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2031, 1, 1))
+        other.refresh_from_db()
+        self.assertEqual(other.archiefactiedatum, date(2021, 1, 1))
+
+    def test_without_archiefactietermijn(self):
+        ResultaatTypeArchiefregel.objects.create(
+            resultaattype=RESULTAATTYPE,
+            archiefnominatie=Archiefnominatie.blijvend_bewaren,
+        )
+        zaak = self.create_zaak(archiefactiedatum=date(2021, 1, 1))
+
+        self.recalculate(f"--resultaattype={RESULTAATTYPE}")
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefnominatie, Archiefnominatie.blijvend_bewaren)
+        self.assertIsNone(zaak.archiefactiedatum)
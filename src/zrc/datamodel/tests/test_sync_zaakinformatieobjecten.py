@@ -0,0 +1,77 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from zrc.api.utils import get_absolute_url
+
+from .factories import ZaakInformatieObjectFactory
+
+REMOTE_RELATION = "https://example.com/drc/api/v1/objectinformatieobjecten/1"
+
+
+@patch("zrc.sync.signals.get_client")
+@patch("zrc.datamodel.management.commands.sync_zaakinformatieobjecten.get_client")
+class SyncZaakInformatieObjectenTests(TestCase):
+    def create_zio(self, **kwargs):
+        with patch("zrc.sync.signals.sync_create_zio"):
+            return ZaakInformatieObjectFactory.create(**kwargs)
+
+    def sync(self):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("sync_zaakinformatieobjecten", stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_existing_remote_relation(self, mock_get_client, mock_sync_get_client):
+        zio = self.create_zio()
+        # synchronised already
+        self.create_zio(_objectinformatieobject=f"{REMOTE_RELATION}0")
+        mock_get_client.return_value.list.return_value = [{"url": REMOTE_RELATION}]
+
+        stdout, stderr = self.sync()
+
+        mock_get_client.return_value.list.assert_called_once_with(
+            "objectinformatieobject",
+            query_params={
+                "object": get_absolute_url("zaak-detail", zio.zaak.uuid),
+                "informatieobject": zio.informatieobject,
+            },
+        )
+        mock_sync_get_client.return_value.create.assert_not_called()
+        zio.refresh_from_db()
+        self.assertEqual(zio._objectinformatieobject, REMOTE_RELATION)
+        self.assertIn("Created 0 relations", stdout)
+        self.assertEqual(stderr, "")
+
+    def test_create(self, mock_get_client, mock_sync_get_client):
+        zio = self.create_zio()
+        mock_get_client.return_value.list.return_value = []
+        mock_sync_get_client.return_value.create.return_value = {"url": REMOTE_RELATION}
+
+        stdout, stderr = self.sync()
+
+        mock_sync_get_client.return_value.create.assert_called_once_with(
+            "objectinformatieobject",
+            {
+                "object": get_absolute_url("zaak-detail", zio.zaak.uuid),
+                "informatieobject": zio.informatieobject,
+                "objectType": "zaak",
+            },
+        )
+        zio.refresh_from_db()
+        self.assertEqual(zio._objectinformatieobject, REMOTE_RELATION)
+        self.assertIn("Created 1 relations", stdout)
+        self.assertEqual(stderr, "")
+
+    def test_failed(self, mock_get_client, mock_sync_get_client):
+        zio = self.create_zio()
+        mock_get_client.return_value.list.return_value = []
+        mock_sync_get_client.return_value.create.side_effect = Exception
+
+        stdout, stderr = self.sync()
+
+        zio.refresh_from_db()
+        self.assertEqual(zio._objectinformatieobject, "")
+        self.assertIn("0 relations in the Documenten API, 1 failed", stdout)
+        self.assertIn(zio.informatieobject, stderr)
@@ -23,9 +23,9 @@ class UniqueFriendlyIdentificationTests(APITestCase):
 
     @freeze_time("2019-01-01")
     def test_delete_then_create_zaak_unique_id(self):
-        zaak1 = ZaakFactory.create()
-        ZaakFactory.create()
+        zaak1 = ZaakFactory.create(bronorganisatie="517439943")
+        ZaakFactory.create(bronorganisatie="517439943")
         zaak1.delete()
-        zaak3 = ZaakFactory.create()
+        zaak3 = ZaakFactory.create(bronorganisatie="517439943")
 
         self.assertEqual(zaak3.identificatie, "ZAAK-2019-0000000003")
@@ -0,0 +1,113 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import Archiefnominatie, Archiefstatus
+
+from zrc.api.utils import get_absolute_url
+from zrc.datamodel.models import Status, Zaak
+
+from ..vernietiging import get_chunks, get_vernietigbare_zaken
+from .factories import StatusFactory, ZaakBesluitFactory, ZaakFactory
+
+TE_VERNIETIGEN = {
+    "archiefnominatie": Archiefnominatie.vernietigen,
+    "archiefactiedatum": date(2020, 1, 1),
+}
+
+
+@override_settings(NOTIFICATIONS_DISABLED=True)
+class VernietigZakenTests(TestCase):
+    def vernietig(self, *args):
+        call_command("vernietig_zaken", *args, stdout=StringIO(), stderr=StringIO())
+
+    def test_selection(self):
+        zaak = ZaakFactory.create(**TE_VERNIETIGEN)
+        ZaakFactory.create(
+            archiefnominatie=Archiefnominatie.vernietigen,
+            archiefactiedatum=date(2020, 1, 2),
+        )
+        ZaakFactory.create(
+            archiefnominatie=Archiefnominatie.blijvend_bewaren,
+            archiefactiedatum=date(2020, 1, 1),
+        )
+        ZaakFactory.create(archiefstatus=Archiefstatus.gearchiveerd, **TE_VERNIETIGEN)
+        ZaakBesluitFactory.create(zaak=ZaakFactory.create(**TE_VERNIETIGEN))
+
+        self.assertEqual(list(get_vernietigbare_zaken(date(2020, 1, 1))), [zaak])
+
+    def test_selection_deelzaken(self):
+        hoofdzaak = ZaakFactory.create(**TE_VERNIETIGEN)
+        deelzaak = ZaakFactory.create(hoofdzaak=hoofdzaak, **TE_VERNIETIGEN)
+        # the deelzaak has to be kept
+        bewaard = ZaakFactory.create(**TE_VERNIETIGEN)
+        ZaakFactory.create(hoofdzaak=bewaard)
+        # the deelzaak has a besluit
+        met_besluit = ZaakFactory.create(**TE_VERNIETIGEN)
+        ZaakBesluitFactory.create(
+            zaak=ZaakFactory.create(hoofdzaak=met_besluit, **TE_VERNIETIGEN)
+        )
+
+        self.assertEqual(
+            set(get_vernietigbare_zaken(date(2020, 1, 1))), {hoofdzaak, deelzaak}
+        )
+
+    def test_chunks_per_kenmerken(self):
+        zaken = [
+            ZaakFactory.create(bronorganisatie=bronorganisatie, **TE_VERNIETIGEN)
+            for bronorganisatie in ["517439943", "517439943", "000000000"]
+        ]
+        for zaak in zaken:
+            Zaak.objects.filter(pk=zaak.pk).update(
+                zaaktype="https://example.com/zaaktypen/1",
+                vertrouwelijkheidaanduiding="openbaar",
+            )
+
+        self.assertEqual(
+            list(get_chunks(Zaak.objects.all(), 1)),
+            [[zaken[2].pk], [zaken[0].pk], [zaken[1].pk]],
+        )
+        self.assertEqual(
+            list(get_chunks(Zaak.objects.all(), 10)),
+            [[zaken[2].pk], [zaken[0].pk, zaken[1].pk]],
+        )
+
+    def test_vernietig(self):
+        zaak = ZaakFactory.create(**TE_VERNIETIGEN)
+        deelzaak = ZaakFactory.create(hoofdzaak=zaak, **TE_VERNIETIGEN)
+        StatusFactory.create(zaak=zaak)
+        bewaard = ZaakFactory.create()
+        zaak_url = get_absolute_url("zaak-detail", zaak.uuid)
+        AuditTrail.objects.create(
+            bron="ZRC",
+            actie="create",
+            resultaat=201,
+            hoofd_object=zaak_url,
+            resource="zaak",
+            resource_url=zaak_url,
+            resource_weergave=zaak.identificatie,
+        )
+
+        self.vernietig("--toelichting", "Selectielijst 2020")
+
+        self.assertEqual(list(Zaak.objects.all()), [bewaard])
+        self.assertFalse(Status.objects.exists())
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.actie, "destroy")
+        self.assertEqual(audittrail.hoofd_object, get_absolute_url("zaak-list"))
+        self.assertEqual(audittrail.toelichting, "Selectielijst 2020")
+        self.assertEqual(
+            sorted(audittrail.oud["zaken"]),
+            sorted([zaak_url, get_absolute_url("zaak-detail", deelzaak.uuid)]),
+        )
+
+    def test_dry_run(self):
+        ZaakFactory.create(**TE_VERNIETIGEN)
+
+        self.vernietig("--dry-run")
+
+        self.assertTrue(Zaak.objects.exists())
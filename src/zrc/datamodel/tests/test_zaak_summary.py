@@ -0,0 +1,117 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from vng_api_common.constants import RolOmschrijving, RolTypes
+
+from zrc.datamodel.models import Medewerker, NatuurlijkPersoon, ZaakSummary
+
+from .factories import ResultaatFactory, RolFactory, StatusFactory, ZaakFactory
+
+STATUSTYPE1 = "https://example.com/ztc/api/v1/statustypen/1"
+STATUSTYPE2 = "https://example.com/ztc/api/v1/statustypen/2"
+RESULTAATTYPE = "https://example.com/ztc/api/v1/resultaattypen/1"
+
+
+class ZaakSummaryTests(TestCase):
+    def test_summary_created_with_zaak(self):
+        zaak = ZaakFactory.create()
+
+        summary = ZaakSummary.objects.get(zaak=zaak)
+        self.assertEqual(summary.statustype, "")
+        self.assertIsNone(summary.datum_status_gezet)
+        self.assertEqual(summary.resultaattype, "")
+        self.assertEqual(summary.initiator_bsn, "")
+        self.assertEqual(summary.behandelaar_identificatie, "")
+
+    def test_current_status(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create(
+            zaak=zaak,
+            statustype=STATUSTYPE2,
+            datum_status_gezet="2020-02-01T12:00:00Z",
+        )
+        first = StatusFactory.create(
+            zaak=zaak,
+            statustype=STATUSTYPE1,
+            datum_status_gezet="2020-01-01T12:00:00Z",
+        )
+
+        summary = ZaakSummary.objects.get(zaak=zaak)
+        self.assertEqual(summary.statustype, STATUSTYPE2)
+
+        StatusFactory.create(
+            zaak=zaak,
+            statustype=STATUSTYPE1,
+            datum_status_gezet="2020-03-01T12:00:00Z",
+        )
+        summary.refresh_from_db()
+        self.assertEqual(summary.statustype, STATUSTYPE1)
+
+        zaak.status_set.exclude(pk=first.pk).delete()
+        summary.refresh_from_db()
+        self.assertEqual(summary.statustype, STATUSTYPE1)
+        self.assertEqual(summary.datum_status_gezet, first.datum_status_gezet)
+
+    def test_resultaat(self):
+        zaak = ZaakFactory.create()
+        resultaat = ResultaatFactory.create(zaak=zaak, resultaattype=RESULTAATTYPE)
+
+        summary = ZaakSummary.objects.get(zaak=zaak)
+        self.assertEqual(summary.resultaattype, RESULTAATTYPE)
+
+        resultaat.delete()
+        summary.refresh_from_db()
+        self.assertEqual(summary.resultaattype, "")
+
+    def test_rollen(self):
+        zaak = ZaakFactory.create()
+        initiator = RolFactory.create(
+            zaak=zaak,
+            betrokkene_type=RolTypes.natuurlijk_persoon,
+            omschrijving_generiek=RolOmschrijving.initiator,
+        )
+        NatuurlijkPersoon.objects.create(rol=initiator, inp_bsn="123456782")
+        behandelaar = RolFactory.create(
+            zaak=zaak,
+            betrokkene_type=RolTypes.medewerker,
+            omschrijving_generiek=RolOmschrijving.behandelaar,
+        )
+        Medewerker.objects.create(rol=behandelaar, identificatie="mdw-1")
+
+        summary = ZaakSummary.objects.get(zaak=zaak)
+        self.assertEqual(summary.initiator_bsn, "123456782")
+        self.assertEqual(summary.behandelaar_identificatie, "mdw-1")
+
+        behandelaar.delete()
+        summary.refresh_from_db()
+        self.assertEqual(summary.initiator_bsn, "123456782")
+        self.assertEqual(summary.behandelaar_identificatie, "")
+
+    def test_delete_zaak(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create(zaak=zaak)
+        ResultaatFactory.create(zaak=zaak)
+        rol = RolFactory.create(
+            zaak=zaak, omschrijving_generiek=RolOmschrijving.initiator
+        )
+        NatuurlijkPersoon.objects.create(rol=rol, inp_bsn="123456782")
+
+        zaak.delete()
+
+        self.assertFalse(ZaakSummary.objects.exists())
+
+    def test_rebuild_command(self):
+        zaken = ZaakFactory.create_batch(3)
+        for zaak in zaken:
+            StatusFactory.create(zaak=zaak, statustype=STATUSTYPE1)
+        ZaakSummary.objects.all().delete()
+
+        call_command("rebuild_zaak_summaries", chunk_size=2, stdout=StringIO())
+
+        self.assertEqual(ZaakSummary.objects.count(), 3)
+        self.assertEqual(
+            set(ZaakSummary.objects.values_list("statustype", flat=True)),
+            {STATUSTYPE1},
+        )
@@ -1,19 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Union
+from typing import List, Union
 
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Max
-from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
-import isodate
 from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
-from vng_api_common.models import APICredential
 
 from zrc.utils import parse_isodatetime
+from zrc.utils.client import get_client
 from zrc.utils.exceptions import DetermineProcessEndDateException
 
-from .models import Zaak
+from .models import ResultaatTypeArchiefregel, Zaak, ZaakObject, parse_duration
 
 
 class BrondatumCalculator:
@@ -25,48 +25,54 @@ class BrondatumCalculator:
         if self.zaak.archiefactiedatum:
             return
 
-        resultaat = self._get_resultaat()
-        resultaattype = self._get_resultaattype(resultaat.resultaattype)
-        archiefactietermijn = resultaattype["archiefactietermijn"]
-        if not archiefactietermijn:
+        archiefregel = self._get_archiefregel()
+        if not archiefregel.archiefactietermijn:
             return
 
-        brondatum_archiefprocedure = resultaattype["brondatumArchiefprocedure"]
-        afleidingswijze = brondatum_archiefprocedure["afleidingswijze"]
-        datum_kenmerk = brondatum_archiefprocedure["datumkenmerk"]
-        objecttype = brondatum_archiefprocedure["objecttype"]
-        procestermijn = brondatum_archiefprocedure["procestermijn"]
+        afleidingswijze = archiefregel.afleidingswijze
+        objecttype = archiefregel.objecttype or None
+
+        zaak_objects = None
+        if afleidingswijze == BrondatumArchiefprocedureAfleidingswijze.zaakobject:
+            # calculate() runs during validation and again on create
+            zaak_objects = self._get_zaak_objects(objecttype)
 
         # FIXME: nasty side effect
         orig_value = self.zaak.einddatum
         self.zaak.einddatum = self.datum_status_gezet.date()
         brondatum = get_brondatum(
-            self.zaak, afleidingswijze, datum_kenmerk, objecttype, procestermijn
+            self.zaak,
+            afleidingswijze,
+            archiefregel.datumkenmerk or None,
+            objecttype,
+            archiefregel.procestermijn or None,
+            zaak_objects=zaak_objects,
         )
         self.zaak.einddatum = orig_value
         if not brondatum:
             return
 
-        return brondatum + isodate.parse_duration(archiefactietermijn)
+        return brondatum + archiefregel.archiefactietermijn_duur
 
     def get_archiefnominatie(self) -> str:
-        resultaat = self._get_resultaat()
-        resultaattype = self._get_resultaattype(resultaat.resultaattype)
-        return resultaattype["archiefnominatie"]
-
-    def _get_resultaattype(self, resultaattype_url: str):
-        if not hasattr(self, "_resultaattype"):
-            self._resultaattype = None
-            if resultaattype_url:
-                Client = import_string(settings.ZDS_CLIENT_CLASS)
-                client = Client.from_url(resultaattype_url)
-                client.auth = APICredential.get_auth(
-                    resultaattype_url, scopes=["zds.scopes.zaaktypes.lezen"]
-                )
-                self._resultaattype = client.retrieve(
-                    "resultaattype", url=resultaattype_url
+        return self._get_archiefregel().archiefnominatie
+
+    def _get_archiefregel(self) -> ResultaatTypeArchiefregel:
+        if not hasattr(self, "_archiefregel"):
+            resultaat = self._get_resultaat()
+            self._archiefregel = (
+                ResultaatTypeArchiefregel.objects.get_for_resultaattype(
+                    resultaat.resultaattype
                 )
-        return self._resultaattype
+            )
+        return self._archiefregel
+
+    def _get_zaak_objects(self, objecttype: str) -> List[ZaakObject]:
+        if not hasattr(self, "_zaak_objects"):
+            self._zaak_objects = {}
+        if objecttype not in self._zaak_objects:
+            self._zaak_objects[objecttype] = get_zaak_objects(self.zaak, objecttype)
+        return self._zaak_objects[objecttype]
 
     def _get_resultaat(self):
         if not hasattr(self, "_resultaat"):
@@ -74,12 +80,68 @@ class BrondatumCalculator:
         return self._resultaat
 
 
+def get_zaak_objects(zaak: Zaak, objecttype: str) -> List[ZaakObject]:
+    """
+    Load the ZAAKOBJECTen of a type with their local or remote object.
+
+    Local objects are loaded in the same query, remote objects are retrieved
+    in parallel.
+    """
+    queryset = zaak.zaakobject_set.filter(object_type=objecttype)
+    local_field = objecttype.replace("_", "")
+    try:
+        ZaakObject._meta.get_field(local_field)
+    except FieldDoesNotExist:
+        pass
+    else:
+        queryset = queryset.select_related(local_field)
+
+    zaak_objects = list(queryset)
+    fetch_remote_objects(zaak_objects)
+    return zaak_objects
+
+
+def fetch_remote_objects(zaak_objects: List[ZaakObject]) -> None:
+    """
+    Retrieve the remote objects of the ZAAKOBJECTen concurrently.
+
+    The objects are cached on the instances, see
+    :meth:`zrc.datamodel.models.ZaakObject._get_object`.
+    """
+    pending = [
+        zaak_object
+        for zaak_object in zaak_objects
+        if zaak_object.object and not hasattr(zaak_object, "_object")
+    ]
+    if len(pending) <= 1:
+        for zaak_object in pending:
+            zaak_object._get_object()
+        return
+
+    # the clients are set up in this thread, since the credentials come
+    # from the database
+    clients = [zaak_object._get_object_client() for zaak_object in pending]
+    workers = min(settings.ZAAKOBJECT_FETCH_WORKERS, len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        objects = list(
+            executor.map(
+                lambda zaak_object, client: zaak_object._retrieve_object(client),
+                pending,
+                clients,
+            )
+        )
+
+    for zaak_object, remote_object in zip(pending, objects):
+        zaak_object._object = remote_object
+
+
 def get_brondatum(
     zaak: Zaak,
     afleidingswijze: str,
     datum_kenmerk: str = None,
     objecttype: str = None,
     procestermijn: str = None,
+    zaak_objects: List[ZaakObject] = None,
 ) -> date:
     """
     To calculate the Archiefactiedatum, we first need the "brondatum" which is like the start date of the storage
@@ -96,6 +158,9 @@ def get_brondatum(
     :param procestermijn:
         A `string` representing an ISO8601 period that is considered the process term of the Zaak. Currently only
         needed when `afleidingswijze` is `termijn`.
+    :param zaak_objects:
+        The ZAAKOBJECTen of `objecttype`, as loaded by `get_zaak_objects`. Loaded if not provided and
+        `afleidingswijze` is `zaakobject`.
     :return:
         A specific date that marks the start of the storage period, or `None`.
     """
@@ -154,8 +219,11 @@ def get_brondatum(
                 )
             )
 
+        if zaak_objects is None:
+            zaak_objects = get_zaak_objects(zaak, objecttype)
+
         dates = []
-        for zaak_object in zaak.zaakobject_set.filter(object_type=objecttype):
+        for zaak_object in zaak_objects:
             if zaak_object.object:
                 remote_object = zaak_object._get_object()
                 value = remote_object.get(datum_kenmerk)
@@ -198,7 +266,7 @@ def get_brondatum(
                 _("Geen procestermijn aanwezig voor het bepalen van de brondatum.")
             )
         try:
-            return zaak.einddatum + isodate.parse_duration(procestermijn)
+            return zaak.einddatum + parse_duration(procestermijn)
         except (ValueError, TypeError):
             raise DetermineProcessEndDateException(
                 _("Geen geldige periode in procestermijn: {}").format(procestermijn)
@@ -216,9 +284,7 @@ def get_brondatum(
 
         einddatum_max_external = None
         for relevante_zaak in relevante_zaken.all():
-            Client = import_string(settings.ZDS_CLIENT_CLASS)
-            client = Client.from_url(relevante_zaak.url)
-            client.auth = APICredential.get_auth(relevante_zaak.url)
+            client = get_client(relevante_zaak.url)
             data = client.retrieve("zaak", url=relevante_zaak.url)
             if data["einddatum"] is None:
                 continue
@@ -245,9 +311,7 @@ def get_brondatum(
                 _("Geen besluiten aan zaak gekoppeld om brondatum uit af te leiden.")
             )
 
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(zaakbesluiten.first().besluit)
-        client.auth = APICredential.get_auth(zaakbesluiten.first().besluit)
+        client = get_client(zaakbesluiten.first().besluit)
 
         max_ingangsdatum = None
         for zaakbesluit in zaakbesluiten:
@@ -269,9 +333,7 @@ def get_brondatum(
                 _("Geen besluiten aan zaak gekoppeld om brondatum uit af te leiden.")
             )
 
-        Client = import_string(settings.ZDS_CLIENT_CLASS)
-        client = Client.from_url(zaakbesluiten.first().besluit)
-        client.auth = APICredential.get_auth(zaakbesluiten.first().besluit)
+        client = get_client(zaakbesluiten.first().besluit)
 
         max_vervaldatum = None
         for zaakbesluit in zaakbesluiten:
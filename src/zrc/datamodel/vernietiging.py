@@ -0,0 +1,192 @@
+"""
+Destroy (vernietigen) ZAAKen whose archiefactiedatum has passed, in bulk.
+
+ZAAKen with archiefnominatie ``vernietigen`` are selected with the index on
+archiefnominatie and archiefactiedatum. ZAAKen with BESLUITen - or with
+deelzaken with BESLUITen - are skipped with a single subquery instead of running
+:class:`zrc.api.validators.ZaakBesluitValidator` for every ZAAK, and so are the
+ZAAKen with deelzaken that may not be destroyed yet.
+
+Every chunk is deleted in its own transaction with
+:func:`zrc.datamodel.deletion.delete_zaken`. Instead of an audit trail entry and
+a notification for every ZAAK, one audit trail entry listing the destroyed ZAAKen
+is created per chunk and one notification is sent per chunk. The Notificaties
+API has no message for several objects, so the notification refers to the
+``zaken`` collection. The kenmerken of a notification have to hold for all of
+its ZAAKen, hence the ZAAKen are chunked per bronorganisatie, zaaktype and
+vertrouwelijkheidaanduiding.
+"""
+import logging
+from datetime import date
+from itertools import groupby, islice
+from operator import attrgetter
+from typing import Iterable, Iterator, List
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from djangorestframework_camel_case.util import camelize
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import (
+    Archiefnominatie,
+    Archiefstatus,
+    CommonResourceAction,
+)
+from vng_api_common.notifications.api.serializers import NotificatieSerializer
+from vng_api_common.notifications.models import NotificationsConfig
+from zds_client import ClientError
+
+from zrc.api.audits import AUDIT_ZRC
+from zrc.api.kanalen import KANAAL_ZAKEN
+from zrc.api.utils import get_absolute_url
+from zrc.sync.signals import unlink_remote_relations
+
+from .deletion import delete_zaken, get_zaak_ids_with_deelzaken
+from .models import Zaak, ZaakBesluit
+
+logger = logging.getLogger(__name__)
+
+
+def _vernietigbaar(datum: date) -> Q:
+    return Q(
+        archiefnominatie=Archiefnominatie.vernietigen,
+        archiefstatus=Archiefstatus.nog_te_archiveren,
+        archiefactiedatum__lte=datum,
+    )
+
+
+def get_vernietigbare_zaken(datum: date = None) -> QuerySet:
+    """
+    ZAAKen to be destroyed on ``datum`` (today by default) which can be deleted
+    together with their deelzaken.
+    """
+    vernietigbaar = _vernietigbaar(datum or timezone.now().date())
+    return (
+        Zaak.objects.filter(vernietigbaar)
+        .exclude(pk__in=ZaakBesluit.objects.values("zaak_id"))
+        .exclude(
+            pk__in=ZaakBesluit.objects.filter(zaak__hoofdzaak__isnull=False).values(
+                "zaak__hoofdzaak_id"
+            )
+        )
+        .exclude(
+            pk__in=Zaak.objects.filter(hoofdzaak__isnull=False)
+            .exclude(vernietigbaar)
+            .values("hoofdzaak_id")
+        )
+    )
+
+
+def get_chunks(zaken: QuerySet, chunk_size: int) -> Iterator[List[int]]:
+    """
+    Split the ZAAKen in chunks of ZAAKen with the same kenmerken.
+    """
+    rows = zaken.order_by(*KANAAL_ZAKEN.kenmerken, "pk").values_list(
+        *KANAAL_ZAKEN.kenmerken, "pk"
+    )
+    for _, group in groupby(rows.iterator(), key=lambda row: row[:-1]):
+        while True:
+            chunk = [row[-1] for row in islice(group, chunk_size)]
+            if not chunk:
+                break
+            yield chunk
+
+
+def _create_audittrail(
+    urls: List[str], toelichting: str, gebruikers_id: str, gebruikers_weergave: str
+) -> AuditTrail:
+    collection_url = get_absolute_url("zaak-list")
+    return AuditTrail.objects.create(
+        bron=AUDIT_ZRC.component_name,
+        actie=CommonResourceAction.destroy,
+        actie_weergave=CommonResourceAction.labels[CommonResourceAction.destroy],
+        resultaat=204,
+        hoofd_object=collection_url,
+        resource=AUDIT_ZRC.main_resource,
+        resource_url=collection_url,
+        resource_weergave=f"{len(urls)} zaken vernietigd",
+        oud={"zaken": urls},
+        toelichting=toelichting,
+        gebruikers_id=gebruikers_id,
+        gebruikers_weergave=gebruikers_weergave,
+    )
+
+
+def _notify(zaken: List[Zaak]) -> None:
+    if settings.NOTIFICATIONS_DISABLED:
+        return
+
+    client = NotificationsConfig.get_client()
+    if client is None:
+        raise RuntimeError("Could not build a client for Notifications API")
+
+    collection_url = get_absolute_url("zaak-list")
+    get_kenmerken = attrgetter(*KANAAL_ZAKEN.kenmerken)
+    for _, group in groupby(sorted(zaken, key=get_kenmerken), key=get_kenmerken):
+        message_data = {
+            "kanaal": KANAAL_ZAKEN.label,
+            "hoofd_object": collection_url,
+            "resource": "zaak",
+            "resource_url": collection_url,
+            "actie": CommonResourceAction.destroy,
+            "aanmaakdatum": timezone.now(),
+            "kenmerken": KANAAL_ZAKEN.get_kenmerken(next(group)),
+        }
+        message = camelize(NotificatieSerializer(instance=message_data).data)
+
+        def _send(message=message):
+            try:
+                client.create("notificaties", message)
+            except ClientError:
+                logger.warning(
+                    "Could not deliver message to %s",
+                    client.base_url,
+                    exc_info=True,
+                    extra={"notification_msg": message},
+                )
+
+        transaction.on_commit(_send)
+
+
+def vernietig_zaken(
+    zaak_ids: Iterable[int],
+    datum: date = None,
+    toelichting: str = "",
+    gebruikers_id: str = "",
+    gebruikers_weergave: str = "",
+) -> int:
+    """
+    Destroy the ZAAKen which can be destroyed on ``datum``, with their deelzaken,
+    in one transaction.
+
+    :return: the number of destroyed ZAAKen, including the deelzaken
+    :raises zrc.sync.signals.SyncError: if a relation in another API couldn't be removed
+    """
+    with transaction.atomic():
+        zaken = list(
+            get_vernietigbare_zaken(datum)
+            .filter(pk__in=list(zaak_ids))
+            .select_for_update()
+        )
+        if not zaken:
+            return 0
+
+        zaak_ids = get_zaak_ids_with_deelzaken([zaak.pk for zaak in zaken])
+        urls = [
+            get_absolute_url("zaak-detail", uuid)
+            for uuid in Zaak.objects.filter(pk__in=zaak_ids).values_list(
+                "uuid", flat=True
+            )
+        ]
+
+        unlink_remote_relations(zaak_ids)
+        delete_zaken(zaak_ids)
+
+        # the audit trails of the destroyed zaken are replaced by a single entry
+        AuditTrail.objects.filter(hoofd_object__in=urls).delete()
+        _create_audittrail(urls, toelichting, gebruikers_id, gebruikers_weergave)
+        _notify(zaken)
+
+    return len(zaak_ids)
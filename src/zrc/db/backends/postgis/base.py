@@ -0,0 +1,42 @@
+"""
+PostGIS backend with health checks of persistent connections.
+
+With ``CONN_MAX_AGE`` a connection is reused by the next requests of the
+thread, but Django only checks it after an error in the previous request. A
+connection closed by the database server in between, e.g. by a restart or a
+failover, makes the next request fail. With ``CONN_HEALTH_CHECKS`` a reused
+connection is checked before its first use in a request and reconnected if
+needed, like Django does from version 4.1 on.
+"""
+from django.contrib.gis.db.backends.postgis.base import (
+    DatabaseWrapper as PostGISDatabaseWrapper,
+)
+
+
+class DatabaseWrapper(PostGISDatabaseWrapper):
+    health_check_done = False
+
+    @property
+    def health_check_enabled(self) -> bool:
+        return bool(self.settings_dict.get("CONN_HEALTH_CHECKS", False))
+
+    def connect(self):
+        super().connect()
+        self.health_check_done = True
+
+    def ensure_connection(self):
+        if (
+            self.connection is not None
+            and self.health_check_enabled
+            and not self.health_check_done
+            and not self.in_atomic_block
+        ):
+            if not self.is_usable():
+                self.close()
+            self.health_check_done = True
+        super().ensure_connection()
+
+    def close_if_unusable_or_obsolete(self):
+        super().close_if_unusable_or_obsolete()
+        # check the connection again when it is used by the next request
+        self.health_check_done = False
@@ -0,0 +1,114 @@
+"""
+Route the reads of API requests that don't change anything to read replicas.
+
+The API requests with a safe method and the searches (``_zoek``) read from one
+of the ``DATABASE_REPLICAS``, see :class:`zrc.middleware.ReadReplicaMiddleware`.
+All other reads and all writes use the default database.
+
+A replica lags behind the default database. So clients read their own writes,
+the reads of a client go to the default database for
+``DB_REPLICA_STICKY_SECONDS`` after a write of that client, and for requests
+with the ``X-Read-Primary`` header. A replica that can't be connected to is
+skipped for ``DB_REPLICA_RETRY_SECONDS``.
+
+The viewsets with ``read_primary = True`` always read from the default
+database. The DRC and KCC read a zaakinformatieobject, zaakcontactmoment or
+zaakverzoek back with their own client ID while it is created, before it can
+be on a replica.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+
+import jwt
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+# replica alias -> time.monotonic() until which the replica is skipped
+_unavailable = {}
+
+
+def get_read_database() -> Optional[str]:
+    return getattr(_local, "alias", None)
+
+
+def set_read_database(alias: Optional[str]) -> None:
+    _local.alias = alias
+
+
+def get_client_id(request) -> Optional[str]:
+    """
+    Return the client ID of the JWT of the request, without validating it.
+
+    The JWT is validated by the API views, the client ID only determines where
+    the reads go.
+    """
+    jwt_auth = getattr(request, "jwt_auth", None)
+    if jwt_auth is None or not jwt_auth.encoded:
+        return None
+    try:
+        return jwt.decode(jwt_auth.encoded, verify=False).get("client_id")
+    except jwt.DecodeError:
+        return None
+
+
+def _get_write_key(client_id: str) -> str:
+    return f"db_router:write:{client_id}"
+
+
+def record_write(client_id: Optional[str]) -> None:
+    if client_id:
+        cache.set(
+            _get_write_key(client_id),
+            True,
+            timeout=settings.DB_REPLICA_STICKY_SECONDS,
+        )
+
+
+def has_recent_write(client_id: Optional[str]) -> bool:
+    return bool(client_id) and cache.get(_get_write_key(client_id), False)
+
+
+def is_available(alias: str) -> bool:
+    if _unavailable.get(alias, 0) > time.monotonic():
+        return False
+
+    try:
+        connections[alias].ensure_connection()
+    except OperationalError:
+        logger.warning("Read replica %s is unavailable", alias, exc_info=True)
+        _unavailable[alias] = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+        return False
+
+    _unavailable.pop(alias, None)
+    return True
+
+
+def choose_replica() -> Optional[str]:
+    """
+    Return a random available replica, or ``None`` if there is none.
+    """
+    replicas = list(settings.DATABASE_REPLICAS)
+    random.shuffle(replicas)
+    return next((alias for alias in replicas if is_available(alias)), None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return get_read_database()
+
+    def db_for_write(self, model, **hints):
+        # also for objects read from a replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the replicas hold the same data as the default database
+        return True
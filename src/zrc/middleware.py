@@ -1,3 +1,15 @@
+from django.conf import settings
+
+from rest_framework.permissions import SAFE_METHODS
+
+from .db_router import (
+    choose_replica,
+    get_client_id,
+    has_recent_write,
+    record_write,
+    set_read_database,
+)
+
 # See https://github.com/Geonovum/KP-APIs/blob/master/Werkgroep%20API%20strategie/extensies/ext-versionering.md
 
 WARNING_HEADER = "Warning"
@@ -51,3 +63,58 @@ class DeprecationMiddleware:
         )
 
         return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Read from a replica for API requests that don't change anything.
+
+    See :mod:`zrc.db_router`.
+    """
+
+    header = "HTTP_X_READ_PRIMARY"
+
+    def __init__(self, get_response=None):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if self.get_response is None:
+            return None
+
+        try:
+            response = self.get_response(request)
+        finally:
+            set_read_database(None)
+
+        if getattr(request, "_is_write", False):
+            record_write(get_client_id(request))
+
+        return response
+
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        # not a viewset
+        if not hasattr(callback, "cls") or not settings.DATABASE_REPLICAS:
+            return None
+
+        if not self.is_read(request, callback):
+            request._is_write = True
+            return None
+
+        if (
+            getattr(callback.cls, "read_primary", False)
+            or request.META.get(self.header)
+            or has_recent_write(get_client_id(request))
+        ):
+            return None
+
+        set_read_database(choose_replica())
+        return None
+
+    @staticmethod
+    def is_read(request, callback) -> bool:
+        if request.method in SAFE_METHODS:
+            return True
+
+        action = getattr(callback, "actions", {}).get(request.method.lower())
+        handler = getattr(callback.cls, action, None) if action else None
+        return getattr(handler, "is_search_action", False)
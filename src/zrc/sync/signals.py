@@ -1,15 +1,19 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterable, List, Optional
+from uuid import UUID
 
+from django.conf import settings
 from django.core.cache import caches
+from django.db import connection, transaction
 from django.db.models.signals import post_save, pre_delete
 from django.dispatch import receiver
 
-from vng_api_common.models import APICredential
-from zds_client import Client
-
 from zrc.api.utils import get_absolute_url
 from zrc.datamodel.models import ZaakContactMoment, ZaakInformatieObject
 from zrc.datamodel.models.core import ZaakVerzoek
+from zrc.utils.client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,18 @@ class SyncError(Exception):
     pass
 
 
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.DRC_SYNC_WORKERS, thread_name_prefix="drc-sync"
+        )
+    return _executor
+
+
 def sync_create_zio(relation: ZaakInformatieObject):
     zaak_url = get_absolute_url("zaak-detail", relation.zaak.uuid)
 
@@ -26,11 +42,10 @@ def sync_create_zio(relation: ZaakInformatieObject):
 
     # Define the remote resource with which we need to interact
     resource = "objectinformatieobject"
-    client = Client.from_url(relation.informatieobject)
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client = get_client(relation.informatieobject)
 
     try:
-        client.create(
+        response = client.create(
             resource,
             {
                 "object": zaak_url,
@@ -42,6 +57,40 @@ def sync_create_zio(relation: ZaakInformatieObject):
         logger.error(f"Could not create remote relation", exc_info=1)
         raise SyncError(f"Could not create remote relation") from exc
 
+    # save the relation url for the delete signal, without sending signals
+    relation._objectinformatieobject = response["url"]
+    ZaakInformatieObject.objects.filter(pk=relation.pk).update(
+        _objectinformatieobject=response["url"]
+    )
+
+
+def _run_deferred_sync_create_zio(pk: int) -> None:
+    try:
+        relation = (
+            ZaakInformatieObject.objects.select_related("zaak").filter(pk=pk).first()
+        )
+        # deleted in the meantime
+        if relation is not None and not relation._objectinformatieobject:
+            sync_create_zio(relation)
+    except SyncError:
+        # logged already, sync_zaakinformatieobjecten creates it later on
+        pass
+    except Exception:
+        logger.exception("Could not create the remote relation of %s", pk)
+    finally:
+        # the worker threads have their own database connection
+        connection.close()
+
+
+def defer_sync_create_zio(relation: ZaakInformatieObject):
+    """
+    Create the remote relation in the background, once the ZIO is committed.
+    """
+    pk = relation.pk
+    transaction.on_commit(
+        lambda: _get_executor().submit(_run_deferred_sync_create_zio, pk)
+    )
+
 
 def sync_delete_zio(relation: ZaakInformatieObject):
     zaak_url = get_absolute_url("zaak-detail", relation.zaak.uuid)
@@ -51,24 +100,25 @@ def sync_delete_zio(relation: ZaakInformatieObject):
 
     # Define the remote resource with which we need to interact
     resource = "objectinformatieobject"
-    client = Client.from_url(relation.informatieobject)
-    client.auth = APICredential.get_auth(relation.informatieobject)
+    client = get_client(relation.informatieobject)
 
     # Retrieve the url of the relation between the object and
-    # the informatieobject
-    response = client.list(
-        resource,
-        query_params={
-            "object": zaak_url,
-            "informatieobject": relation.informatieobject,
-        },
-    )
-    try:
-        relation_url = response[0]["url"]
-    except IndexError as exc:
-        msg = "No relations found in DRC for this Zaak"
-        logger.error(msg, exc_info=1)
-        raise IndexError(msg) from exc
+    # the informatieobject, unless it was saved on creation
+    relation_url = relation._objectinformatieobject
+    if not relation_url:
+        response = client.list(
+            resource,
+            query_params={
+                "object": zaak_url,
+                "informatieobject": relation.informatieobject,
+            },
+        )
+        try:
+            relation_url = response[0]["url"]
+        except IndexError as exc:
+            msg = "No relations found in DRC for this Zaak"
+            logger.error(msg, exc_info=1)
+            raise IndexError(msg) from exc
 
     try:
         client.delete(resource, url=relation_url)
@@ -85,8 +135,7 @@ def sync_create_zaakcontactmoment(relation: ZaakContactMoment):
 
     # Define the remote resource with which we need to interact
     resource = "objectcontactmoment"
-    client = Client.from_url(relation.contactmoment)
-    client.auth = APICredential.get_auth(relation.contactmoment)
+    client = get_client(relation.contactmoment)
 
     try:
         response = client.create(
@@ -108,8 +157,7 @@ def sync_create_zaakcontactmoment(relation: ZaakContactMoment):
 
 def sync_delete_zaakcontactmoment(relation: ZaakContactMoment):
     resource = "objectcontactmoment"
-    client = Client.from_url(relation.contactmoment)
-    client.auth = APICredential.get_auth(relation.contactmoment)
+    client = get_client(relation.contactmoment)
 
     try:
         client.delete(resource, url=relation._objectcontactmoment)
@@ -126,8 +174,7 @@ def sync_create_zaakverzoek(relation: ZaakVerzoek):
 
     # Define the remote resource with which we need to interact
     resource = "objectverzoek"
-    client = Client.from_url(relation.verzoek)
-    client.auth = APICredential.get_auth(relation.verzoek)
+    client = get_client(relation.verzoek)
 
     try:
         response = client.create(
@@ -149,8 +196,7 @@ def sync_create_zaakverzoek(relation: ZaakVerzoek):
 
 def sync_delete_zaakverzoek(relation: ZaakVerzoek):
     resource = "objectverzoek"
-    client = Client.from_url(relation.verzoek)
-    client.auth = APICredential.get_auth(relation.verzoek)
+    client = get_client(relation.verzoek)
 
     try:
         client.delete(resource, url=relation._objectverzoek)
@@ -159,6 +205,88 @@ def sync_delete_zaakverzoek(relation: ZaakVerzoek):
         raise SyncError(f"Could not delete remote relation") from exc
 
 
+@contextmanager
+def marked_for_delete(cache_alias: str, key: str, uuids: List[UUID]):
+    """
+    Mark the relations as deleted for the duration of the block, hiding them
+    from GET requests on the ZRC, allowing the validation in the other API to
+    pass when the remote relation is deleted.
+    """
+    cache = caches[cache_alias]
+    cache.set(key, (cache.get(key) or []) + uuids)
+    try:
+        yield
+    finally:
+        marked = cache.get(key) or []
+        for uuid in uuids:
+            if uuid in marked:
+                marked.remove(uuid)
+        cache.set(key, marked)
+
+
+def _run_sync_delete(sync_delete, relation) -> Optional[Exception]:
+    try:
+        sync_delete(relation)
+    except Exception as exc:
+        return exc
+    finally:
+        # the worker threads have their own database connection
+        connection.close()
+
+
+def unlink_remote_relations(zaak_ids: Iterable[int]) -> None:
+    """
+    Delete the relations in the Documenten, Contactmomenten and Verzoeken APIs
+    of the ZAAKen about to be deleted, concurrently.
+
+    Used instead of the ``pre_delete`` receivers when the ZAAKen are deleted
+    without signals, see :mod:`zrc.datamodel.deletion`.
+
+    :raises: the error of the first relation that could not be deleted, after
+      all relations were attempted
+    """
+    zaak_ids = list(zaak_ids)
+    zios = list(
+        ZaakInformatieObject.objects.filter(zaak_id__in=zaak_ids).select_related("zaak")
+    )
+    zcms = list(
+        ZaakContactMoment.objects.filter(zaak_id__in=zaak_ids).exclude(
+            _objectcontactmoment=""
+        )
+    )
+    zvs = list(
+        ZaakVerzoek.objects.filter(zaak_id__in=zaak_ids).exclude(_objectverzoek="")
+    )
+
+    tasks = (
+        [(sync_delete_zio, zio) for zio in zios]
+        + [(sync_delete_zaakcontactmoment, zcm) for zcm in zcms]
+        + [(sync_delete_zaakverzoek, zv) for zv in zvs]
+    )
+    if not tasks:
+        return
+
+    with marked_for_delete(
+        "drc_sync", "zios_marked_for_delete", [zio.uuid for zio in zios]
+    ), marked_for_delete(
+        "kcc_sync", "zcms_marked_for_delete", [zcm.uuid for zcm in zcms]
+    ), marked_for_delete(
+        "kcc_sync", "zvs_marked_for_delete", [zv.uuid for zv in zvs]
+    ):
+        if len(tasks) == 1:
+            sync_delete, relation = tasks[0]
+            sync_delete(relation)
+            return
+
+        workers = min(len(tasks), settings.REMOTE_UNLINK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(lambda task: _run_sync_delete(*task), tasks))
+
+    errors = [error for error in errors if error is not None]
+    if errors:
+        raise errors[0]
+
+
 @receiver(
     [post_save, pre_delete],
     sender=ZaakInformatieObject,
@@ -169,24 +297,16 @@ def sync_informatieobject_relation(
 ):
     signal = kwargs["signal"]
     if signal is post_save and kwargs.get("created", False):
-        sync_create_zio(instance)
+        if settings.DRC_SYNC_DEFERRED:
+            defer_sync_create_zio(instance)
+        else:
+            sync_create_zio(instance)
     elif signal is pre_delete:
         # Add the uuid of the ZaakInformatieObject to the list of ZIOs that are
         # marked for delete, causing them not to show up when performing
         # GET requests on the ZRC, allowing the validation in the DRC to pass
-        cache = caches["drc_sync"]
-        marked_zios = cache.get("zios_marked_for_delete")
-        if marked_zios:
-            cache.set("zios_marked_for_delete", marked_zios + [instance.uuid])
-        else:
-            cache.set("zios_marked_for_delete", [instance.uuid])
-
-        try:
+        with marked_for_delete("drc_sync", "zios_marked_for_delete", [instance.uuid]):
             sync_delete_zio(instance)
-        finally:
-            marked_zios = cache.get("zios_marked_for_delete")
-            marked_zios.remove(instance.uuid)
-            cache.set("zios_marked_for_delete", marked_zios)
 
 
 @receiver(
@@ -199,19 +319,8 @@ def sync_contactmoment_relation(sender, instance: ZaakContactMoment = None, **kw
     if signal is post_save and not instance._objectcontactmoment:
         sync_create_zaakcontactmoment(instance)
     elif signal is pre_delete and instance._objectcontactmoment:
-        cache = caches["kcc_sync"]
-        marked_zcms = cache.get("zcms_marked_for_delete")
-        if marked_zcms:
-            cache.set("zcms_marked_for_delete", marked_zcms + [instance.uuid])
-        else:
-            cache.set("zcms_marked_for_delete", [instance.uuid])
-
-        try:
+        with marked_for_delete("kcc_sync", "zcms_marked_for_delete", [instance.uuid]):
             sync_delete_zaakcontactmoment(instance)
-        finally:
-            marked_zcms = cache.get("zcms_marked_for_delete")
-            marked_zcms.remove(instance.uuid)
-            cache.set("zcms_marked_for_delete", marked_zcms)
 
 
 @receiver(
@@ -224,16 +333,5 @@ def sync_verzoek_relation(sender, instance: ZaakVerzoek = None, **kwargs):
     if signal is post_save and not instance._objectverzoek:
         sync_create_zaakverzoek(instance)
     elif signal is pre_delete and instance._objectverzoek:
-        cache = caches["kcc_sync"]
-        marked_zvs = cache.get("zvs_marked_for_delete")
-        if marked_zvs:
-            cache.set("zvs_marked_for_delete", marked_zvs + [instance.uuid])
-        else:
-            cache.set("zvs_marked_for_delete", [instance.uuid])
-
-        try:
+        with marked_for_delete("kcc_sync", "zvs_marked_for_delete", [instance.uuid]):
             sync_delete_zaakverzoek(instance)
-        finally:
-            marked_zvs = cache.get("zvs_marked_for_delete")
-            marked_zvs.remove(instance.uuid)
-            cache.set("zvs_marked_for_delete", marked_zvs)
@@ -0,0 +1,38 @@
+"""
+Test runner clearing the in-process caches before every test.
+
+The caches of :mod:`zrc.utils.auth` are cleared by the signals of the cached
+models, but not when the transaction of a test is rolled back. Rows created
+by one test would otherwise still be used by the next ones.
+"""
+import unittest
+
+from django.test import runner
+
+from zrc.utils.auth import clear_cache
+
+
+class ClearCachesMixin:
+    def startTest(self, test):
+        clear_cache()
+        super().startTest(test)
+
+
+class RemoteTestResult(ClearCachesMixin, runner.RemoteTestResult):
+    pass
+
+
+class RemoteTestRunner(runner.RemoteTestRunner):
+    resultclass = RemoteTestResult
+
+
+class ParallelTestSuite(runner.ParallelTestSuite):
+    runner_class = RemoteTestRunner
+
+
+class TestRunner(runner.DiscoverRunner):
+    parallel_test_suite = ParallelTestSuite
+
+    def get_resultclass(self):
+        resultclass = super().get_resultclass() or unittest.TextTestResult
+        return type("TestResult", (ClearCachesMixin, resultclass), {})
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TransactionTestCase
+
+
+class HealthCheckTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+
+        patcher = patch.dict(
+            connection.settings_dict, {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        connection.ensure_connection()
+        # as at the start of the next request
+        connection.close_if_unusable_or_obsolete()
+
+    def test_reconnect_unusable_connection(self):
+        old_connection = connection.connection
+
+        with patch.object(connection, "is_usable", return_value=False):
+            connection.ensure_connection()
+
+        self.assertIsNotNone(connection.connection)
+        self.assertIsNot(connection.connection, old_connection)
+
+    def test_usable_connection_checked_once(self):
+        old_connection = connection.connection
+
+        with patch.object(connection, "is_usable", return_value=True) as is_usable:
+            connection.ensure_connection()
+            connection.ensure_connection()
+
+        self.assertIs(connection.connection, old_connection)
+        is_usable.assert_called_once_with()
+
+    def test_disabled(self):
+        connection.settings_dict["CONN_HEALTH_CHECKS"] = False
+
+        with patch.object(connection, "is_usable") as is_usable:
+            connection.ensure_connection()
+
+        is_usable.assert_not_called()
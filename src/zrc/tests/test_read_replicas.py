@@ -0,0 +1,159 @@
+"""
+Test the routing of reads to the read replicas, with a second database as
+replica.
+"""
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import OperationalError, connections
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import (
+    JWTAuthMixin,
+    generate_jwt_auth,
+    get_operation_url,
+    reverse,
+)
+from zds_client.tests.mocks import mock_client
+
+from zrc import db_router
+from zrc.datamodel.models import Zaak, ZaakInformatieObject
+from zrc.datamodel.tests.factories import RolFactory, ZaakFactory
+from zrc.sync.signals import SyncError
+
+from .utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
+
+ZAAKTYPE = "https://example.com/ztc/api/v1/zaaktypen/1"
+INFORMATIEOBJECT = "https://example.com/drc/api/v1/enkelvoudiginformatieobjecten/1"
+INFORMATIEOBJECTTYPE = "https://example.com/ztc/api/v1/informatieobjecttypen/1"
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReadReplicaTests(JWTAuthMixin, APITestCase):
+    databases = {"default", "replica"}
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls._create_credentials(
+            "drc",
+            "drc-secret",
+            heeft_alle_autorisaties=True,
+            max_vertrouwelijkheidaanduiding=cls.max_vertrouwelijkheidaanduiding,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        for obj in [*JWTSecret.objects.all(), *Applicatie.objects.all()]:
+            obj.save(using="replica")
+
+        # the replica lags behind
+        self.zaak = ZaakFactory.create(omschrijving="primary", zaaktype=ZAAKTYPE)
+        replicated = Zaak.objects.get(pk=self.zaak.pk)
+        replicated.omschrijving = "replica"
+        Zaak.objects.using("replica").bulk_create([replicated])
+
+        self.addCleanup(cache.clear)
+        self.addCleanup(db_router._unavailable.clear)
+
+    def get_omschrijving(self, **headers) -> str:
+        response = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["omschrijving"]
+
+    def test_read_from_replica(self):
+        self.assertEqual(self.get_omschrijving(), "replica")
+
+    def test_search_from_replica(self):
+        response = self.client.post(
+            get_operation_url("zaak__zoek"),
+            {"uuid__in": [self.zaak.uuid]},
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"][0]["omschrijving"], "replica")
+
+    def test_read_primary_header(self):
+        self.assertEqual(self.get_omschrijving(HTTP_X_READ_PRIMARY="1"), "primary")
+
+    def test_sticky_after_write(self):
+        rol = RolFactory.create(zaak=self.zaak)
+
+        response = self.client.delete(reverse(rol))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get_omschrijving(), "primary")
+
+    def test_sticky_per_client(self):
+        db_router.record_write("other-client")
+
+        self.assertEqual(self.get_omschrijving(), "replica")
+
+    def test_unavailable_replica(self):
+        with patch.object(
+            connections["replica"], "ensure_connection", side_effect=OperationalError
+        ):
+            self.assertEqual(self.get_omschrijving(), "primary")
+
+        # skipped until it is retried
+        self.assertEqual(self.get_omschrijving(), "primary")
+
+        db_router._unavailable.clear()
+        self.assertEqual(self.get_omschrijving(), "replica")
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self):
+        self.assertEqual(self.get_omschrijving(), "primary")
+
+    @override_settings(
+        LINK_FETCHER="vng_api_common.mocks.link_fetcher_200",
+        ZDS_CLIENT_CLASS="vng_api_common.mocks.MockClient",
+    )
+    @patch("vng_api_common.validators.fetcher")
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    def test_create_zaakinformatieobject(self, *mocks):
+        zaak_url = f"http://testserver{reverse(self.zaak)}"
+        drc_client = APIClient()
+        drc_client.credentials(
+            HTTP_AUTHORIZATION=generate_jwt_auth("drc", "drc-secret")
+        )
+
+        def drc_create_relation(relation):
+            # the DRC validates the relation with its own client ID
+            response = drc_client.get(
+                reverse(ZaakInformatieObject),
+                {"zaak": zaak_url, "informatieobject": INFORMATIEOBJECT},
+            )
+            if response.status_code != status.HTTP_200_OK or not response.json():
+                raise SyncError("Could not create remote relation")
+
+        responses = {
+            INFORMATIEOBJECT: {
+                "url": INFORMATIEOBJECT,
+                "informatieobjecttype": INFORMATIEOBJECTTYPE,
+            },
+            ZAAKTYPE: {
+                "url": ZAAKTYPE,
+                "informatieobjecttypen": [INFORMATIEOBJECTTYPE],
+            },
+        }
+
+        with patch(
+            "zrc.sync.signals.sync_create_zio", side_effect=drc_create_relation
+        ) as sync_create_zio, mock_client(responses):
+            response = self.client.post(
+                reverse(ZaakInformatieObject),
+                {"zaak": zaak_url, "informatieobject": INFORMATIEOBJECT},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        sync_create_zio.assert_called_once()
+        self.assertTrue(ZaakInformatieObject.objects.exists())
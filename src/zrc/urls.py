@@ -7,6 +7,8 @@ from django.views.generic.base import TemplateView
 
 from vng_api_common.views import ViewConfigView
 
+from zrc.utils.views import connection_pools
+
 handler500 = "zrc.utils.views.server_error"
 
 urlpatterns = [
@@ -15,6 +17,7 @@ urlpatterns = [
     # Simply show the master template.
     path("", TemplateView.as_view(template_name="index.html")),
     path("view-config/", ViewConfigView.as_view(), name="view-config"),
+    path("connection-pools/", connection_pools, name="connection-pools"),
     path("ref/", include("vng_api_common.urls")),
     path("ref/", include("vng_api_common.notifications.urls")),
 ]
@@ -6,3 +6,4 @@ class UtilsConfig(AppConfig):
 
     def ready(self):
         from . import checks  # noqa
+        from . import signals  # noqa
@@ -0,0 +1,110 @@
+"""
+Cached credentials for the other APIs.
+
+:meth:`vng_api_common.models.APICredential.get_auth` queries the database and
+signs a new JWT for every remote request. The credentials are kept in memory
+per scheme and domain instead, and the signed tokens are reused until
+shortly before their configured lifetime ends. Changing the credentials (in
+the admin) clears the cache of the process, other processes pick up the
+change after ``API_CREDENTIAL_CACHE_TIMEOUT``.
+"""
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from django.conf import settings
+from django.db.models.functions import Length
+
+from vng_api_common.models import APICredential
+from zds_client import ClientAuth
+
+# re-sign a token this many seconds before its lifetime ends
+TOKEN_RENEW_MARGIN = 30
+
+_credentials: Dict[str, Tuple[float, List[APICredential]]] = {}
+_auths: Dict[tuple, "CachedClientAuth"] = {}
+_lock = threading.Lock()
+
+
+class CachedClientAuth(ClientAuth):
+    """
+    :class:`zds_client.ClientAuth` reusing its signed JWT.
+    """
+
+    _renew_at = 0
+
+    def credentials(self) -> dict:
+        now = time.time()
+        if self._renew_at <= now:
+            self.__dict__.pop("_credentials", None)
+            lifetime = settings.ZDS_CLIENT_TOKEN_LIFETIME
+            self._renew_at = now + max(lifetime - TOKEN_RENEW_MARGIN, 0)
+        return super().credentials()
+
+
+def _get_candidates(scheme_and_domain: str) -> List[APICredential]:
+    cached = _credentials.get(scheme_and_domain)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    candidates = list(
+        APICredential.objects.filter(api_root__startswith=scheme_and_domain)
+        .annotate(api_root_length=Length("api_root"))
+        .order_by("-api_root_length")
+    )
+    expires = time.monotonic() + settings.API_CREDENTIAL_CACHE_TIMEOUT
+    _credentials[scheme_and_domain] = (expires, candidates)
+    return candidates
+
+
+def get_credentials(url: str) -> Optional[APICredential]:
+    """
+    Return the credentials with the longest API root matching the URL.
+    """
+    split_url = urlsplit(url)
+    scheme_and_domain = urlunsplit(split_url[:2] + ("", "", ""))
+
+    for candidate in _get_candidates(scheme_and_domain):
+        if url.startswith(candidate.api_root):
+            return candidate
+    return None
+
+
+def get_auth(url: str, **claims) -> Optional[ClientAuth]:
+    """
+    Cached equivalent of :meth:`vng_api_common.models.APICredential.get_auth`.
+    """
+    credentials = get_credentials(url)
+    if credentials is None:
+        return None
+
+    key = (
+        credentials.api_root,
+        credentials.client_id,
+        credentials.secret,
+        credentials.user_id,
+        credentials.user_representation,
+        json.dumps(claims, sort_keys=True),
+    )
+    auth = _auths.get(key)
+    if auth is None:
+        with _lock:
+            auth = _auths.setdefault(
+                key,
+                CachedClientAuth(
+                    client_id=credentials.client_id,
+                    secret=credentials.secret,
+                    user_id=credentials.user_id,
+                    user_representation=credentials.user_representation,
+                    **claims,
+                ),
+            )
+    return auth
+
+
+def clear_cache() -> None:
+    with _lock:
+        _credentials.clear()
+        _auths.clear()
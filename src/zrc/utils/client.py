@@ -0,0 +1,177 @@
+"""
+ZDS clients sharing HTTP connections per API root.
+
+:class:`zds_client.Client` performs every request through
+:func:`requests.request`, which sets up a new TCP/TLS connection each time.
+:class:`PooledClient` uses a process-wide :class:`requests.Session` per API
+root instead, keeping the connections alive between requests and threads.
+Cookies are not stored by these sessions.
+"""
+import copy
+import logging
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+import requests
+import zds_client
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from zds_client.client import ClientError, get_headers
+
+from .auth import get_auth
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(api_root: str) -> requests.Session:
+    """
+    Return the shared session for the API root, creating it if needed.
+    """
+    session = _sessions.get(api_root)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        if api_root not in _sessions:
+            session = requests.Session()
+            # the session is shared by all threads and credentials, so only
+            # the connections are reused and never the cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=settings.ZDS_CLIENT_POOL_SIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[api_root] = session
+        return _sessions[api_root]
+
+
+def get_pool_stats() -> List[dict]:
+    """
+    Report the connection reuse of the shared sessions in this process.
+
+    Every request that did not need a new connection reused one.
+    """
+    stats = []
+    for api_root, session in list(_sessions.items()):
+        pools = session.get_adapter(api_root).poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.append(
+                {
+                    "pid": os.getpid(),
+                    "api_root": api_root,
+                    "host": pool.host,
+                    "connections": pool.num_connections,
+                    "requests": pool.num_requests,
+                    "reused": max(pool.num_requests - pool.num_connections, 0),
+                }
+            )
+    return stats
+
+
+def close_sessions() -> None:
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+class PooledClient(zds_client.Client):
+    """
+    :class:`zds_client.Client` using the shared session of its API root.
+    """
+
+    @property
+    def session(self) -> requests.Session:
+        return get_session(self._config.base_url)
+
+    def request(
+        self,
+        path: str,
+        operation: str,
+        method="GET",
+        expected_status=200,
+        request_kwargs: Optional[dict] = None,
+        **kwargs,
+    ):
+        # identical to zds_client.Client.request, apart from the session
+        url = urljoin(self.base_url, path)
+
+        if request_kwargs:
+            kwargs.update(request_kwargs)
+
+        headers = CaseInsensitiveDict(kwargs.pop("headers", {}))
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        schema_headers = get_headers(self.schema, operation)
+        for header, value in schema_headers.items():
+            headers.setdefault(header, value)
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = self.session.request(method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            dict(headers),
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
+
+
+def get_client(
+    url: str, scopes: Optional[List[str]] = None
+) -> Optional[zds_client.Client]:
+    """
+    Return a client of ``settings.ZDS_CLIENT_CLASS`` for the URL, with the
+    configured credentials.
+
+    :return: ``None`` if no API is configured for the URL
+    """
+    Client = import_string(settings.ZDS_CLIENT_CLASS)
+    client = Client.from_url(url)
+    if client is None:
+        return None
+    if scopes is None:
+        client.auth = get_auth(url)
+    else:
+        client.auth = get_auth(url, scopes=scopes)
+    return client
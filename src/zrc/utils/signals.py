@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.models import APICredential
+
+from .auth import clear_cache
+
+
+@receiver([post_save, post_delete], sender=APICredential)
+def clear_credentials_cache(sender, **kwargs):
+    clear_cache()
@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from freezegun import freeze_time
+from vng_api_common.models import APICredential
+
+from zrc.tests.runner import TestRunner
+
+from ..auth import _credentials, clear_cache, get_auth
+
+ZAAKTYPE = "https://ztc.nl/api/v1/zaaktypen/d66790b7-8b01-4005-a4ba-8fcf2a60f21d"
+
+
+@override_settings(ZDS_CLIENT_TOKEN_LIFETIME=300, API_CREDENTIAL_CACHE_TIMEOUT=60)
+class CachedAuthTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        clear_cache()
+        self.addCleanup(clear_cache)
+
+        self.credential = APICredential.objects.create(
+            api_root="https://ztc.nl/api/v1/",
+            client_id="zrc",
+            secret="secret",
+            user_id="zrc",
+        )
+
+    def test_credentials_cached(self):
+        auth = get_auth(ZAAKTYPE, scopes=["zds.scopes.zaaktypes.lezen"])
+
+        with self.assertNumQueries(0):
+            cached = get_auth(ZAAKTYPE, scopes=["zds.scopes.zaaktypes.lezen"])
+
+        self.assertIs(cached, auth)
+        self.assertIsNone(get_auth("https://other.nl/api/v1/zaaktypen/1234"))
+
+    def test_token_reused_until_lifetime_ends(self):
+        auth = get_auth(ZAAKTYPE)
+
+        with freeze_time("2020-01-01 12:00:00"):
+            token = auth.credentials()
+        with freeze_time("2020-01-01 12:04:00"):
+            self.assertEqual(auth.credentials(), token)
+        with freeze_time("2020-01-01 12:04:40"):
+            self.assertNotEqual(auth.credentials(), token)
+
+    def test_change_clears_cache(self):
+        auth = get_auth(ZAAKTYPE)
+
+        self.credential.secret = "other-secret"
+        self.credential.save()
+
+        new_auth = get_auth(ZAAKTYPE)
+        self.assertIsNot(new_auth, auth)
+        self.assertEqual(new_auth.secret, "other-secret")
+
+        self.credential.delete()
+
+        self.assertIsNone(get_auth(ZAAKTYPE))
+
+
+class TestRunnerTests(SimpleTestCase):
+    def test_cache_cleared_before_every_test(self):
+        # as left behind by a rolled back test
+        _credentials["https://ztc.nl"] = (float("inf"), [])
+        self.addCleanup(clear_cache)
+        result = TestRunner().get_resultclass()(None, False, 0)
+
+        result.startTest(self)
+
+        self.assertEqual(_credentials, {})
@@ -0,0 +1,55 @@
+from http.client import parse_headers
+from io import BytesIO
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+import requests
+import requests_mock
+from requests.cookies import extract_cookies_to_jar
+
+from ..client import PooledClient, close_sessions, get_session
+
+ZAAKTYPE = "https://ztc.nl/api/v1/zaaktypen/d66790b7-8b01-4005-a4ba-8fcf2a60f21d"
+
+
+@override_settings(ZDS_CLIENT_CLASS="zrc.utils.client.PooledClient")
+class PooledClientTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(close_sessions)
+
+    def test_session_shared_per_api_root(self):
+        client1 = PooledClient.from_url(ZAAKTYPE)
+        client2 = PooledClient.from_url(f"{ZAAKTYPE}/")
+        other = PooledClient.from_url(
+            "https://drc.nl/api/v1/enkelvoudiginformatieobjecten/1234"
+        )
+
+        self.assertIs(client1.session, client2.session)
+        self.assertIs(client1.session, get_session("https://ztc.nl"))
+        self.assertIsNot(client1.session, other.session)
+
+    def test_request_uses_shared_session(self):
+        client = PooledClient.from_url(ZAAKTYPE)
+        client._schema = {"paths": {}}
+
+        # only requests through the shared session are mocked
+        adapter = requests_mock.Adapter()
+        adapter.register_uri("GET", ZAAKTYPE, json={"url": ZAAKTYPE})
+        get_session("https://ztc.nl").mount("https://", adapter)
+
+        response = client.retrieve("zaaktype", url=ZAAKTYPE)
+
+        self.assertEqual(response, {"url": ZAAKTYPE})
+        self.assertEqual(adapter.last_request.headers["Accept"], "application/json")
+
+    def test_cookies_not_stored(self):
+        session = get_session("https://ztc.nl")
+        request = requests.Request("GET", ZAAKTYPE).prepare()
+        headers = parse_headers(BytesIO(b"Set-Cookie: sessionid=1; Path=/\r\n\r\n"))
+        response = SimpleNamespace(_original_response=SimpleNamespace(msg=headers))
+
+        extract_cookies_to_jar(session.cookies, request, response)
+
+        self.assertEqual(len(session.cookies), 0)
@@ -1,8 +1,11 @@
 from django import http
+from django.contrib.admin.views.decorators import staff_member_required
 from django.template import TemplateDoesNotExist, loader
 from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME
 
+from .client import get_pool_stats
+
 
 @requires_csrf_token
 def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
@@ -23,3 +26,11 @@ def server_error(request, template_name=ERROR_500_TEMPLATE_NAME):
         )
     context = {"request": request}
     return http.HttpResponseServerError(template.render(context))
+
+
+@staff_member_required
+def connection_pools(request):
+    """
+    Report the reuse of the HTTP connections to other APIs by this process.
+    """
+    return http.JsonResponse({"pools": get_pool_stats()})